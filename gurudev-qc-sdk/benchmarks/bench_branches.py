@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: árvore de ramos vs. simulação por shot
+
+Compara, para um circuito com medições no meio do circuito e portas
+condicionais, a execução em árvore de ramos (prefixo comum simulado uma vez,
+shots divididos por amostras binomiais) com a reexecução do circuito inteiro
+para cada shot. Reporta o número de ramos, o tempo e a distância de variação
+total entre as distribuições obtidas e a distribuição exata.
+
+Uso:
+    python benchmarks/bench_branches.py --qubits 16 --measurements 3 --shots 256
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCCompiler, GurudevQCSimulator
+
+
+def branching_code(num_qubits, num_measurements, depth, rng):
+    """Gera um circuito com camadas aleatórias, medições e correções condicionais."""
+    lines = [f"qubits: {num_qubits}"]
+    for layer in range(num_measurements + 1):
+        for _ in range(depth):
+            for q in range(num_qubits):
+                lines.append(f"harmony {q}")
+                lines.append(f"rotate {q} {rng.uniform(0, 2 * np.pi):.6f}")
+            for q in range(num_qubits - 1):
+                lines.append(f"entangle {q} {q + 1}")
+        if layer < num_measurements:
+            lines.append(f"measure {layer} -> m{layer}")
+            lines.append(f"if m{layer} flip {num_qubits - 1}")
+    lines += [f"measure: {q}" for q in range(num_measurements, num_measurements + 2)]
+    return '\n'.join(lines)
+
+
+def total_variation(counts, probabilities, shots):
+    """Distância de variação total entre contagens e uma distribuição."""
+    keys = set(counts) | set(probabilities)
+    return 0.5 * sum(abs(counts.get(key, 0) / shots - probabilities.get(key, 0.0)) for key in keys)
+
+
+def main():
+    """Executa o benchmark e imprime tempos e distâncias."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--qubits', type=int, default=16)
+    parser.add_argument('--measurements', type=int, default=3)
+    parser.add_argument('--depth', type=int, default=2)
+    parser.add_argument('--shots', type=int, default=256)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    code = branching_code(args.qubits, args.measurements, args.depth, np.random.default_rng(args.seed))
+    circuit = GurudevQCCompiler().compile(code)
+    simulator = GurudevQCSimulator(seed=args.seed)
+    print(f"{args.qubits} qubits, {len(circuit['gates'])} portas, "
+          f"{args.measurements} medições no meio do circuito, {args.shots} shots\n")
+
+    start = time.perf_counter()
+    exact = simulator.run(circuit, exact=True)
+    exact_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    branched = simulator.run(circuit, shots=args.shots)
+    branch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive = Counter()
+    for _ in range(args.shots):
+        naive.update(simulator.run(circuit, shots=1)['measurement_counts'])
+    naive_time = time.perf_counter() - start
+
+    reference = exact['measurement_probabilities']
+    print(f"{'modo':<24} {'ramos':>7} {'tempo (s)':>10} {'TVD':>8}")
+    print(f"{'exato (todos os ramos)':<24} {exact['branches']:>7} {exact_time:>10.3f} {0.0:>8.3f}")
+    print(f"{'árvore de ramos':<24} {branched['branches']:>7} {branch_time:>10.3f} "
+          f"{total_variation(branched['measurement_counts'], reference, args.shots):>8.3f}")
+    print(f"{'simulação por shot':<24} {args.shots:>7} {naive_time:>10.3f} "
+          f"{total_variation(naive, reference, args.shots):>8.3f}")
+    print(f"\nAceleração: {naive_time / branch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequências de portas diagonais em uma passada
+
+Simula camadas de custo no estilo QAOA (termos ZZ como entangle-rotate-
+entangle e campos locais com rotate e phase em todos os qubits) aplicando
+as portas uma a uma e com as sequências diagonais reunidas pelo simulador
+(``kernels.apply_diagonal_run``), e reporta o número de portas aplicadas,
+o tempo de parede e a aceleração. O estado final dos dois modos é
+comparado.
+
+Uso:
+    python benchmarks/bench_diagonal.py --qubits 20 22 24 --layers 2
+    python benchmarks/bench_diagonal.py --qubits 24 --optimize 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCCompiler, GurudevQCSimulator
+from gurudev_qc import simulator as simulator_module
+
+
+def cost_layers(num_qubits, layers, rng):
+    """Gera camadas de custo em um anel de qubits, sem o misturador."""
+    lines = [f"qubits: {num_qubits}"] + [f"harmony {q}" for q in range(num_qubits)]
+    for _ in range(layers):
+        for q in range(num_qubits):
+            neighbor = (q + 1) % num_qubits
+            lines += [f"entangle {q} {neighbor}",
+                      f"rotate {neighbor} {rng.uniform(0, 2 * np.pi):.6f}",
+                      f"entangle {q} {neighbor}"]
+        lines += [f"rotate {q} {rng.uniform(0, 2 * np.pi):.6f}" for q in range(num_qubits)]
+        lines += [f"phase {q}" for q in range(0, num_qubits, 2)]
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def timed_simulation(circuit, merge):
+    """Simula o circuito e retorna (estado final, segundos)."""
+    simulator = GurudevQCSimulator(stabilizer_min_qubits=None, kernel='numpy')
+    run_min = simulator_module._DIAGONAL_RUN_MIN
+    if not merge:
+        simulator_module._DIAGONAL_RUN_MIN = float('inf')
+    try:
+        start = time.perf_counter()
+        state = simulator._simulate(circuit)
+        return state, time.perf_counter() - start
+    finally:
+        simulator_module._DIAGONAL_RUN_MIN = run_min
+
+
+def main():
+    """Executa o benchmark e imprime passadas e tempos de cada modo."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--qubits', type=int, nargs='+', default=[20, 22, 24])
+    parser.add_argument('--layers', type=int, default=2)
+    parser.add_argument('--optimize', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    compiler = GurudevQCCompiler()
+    print(f"{'qubits':>6} {'modo':<22} {'portas':>9} {'tempo (s)':>10} {'aceleração':>11}")
+    for num_qubits in args.qubits:
+        circuit = compiler.compile(cost_layers(num_qubits, args.layers, rng), optimize=args.optimize)
+        merged = GurudevQCSimulator()._merge_diagonal_runs(circuit['gates'])
+
+        reference, baseline = timed_simulation(circuit, merge=False)
+        print(f"{num_qubits:>6} {'porta a porta':<22} {len(circuit['gates']):>9} {baseline:>10.2f} {1:>10.2f}x")
+        state, elapsed = timed_simulation(circuit, merge=True)
+        match = '' if np.allclose(state, reference, atol=1e-10) else '  (estado diferente!)'
+        print(f"{num_qubits:>6} {'sequências diagonais':<22} {len(merged):>9} {elapsed:>10.2f} "
+              f"{baseline / elapsed:>10.2f}x{match}")
+        del state, reference
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: probabilidades exatas vs. amostragem
+
+Compara, para um circuito aleatório de n qubits com todos os qubits medidos,
+o tempo de ``run`` com amostragem, no modo exato (``shots=0``) e no modo exato
+com ``top_k``, e o tempo de ``get_state_probabilities`` contra o laço Python
+por amplitude usado anteriormente.
+
+Uso:
+    python benchmarks/bench_exact.py --qubits 20 --top-k 16
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCCompiler, GurudevQCSimulator
+
+
+def random_code(num_qubits, depth, rng):
+    """Gera um circuito aleatório com superposição em todos os qubits."""
+    lines = [f"qubits: {num_qubits}"]
+    lines += [f"harmony {q}" for q in range(num_qubits)]
+    for _ in range(depth):
+        for q in range(num_qubits):
+            lines.append(f"rotate {q} {rng.uniform(0, 2 * np.pi):.6f}")
+        for q in range(0, num_qubits - 1, 2):
+            lines.append(f"entangle {q} {q + 1}")
+        lines += [f"harmony {q}" for q in range(num_qubits)]
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def loop_probabilities(state):
+    """Implementação anterior de ``get_state_probabilities`` (laço Python)."""
+    probabilities = {}
+    num_qubits = int(np.log2(len(state)))
+    for i, amplitude in enumerate(state):
+        prob = abs(amplitude)**2
+        if prob > 1e-10:
+            probabilities[format(i, f'0{num_qubits}b')] = prob
+    return probabilities
+
+
+def timed(function, *args, **kwargs):
+    """Executa a função e retorna (resultado, segundos)."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Executa o benchmark e imprime os tempos de cada modo."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--qubits', type=int, default=20)
+    parser.add_argument('--depth', type=int, default=2)
+    parser.add_argument('--shots', type=int, default=1024)
+    parser.add_argument('--top-k', type=int, default=16)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    circuit = GurudevQCCompiler().compile(
+        random_code(args.qubits, args.depth, np.random.default_rng(args.seed))
+    )
+    simulator = GurudevQCSimulator(shots=args.shots, seed=args.seed)
+    state = simulator._simulate(circuit)
+
+    print(f"{args.qubits} qubits, {len(circuit['gates'])} portas, todos os qubits medidos\n")
+    print(f"{'modo':<34} {'tempo (s)':>10} {'resultados':>11}")
+
+    # Apenas a etapa de medição é cronometrada; o estado final é reutilizado
+    modes = (
+        (f'amostragem ({args.shots} shots)', {}),
+        ('exato (shots=0)', {'shots': 0}),
+        (f'exato, top_k={args.top_k}', {'shots': 0, 'top_k': args.top_k}),
+    )
+    for label, options in modes:
+        results, elapsed = timed(simulator._build_results, state, circuit, False, **options)
+        entries = results.get('measurement_probabilities', results['measurement_counts'])
+        print(f"{label:<34} {elapsed:>10.3f} {len(entries):>11}")
+
+    print()
+    vectorized, vectorized_time = timed(simulator.get_state_probabilities, state)
+    _, top_time = timed(simulator.get_state_probabilities, state, args.top_k)
+    looped, loop_time = timed(loop_probabilities, state)
+    print(f"{'get_state_probabilities (laço)':<34} {loop_time:>10.3f} {len(looped):>11}")
+    print(f"{'get_state_probabilities (vetorial)':<34} {vectorized_time:>10.3f} {len(vectorized):>11}")
+    print(f"{'get_state_probabilities (top_k)':<34} {top_time:>10.3f} {args.top_k:>11}")
+
+    deviation = max(abs(vectorized[key] - looped[key]) for key in looped)
+    print(f"\nAceleração: {loop_time / vectorized_time:.1f}x (desvio máximo {deviation:.1e})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: circuito compacto vs. lista de dicionários
+
+Compara, para circuitos com até um milhão de portas, a memória ocupada pelo
+circuito compilado e o tempo de despacho das portas no simulador entre o
+formato de lista de dicionários e o ``CompactCircuit``. Um número pequeno de
+qubits é usado para que o custo por porta seja dominado pelo despacho.
+
+Uso:
+    python benchmarks/bench_ir.py --gates 1000000 --qubits 4
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCCompiler, GurudevQCSimulator
+
+
+def random_code(num_qubits, num_gates, rng):
+    """Gera código Gurudev-QC aleatório com todas as operações da linguagem."""
+    lines = [f"qubits: {num_qubits}"]
+    ops = rng.integers(5, size=num_gates)
+    targets = rng.integers(num_qubits, size=num_gates)
+    angles = rng.uniform(0, 2 * np.pi, size=num_gates)
+
+    for op, target, angle in zip(ops.tolist(), targets.tolist(), angles.tolist()):
+        if op == 0:
+            lines.append(f"harmony {target}")
+        elif op == 1:
+            lines.append(f"flip {target}")
+        elif op == 2:
+            lines.append(f"phase {target}")
+        elif op == 3:
+            lines.append(f"rotate {target} {angle:.6f}")
+        else:
+            lines.append(f"entangle {target} {(target + 1) % num_qubits}")
+
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def measure_compile(compiler, code, compact):
+    """Compila o código e mede o tempo e a memória retida pelo circuito."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    circuit = compiler.compile(code, compact=compact)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return circuit, elapsed, retained, peak
+
+
+def main():
+    """Executa o benchmark e imprime memória e tempo de despacho."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--gates', type=int, default=1_000_000)
+    parser.add_argument('--qubits', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    code = random_code(args.qubits, args.gates, np.random.default_rng(args.seed))
+    compiler = GurudevQCCompiler()
+    simulator = GurudevQCSimulator(seed=args.seed)
+
+    print(f"{args.gates} portas, {args.qubits} qubits\n")
+    print(f"{'formato':<20} {'compilação (s)':>15} {'memória (MB)':>13} {'pico (MB)':>10} "
+          f"{'bytes/porta':>12} {'simulação (s)':>14} {'µs/porta':>9}")
+
+    states = []
+    for label, compact in (('lista de dicts', False), ('CompactCircuit', True)):
+        circuit, compile_time, retained, peak = measure_compile(compiler, code, compact)
+
+        start = time.perf_counter()
+        states.append(simulator._simulate(circuit))
+        run_time = time.perf_counter() - start
+
+        print(f"{label:<20} {compile_time:>15.2f} {retained / 2**20:>13.1f} {peak / 2**20:>10.1f} "
+              f"{retained / args.gates:>12.1f} {run_time:>14.2f} {run_time / args.gates * 1e6:>9.2f}")
+        del circuit
+
+    print(f"\nDesvio máximo entre estados: {np.max(np.abs(states[0] - states[1])):.1e}")
+
+
+if __name__ == "__main__":
+    main()
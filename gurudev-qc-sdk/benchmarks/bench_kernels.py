@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: kernels vetorizados vs. laços por amplitude
+
+Compara o tempo por porta dos kernels de ``gurudev_qc.kernels`` com a
+implementação original em laços Python (uma iteração por amplitude) para
+circuitos aleatórios de 10 a 26 qubits, reportando a maior diferença entre os
+vetores de estado produzidos. Portas com coeficientes reais (H, X, Y, Z, CNOT)
+produzem resultados idênticos bit a bit; em RZ a multiplicação complexa
+vetorizada do NumPy pode diferir do laço escalar no último bit.
+
+Uso:
+    python benchmarks/bench_kernels.py --min-qubits 10 --max-qubits 26
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCCompiler, GurudevQCSimulator
+
+
+def legacy_single_qubit_gate(state, target, gate_matrix, num_qubits):
+    """Aplica uma porta de um qubit com um laço por amplitude (referência)."""
+    new_state = np.zeros_like(state)
+
+    for i in range(2**num_qubits):
+        target_bit = (i >> target) & 1
+        index0 = i & ~(1 << target)
+        index1 = i | (1 << target)
+        new_state[i] += gate_matrix[target_bit, 0] * state[index0]
+        new_state[i] += gate_matrix[target_bit, 1] * state[index1]
+
+    return new_state
+
+
+def legacy_cnot_gate(state, control, target, num_qubits):
+    """Aplica uma CNOT com um laço por amplitude (referência)."""
+    new_state = state.copy()
+
+    for i in range(2**num_qubits):
+        if (i >> control) & 1:
+            new_state[i] = state[i ^ (1 << target)]
+
+    return new_state
+
+
+def random_circuit(num_qubits, num_gates, rng):
+    """Gera um circuito aleatório com as portas suportadas pelo compilador."""
+    gates = []
+    for _ in range(num_gates):
+        kind = rng.choice(['H', 'X', 'Y', 'Z', 'RZ', 'CNOT'])
+        target = int(rng.integers(num_qubits))
+        gate = {'gate': kind, 'target': target}
+        if kind == 'RZ':
+            gate['angle'] = float(rng.uniform(0, 2 * np.pi))
+        elif kind == 'CNOT':
+            control = int(rng.integers(num_qubits - 1))
+            gate['control'] = control if control < target else control + 1
+        gates.append(gate)
+    return {'qubits': num_qubits, 'gates': gates, 'measurements': []}
+
+
+def run_legacy(circuit, compiler):
+    """Simula o circuito com os laços de referência."""
+    num_qubits = circuit['qubits']
+    state = np.zeros(2**num_qubits, dtype=complex)
+    state[0] = 1.0
+
+    matrices = {
+        'H': compiler._hadamard_gate(),
+        'X': compiler._pauli_x_gate(),
+        'Y': compiler._pauli_y_gate(),
+        'Z': compiler._pauli_z_gate(),
+    }
+    for gate in circuit['gates']:
+        if gate['gate'] == 'CNOT':
+            state = legacy_cnot_gate(state, gate['control'], gate['target'], num_qubits)
+        elif gate['gate'] == 'RZ':
+            matrix = compiler._rotation_z_gate(gate['angle'])
+            state = legacy_single_qubit_gate(state, gate['target'], matrix, num_qubits)
+        else:
+            state = legacy_single_qubit_gate(state, gate['target'], matrices[gate['gate']], num_qubits)
+
+    return state
+
+
+def run_vectorized(circuit, simulator):
+    """Simula o circuito com os kernels vetorizados."""
+    num_qubits = circuit['qubits']
+    state = np.zeros(2**num_qubits, dtype=complex)
+    state[0] = 1.0
+
+    for gate in circuit['gates']:
+        state = simulator._apply_gate(state, gate, num_qubits)
+
+    return state
+
+
+def main():
+    """Executa o benchmark e imprime uma tabela de resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--min-qubits', type=int, default=10)
+    parser.add_argument('--max-qubits', type=int, default=26)
+    parser.add_argument('--gates', type=int, default=20, help='portas por circuito')
+    parser.add_argument('--legacy-max-qubits', type=int, default=16,
+                        help='maior número de qubits medido com os laços de referência')
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    compiler = GurudevQCCompiler()
+    simulator = GurudevQCSimulator()
+
+    print(f"{'qubits':>6} {'laço (ms/porta)':>16} {'vetorizado (ms/porta)':>22} {'speedup':>9} {'desvio máx.':>12}")
+    for num_qubits in range(args.min_qubits, args.max_qubits + 1):
+        circuit = random_circuit(num_qubits, args.gates, rng)
+
+        start = time.perf_counter()
+        vectorized_state = run_vectorized(circuit, simulator)
+        vectorized_time = (time.perf_counter() - start) / args.gates * 1e3
+
+        if num_qubits <= args.legacy_max_qubits:
+            start = time.perf_counter()
+            legacy_state = run_legacy(circuit, compiler)
+            legacy_time = (time.perf_counter() - start) / args.gates * 1e3
+            deviation = np.max(np.abs(legacy_state - vectorized_state))
+            print(f"{num_qubits:>6} {legacy_time:>16.3f} {vectorized_time:>22.3f} "
+                  f"{legacy_time / vectorized_time:>8.1f}x {deviation:>12.1e}")
+        else:
+            print(f"{num_qubits:>6} {'-':>16} {vectorized_time:>22.3f} {'-':>9} {'-':>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vetor de estado em memória vs. em arquivo mapeado (memmap)
+
+Executa o mesmo circuito aleatório com ``backend='memory'`` e
+``backend='memmap'`` e reporta o tempo por porta, o pico de memória alocada
+pelo Python/NumPy (``tracemalloc``, que não inclui as páginas do arquivo
+mapeado) e o pico de RSS do processo (``VmHWM``, que inclui as páginas do
+arquivo residentes na cache do sistema). Apenas ``--measured`` qubits são
+medidos, para que a distribuição marginal não domine o pico. Cada medição roda
+em um processo novo, para que os picos não se acumulem.
+
+Uso:
+    python benchmarks/bench_memmap.py --min-qubits 20 --max-qubits 26 --gates 50
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCSimulator
+
+
+def random_circuit(num_qubits, num_gates, num_measured, rng):
+    """Gera um circuito aleatório com todas as portas do compilador."""
+    gates = []
+    for _ in range(num_gates):
+        kind = rng.choice(['H', 'X', 'Y', 'Z', 'RZ', 'CNOT'])
+        target = int(rng.integers(num_qubits))
+        gate = {'gate': kind, 'target': target}
+        if kind == 'RZ':
+            gate['angle'] = float(rng.uniform(0, 2 * np.pi))
+        elif kind == 'CNOT':
+            gate['control'] = int((target + rng.integers(1, num_qubits)) % num_qubits)
+        gates.append(gate)
+    return {'qubits': num_qubits, 'gates': gates, 'measurements': list(range(min(num_measured, num_qubits)))}
+
+
+def peak_rss():
+    """Pico de RSS do processo atual, em bytes (Linux)."""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return float('nan')
+
+
+def measure(backend, circuit, memmap_dir):
+    """Simula o circuito em um backend e retorna (tempo, pico tracemalloc, pico RSS)."""
+    simulator = GurudevQCSimulator(shots=1024, seed=0, backend=backend, memmap_dir=memmap_dir)
+    tracemalloc.start()
+    start = time.perf_counter()
+    simulator.run(circuit)
+    elapsed = time.perf_counter() - start
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, traced_peak, peak_rss()
+
+
+def main():
+    """Executa o benchmark para cada número de qubits."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--min-qubits', type=int, default=20)
+    parser.add_argument('--max-qubits', type=int, default=26)
+    parser.add_argument('--gates', type=int, default=50)
+    parser.add_argument('--measured', type=int, default=8,
+                        help='Qubits medidos (a distribuição marginal ocupa 2**m probabilidades)')
+    parser.add_argument('--memmap-dir', default=None,
+                        help='Diretório dos arquivos de estado (padrão: temporário do sistema)')
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'qubits':>6} {'estado (MB)':>12} {'backend':>8} {'ms/porta':>10} "
+          f"{'pico heap (MB)':>15} {'pico RSS (MB)':>14}")
+
+    for num_qubits in range(args.min_qubits, args.max_qubits + 1):
+        circuit = random_circuit(num_qubits, args.gates, args.measured, rng)
+        state_mb = 16 * 2**num_qubits / 2**20
+
+        for backend in ('memory', 'memmap'):
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+                elapsed, traced_peak, rss = pool.submit(
+                    measure, backend, circuit, args.memmap_dir
+                ).result()
+            print(f"{num_qubits:>6} {state_mb:>12.0f} {backend:>8} {elapsed / args.gates * 1e3:>10.2f} "
+                  f"{traced_peak / 2**20:>15.1f} {rss / 2**20:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: trajetórias de ruído vetorizadas vs. laço sobre run
+
+Compara, para um circuito aleatório de n qubits com ruído despolarizante nas
+portas e erro de leitura, a simulação por trajetórias em lote (uma matriz
+trajetórias × 2**n, com os erros sorteados aplicados apenas às linhas
+afetadas) com um laço ingênuo que sorteia os erros de cada trajetória,
+insere as portas de Pauli correspondentes no circuito e chama ``run`` com um
+shot. Reporta trajetórias por segundo e, até 10 qubits, a distância de
+variação total até a distribuição exata da matriz densidade.
+
+Uso:
+    python benchmarks/bench_noise.py --qubits 8 --trajectories 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCCompiler, GurudevQCSimulator, NoiseModel
+
+# Portas de Pauli indexadas como em gurudev_qc.noise.PAULIS
+PAULI_GATES = (None, 'X', 'Y', 'Z')
+
+
+def random_code(num_qubits, depth, rng):
+    """Gera um circuito aleatório com todos os qubits medidos."""
+    lines = [f"qubits: {num_qubits}"]
+    for _ in range(depth):
+        for q in range(num_qubits):
+            lines.append(f"harmony {q}")
+            lines.append(f"rotate {q} {rng.uniform(0, 2 * np.pi):.6f}")
+        for q in range(num_qubits - 1):
+            lines.append(f"entangle {q} {q + 1}")
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def naive_trajectory(circuit, single_error, pair_error, readout_error, rng):
+    """Sorteia os erros de uma trajetória e retorna o circuito com as portas de Pauli inseridas."""
+    gates = []
+    for gate in circuit['gates']:
+        gates.append(gate)
+        if gate['gate'] == 'CNOT':
+            if rng.random() < pair_error:
+                pair = rng.integers(1, 16)
+                errors = ((gate['control'], pair // 4), (gate['target'], pair % 4))
+            else:
+                errors = ()
+        elif rng.random() < single_error:
+            errors = ((gate['target'], rng.integers(1, 4)),)
+        else:
+            errors = ()
+        gates += [{'gate': PAULI_GATES[pauli], 'target': int(qubit)} for qubit, pauli in errors if pauli]
+    return dict(circuit, gates=gates)
+
+
+def total_variation(counts, probabilities, shots):
+    """Distância de variação total entre contagens e uma distribuição."""
+    keys = set(counts) | set(probabilities)
+    return 0.5 * sum(abs(counts.get(key, 0) / shots - probabilities.get(key, 0.0)) for key in keys)
+
+
+def main():
+    """Executa o benchmark e imprime as taxas de cada método."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--qubits', type=int, default=8)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--trajectories', type=int, default=2000)
+    parser.add_argument('--naive-trajectories', type=int, default=200)
+    parser.add_argument('--error', type=float, default=0.01)
+    parser.add_argument('--readout-error', type=float, default=0.02)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    circuit = GurudevQCCompiler().compile(random_code(args.qubits, args.depth, rng))
+    model = (NoiseModel()
+             .add_depolarizing('harmony', args.error)
+             .add_depolarizing('rotate', args.error)
+             .add_depolarizing('entangle', 2 * args.error)
+             .set_readout_error(args.readout_error))
+    print(f"{args.qubits} qubits, {len(circuit['gates'])} portas, p={args.error}, "
+          f"leitura={args.readout_error}\n")
+
+    simulator = GurudevQCSimulator(seed=args.seed, noise_model=model)
+    start = time.perf_counter()
+    batched = simulator.run(circuit, shots=args.trajectories)
+    batched_time = time.perf_counter() - start
+
+    # O laço ingênuo simula o circuito ideal com os erros já inseridos
+    ideal = GurudevQCSimulator(seed=args.seed, stabilizer_min_qubits=None)
+    naive = Counter()
+    start = time.perf_counter()
+    for _ in range(args.naive_trajectories):
+        noisy = naive_trajectory(circuit, args.error, 2 * args.error, args.readout_error, rng)
+        bits = next(iter(ideal.run(noisy, shots=1)['measurement_counts']))
+        flips = rng.random(len(bits)) < args.readout_error
+        naive[''.join(str(int(bit) ^ int(flip)) for bit, flip in zip(bits, flips))] += 1
+    naive_time = time.perf_counter() - start
+
+    batched_rate = args.trajectories / batched_time
+    naive_rate = args.naive_trajectories / naive_time
+    print(f"{'método':<26} {'trajetórias':>12} {'tempo (s)':>10} {'traj/s':>10} {'TVD':>8}")
+
+    reference = None
+    if args.qubits <= 10:
+        exact_simulator = GurudevQCSimulator(noise_model=model, noise_method='density_matrix')
+        start = time.perf_counter()
+        reference = exact_simulator.run(circuit, exact=True)['measurement_probabilities']
+        exact_time = time.perf_counter() - start
+        print(f"{'matriz densidade (exato)':<26} {'-':>12} {exact_time:>10.3f} {'-':>10} {0.0:>8.3f}")
+
+    for label, counts, shots, elapsed, rate in (
+        ('trajetórias em lote', batched['measurement_counts'], args.trajectories, batched_time, batched_rate),
+        ('laço sobre run', naive, args.naive_trajectories, naive_time, naive_rate),
+    ):
+        distance = f"{total_variation(counts, reference, shots):>8.3f}" if reference else f"{'-':>8}"
+        print(f"{label:<26} {shots:>12} {elapsed:>10.3f} {rate:>10.0f} {distance}")
+
+    print(f"\nAceleração: {batched_rate / naive_rate:.1f}x em trajetórias por segundo")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark: kernels compilados multithread (Numba)
+
+Mede o tempo médio por porta de H, X, Y, Z, RZ, CNOT e das unitárias
+fundidas U (2x2) e U2 (4x4) nos kernels NumPy e nos kernels compilados de
+``gurudev_qc.numba_kernels`` com 1, 2, 4, 8, 16 ... threads, em um vetor de
+estado de 24 a 28 qubits, e reporta a aceleração em relação ao NumPy. Cada
+porta é aplicada em qubits baixos, médios e altos, e o resultado dos kernels
+compilados é comparado com o dos kernels NumPy.
+
+O número de threads é limitado pelo do Numba (``NUMBA_NUM_THREADS``,
+normalmente o número de núcleos da máquina).
+
+Uso:
+    python benchmarks/bench_numba.py --qubits 26 --threads 1 2 4 8 16
+    python benchmarks/bench_numba.py --qubits 28 --precision single
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import kernels
+from gurudev_qc.numba_kernels import NUMBA_AVAILABLE, NumbaKernels
+
+
+def gate_calls(num_qubits, rng):
+    """Retorna (nome, função(módulo, estado, qubit)) para cada tipo de porta."""
+    hadamard = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+    unitary = np.linalg.qr(rng.normal(size=(2, 2)) + 1j * rng.normal(size=(2, 2)))[0]
+    unitary4 = np.linalg.qr(rng.normal(size=(4, 4)) + 1j * rng.normal(size=(4, 4)))[0]
+    phase = np.exp(0.35j)
+    return [
+        ('H', lambda k, state, q: k.apply_single_qubit_gate(state, q, hadamard)),
+        ('X', lambda k, state, q: k.apply_pauli_x(state, q)),
+        ('Y', lambda k, state, q: k.apply_pauli_y(state, q)),
+        ('Z', lambda k, state, q: k.apply_pauli_z(state, q)),
+        ('RZ', lambda k, state, q: k.apply_diagonal_gate(state, q, np.conj(phase), phase)),
+        ('CNOT', lambda k, state, q: k.apply_cnot(state, (q + 1) % num_qubits, q)),
+        ('U', lambda k, state, q: k.apply_single_qubit_gate(state, q, unitary)),
+        ('U2', lambda k, state, q: k.apply_two_qubit_gate(state, q, (q + 1) % num_qubits, unitary4)),
+    ]
+
+
+def time_gate(module, call, state, targets, repeat):
+    """Retorna o tempo médio (segundos) de uma aplicação da porta."""
+    call(module, state, targets[0])  # aquecimento (e compilação do Numba)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for q in targets:
+            call(module, state, q)
+    return (time.perf_counter() - start) / (repeat * len(targets))
+
+
+def main():
+    """Executa o benchmark e imprime tempos e acelerações por porta e threads."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--qubits', type=int, default=26)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--repeat', type=int, default=2)
+    parser.add_argument('--precision', choices=('single', 'double'), default='double')
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    if not NUMBA_AVAILABLE:
+        print("Numba não instalado: os kernels compilados não estão disponíveis (pip install numba)")
+        return
+    import numba
+
+    available = numba.config.NUMBA_NUM_THREADS
+    threads = [t for t in args.threads if t <= available]
+    if len(threads) < len(args.threads):
+        print(f"Aviso: o Numba tem {available} threads; ignorando {sorted(set(args.threads) - set(threads))}")
+
+    rng = np.random.default_rng(args.seed)
+    dtype = np.complex64 if args.precision == 'single' else np.complex128
+    num_qubits = args.qubits
+    targets = [0, num_qubits // 2, num_qubits - 1]
+    state = (rng.normal(size=1 << num_qubits) + 1j * rng.normal(size=1 << num_qubits)).astype(dtype)
+    state /= np.linalg.norm(state)
+    check_qubits = 14
+    check = state[:1 << check_qubits] * np.sqrt(state.size >> check_qubits)
+    small_calls = dict(gate_calls(check_qubits, np.random.default_rng(args.seed)))
+    tolerance = 1e-4 if args.precision == 'single' else 1e-10
+    print(f"{num_qubits} qubits, {state.nbytes / 2**30:.2f} GB, {os.cpu_count()} CPUs, "
+          f"{available} threads do Numba\n")
+
+    header = f"{'porta':<6} {'numpy (ms)':>11}" + ''.join(f" {f'{t} thr (ms)':>12} {'acel.':>6}" for t in threads)
+    print(header)
+    for name, call in gate_calls(num_qubits, rng):
+        baseline = time_gate(kernels, call, state, targets, args.repeat)
+        row = f"{name:<6} {baseline * 1e3:>11.1f}"
+        for count in threads:
+            elapsed = time_gate(NumbaKernels(count), call, state, targets, args.repeat)
+            row += f" {elapsed * 1e3:>12.1f} {baseline / elapsed:>5.2f}x"
+
+        # Correção: mesmo resultado que o NumPy em um estado pequeno
+        expected, actual = check.copy(), check.copy()
+        for q in range(check_qubits):
+            small_calls[name](kernels, expected, q)
+            small_calls[name](NumbaKernels(min_size=1), actual, q)
+        if not np.allclose(expected, actual, atol=tolerance):
+            row += "  (resultado diferente!)"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
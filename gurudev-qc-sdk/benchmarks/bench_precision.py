@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: precisão simples (complex64) vs. dupla (complex128)
+
+Escala os circuitos de ``GurudevQCAlgorithms`` até o número de qubits pedido
+(o GHZ cresce diretamente; Bell, teletransporte e Deutsch-Jozsa são
+replicados em blocos de qubits disjuntos, repetidos ``--repeat`` vezes para
+aumentar a profundidade) e compara o tempo de simulação, a fidelidade
+|⟨ψ64|ψ128⟩|² e o desvio da norma reportado em ``norm_drift``.
+
+Uso:
+    python benchmarks/bench_precision.py --min-qubits 16 --max-qubits 28 --step 4
+    python benchmarks/bench_precision.py --max-qubits 28 --backend memmap
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCCompiler, GurudevQCSimulator, kernels
+from gurudev_qc.algorithms import GurudevQCAlgorithms
+
+
+def tiled(circuit, num_qubits, repeat):
+    """Replica o circuito em blocos de qubits disjuntos até ``num_qubits``."""
+    width = circuit['qubits']
+    gates = []
+    for _ in range(repeat):
+        for offset in range(0, num_qubits - width + 1, width):
+            for gate in circuit['gates']:
+                shifted = dict(gate, target=gate['target'] + offset)
+                if 'control' in gate:
+                    shifted['control'] = gate['control'] + offset
+                gates.append(shifted)
+    return {'qubits': num_qubits, 'gates': gates, 'measurements': list(circuit['measurements'])}
+
+
+def scaled_circuits(compiler, num_qubits, repeat):
+    """Circuitos de ``GurudevQCAlgorithms`` escalados para ``num_qubits`` qubits."""
+    algorithms = GurudevQCAlgorithms()
+    ghz = compiler.compile(algorithms.ghz_state(num_qubits))
+    ghz['gates'] = ghz['gates'] * repeat
+    circuits = {'ghz': ghz}
+    for name in ('bell_state', 'quantum_teleportation', 'deutsch_jozsa'):
+        circuits[name] = tiled(compiler.compile(getattr(algorithms, name)()), num_qubits, repeat)
+    return circuits
+
+
+def fidelity(single, double):
+    """Calcula |⟨ψ64|ψ128⟩|² em blocos, acumulando em precisão dupla."""
+    overlap = 0j
+    for start in range(0, double.size, kernels.BLOCK_SIZE):
+        stop = start + kernels.BLOCK_SIZE
+        overlap += np.vdot(single[start:stop].astype(np.complex128), double[start:stop])
+    return abs(overlap)**2
+
+
+def main():
+    """Executa o benchmark e imprime tempo, fidelidade e desvio da norma."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--min-qubits', type=int, default=16)
+    parser.add_argument('--max-qubits', type=int, default=24)
+    parser.add_argument('--step', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--backend', choices=['memory', 'memmap'], default='memory')
+    args = parser.parse_args()
+
+    compiler = GurudevQCCompiler()
+    simulators = {
+        precision: GurudevQCSimulator(seed=0, backend=args.backend, precision=precision)
+        for precision in ('double', 'single')
+    }
+
+    print(f"{'qubits':>6} {'circuito':<22} {'portas':>7} {'t128 (s)':>9} {'t64 (s)':>8} "
+          f"{'speedup':>8} {'fidelidade':>12} {'drift 64':>10}")
+
+    for num_qubits in range(args.min_qubits, args.max_qubits + 1, args.step):
+        for name, circuit in scaled_circuits(compiler, num_qubits, args.repeat).items():
+            times, states, drift = {}, {}, None
+            for precision, simulator in simulators.items():
+                start = time.perf_counter()
+                results = simulator.run(circuit)
+                times[precision] = time.perf_counter() - start
+                states[precision] = results['final_state']
+                if precision == 'single':
+                    drift = results['norm_drift']
+                del results
+                if precision == 'double' and args.backend == 'memory' and num_qubits >= 27:
+                    # Não cabem os dois estados em memória: compara só o tempo
+                    states.pop('double')
+
+            value = fidelity(states['single'], states['double']) if 'double' in states else float('nan')
+            print(f"{num_qubits:>6} {name:<22} {len(circuit['gates']):>7} {times['double']:>9.3f} "
+                  f"{times['single']:>8.3f} {times['double'] / times['single']:>7.2f}x "
+                  f"{value:>12.9f} {drift:>10.1e}")
+            states.clear()
+
+
+if __name__ == "__main__":
+    main()
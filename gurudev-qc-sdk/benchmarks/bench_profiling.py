@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: custo da instrumentação do simulador
+
+Mede o tempo de ``run`` sem profiler (o caminho normal), comparado ao mesmo
+trabalho chamado diretamente (``_simulate`` seguido de ``_build_results``,
+sem nenhuma verificação de fase), e com um profiler ativo, com e sem
+rastreamento de memória. Usa circuitos pequenos com muitas portas, em que o
+custo fixo por porta e por execução é mais visível.
+
+Uso:
+    python benchmarks/bench_profiling.py --qubits 8 --gates 2000 --repeat 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCCompiler, GurudevQCSimulator
+
+
+def random_code(num_qubits, num_gates, rng):
+    """Gera um circuito aleatório com o número de portas pedido."""
+    lines = [f"qubits: {num_qubits}"]
+    for _ in range(num_gates):
+        q = int(rng.integers(num_qubits))
+        kind = rng.integers(3)
+        if kind == 0:
+            lines.append(f"harmony {q}")
+        elif kind == 1:
+            lines.append(f"rotate {q} {rng.uniform(0, 2 * np.pi):.6f}")
+        else:
+            lines.append(f"entangle {q} {(q + 1) % num_qubits}")
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def best_time(function, repeat):
+    """Menor tempo entre ``repeat`` execuções da função."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Executa o benchmark e imprime o custo relativo de cada modo."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--qubits', type=int, default=8)
+    parser.add_argument('--gates', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    circuit = GurudevQCCompiler().compile(
+        random_code(args.qubits, args.gates, np.random.default_rng(args.seed))
+    )
+    simulator = GurudevQCSimulator(seed=args.seed, stabilizer_min_qubits=None)
+    print(f"{args.qubits} qubits, {len(circuit['gates'])} portas, melhor de {args.repeat}\n")
+
+    direct = best_time(lambda: simulator._build_results(simulator._simulate(circuit), circuit, False),
+                       args.repeat)
+    disabled = best_time(lambda: simulator.run(circuit), args.repeat)
+    with simulator.profile():
+        enabled = best_time(lambda: simulator.run(circuit), args.repeat)
+    with simulator.profile(track_memory=True):
+        tracked = best_time(lambda: simulator.run(circuit), args.repeat)
+
+    print(f"{'modo':<34} {'tempo (ms)':>11} {'custo':>9}")
+    for label, elapsed in (
+        ('chamada direta (referência)', direct),
+        ('run sem profiler', disabled),
+        ('run com profiler', enabled),
+        ('run com profiler e memória', tracked),
+    ):
+        print(f"{label:<34} {elapsed * 1e3:>11.3f} {(elapsed / direct - 1) * 100:>8.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark: exportação e importação de OpenQASM 2.0
+
+Gera um circuito aleatório com milhões de portas e mede o tempo e o pico de
+memória Python (``tracemalloc``, em uma execução separada) de:
+
+    - exportação por concatenação de strings, porta a porta (referência,
+      como a implementação anterior de ``export_qasm``)
+    - ``export_qasm`` (texto em memória) e ``write_qasm`` (arquivo, em blocos)
+    - ``import_qasm`` do texto e leitura em fluxo do arquivo com
+      ``stream_qasm``, que não mantém o programa nem a lista de portas
+
+Uso:
+    python benchmarks/bench_qasm.py --gates 1000000 --qubits 16
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCCompiler
+
+
+def random_code(num_qubits, num_gates, rng):
+    """Gera um circuito aleatório com portas H, X, Z, RZ e CNOT e todos os qubits medidos."""
+    names = ['harmony', 'flip', 'phase', 'rotate', 'entangle']
+    ops = rng.integers(len(names), size=num_gates).tolist()
+    targets = rng.integers(num_qubits, size=num_gates).tolist()
+    angles = rng.uniform(0, 2 * np.pi, size=num_gates).tolist()
+    lines = [f"qubits: {num_qubits}"]
+    for op, target, angle in zip(ops, targets, angles):
+        if op == 3:
+            lines.append(f"rotate {target} {angle}")
+        elif op == 4:
+            lines.append(f"entangle {target} {(target + 1) % num_qubits}")
+        else:
+            lines.append(f"{names[op]} {target}")
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def concatenated_export(circuit):
+    """Exportação de referência: uma concatenação e uma cadeia de if/elif por porta."""
+    qasm_code = "OPENQASM 2.0;\ninclude \"qelib1.inc\";\n"
+    qasm_code += f"qreg q[{circuit['qubits']}];\n"
+    qasm_code += f"creg c[{len(circuit['measurements'])}];\n\n"
+    for gate in circuit['gates']:
+        if gate['gate'] == 'H':
+            qasm_code += f"h q[{gate['target']}];\n"
+        elif gate['gate'] == 'X':
+            qasm_code += f"x q[{gate['target']}];\n"
+        elif gate['gate'] == 'Y':
+            qasm_code += f"y q[{gate['target']}];\n"
+        elif gate['gate'] == 'Z':
+            qasm_code += f"z q[{gate['target']}];\n"
+        elif gate['gate'] == 'CNOT':
+            qasm_code += f"cx q[{gate['control']}],q[{gate['target']}];\n"
+        elif gate['gate'] == 'RZ':
+            qasm_code += f"rz({gate['angle']}) q[{gate['target']}];\n"
+    for i, qubit in enumerate(circuit['measurements']):
+        qasm_code += f"measure q[{qubit}] -> c[{i}];\n"
+    return qasm_code
+
+
+def measure(function):
+    """Retorna (resultado, segundos, pico de bytes) da função."""
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def consume(stream):
+    """Percorre o fluxo de portas e retorna o número de portas."""
+    for _ in stream:
+        pass
+    return stream.gate_count
+
+
+def main():
+    """Executa o benchmark e imprime tempo, vazão e pico de memória."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--gates', type=int, default=1_000_000)
+    parser.add_argument('--qubits', type=int, default=16)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    compiler = GurudevQCCompiler()
+    circuit = compiler.compile(random_code(args.qubits, args.gates, np.random.default_rng(args.seed)))
+    print(f"{len(circuit['gates'])} portas, {args.qubits} qubits\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'circuit.qasm')
+
+        reference, reference_time, reference_peak = measure(lambda: concatenated_export(circuit))
+        text, export_time, export_peak = measure(lambda: compiler.export_qasm(circuit))
+        _, write_time, write_peak = measure(lambda: compiler.write_qasm(circuit, path))
+        with open(path, encoding='utf-8') as file:
+            identical = file.read() == text
+
+        imported, import_time, import_peak = measure(lambda: compiler.import_qasm(text))
+        streamed, stream_time, stream_peak = measure(lambda: consume(compiler.stream_qasm(path)))
+
+        print(f"{'operação':<34} {'tempo (s)':>10} {'portas/s':>12} {'pico (MB)':>10}")
+        for label, elapsed, peak in (
+            ('exportação por concatenação', reference_time, reference_peak),
+            ('export_qasm (texto)', export_time, export_peak),
+            ('write_qasm (arquivo)', write_time, write_peak),
+            ('import_qasm (texto)', import_time, import_peak),
+            ('stream_qasm (arquivo)', stream_time, stream_peak),
+        ):
+            print(f"{label:<34} {elapsed:>10.2f} {args.gates / elapsed:>12.3g} {peak / 2**20:>10.1f}")
+
+        print(f"\nArquivo: {os.path.getsize(path) / 2**20:.1f} MB; idêntico ao texto: {identical}; "
+              f"igual à referência: {text == reference}")
+        print(f"Circuito importado igual ao original: {imported == circuit}; "
+              f"portas lidas em fluxo: {streamed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: acesso sob demanda e serialização de SimulationResult
+
+Mede, para um circuito de n qubits, o custo de serializar os resultados com
+e sem o estado final, de gravar e recarregar o arquivo .npz (com e sem
+compressão e com mapeamento em memória) e de consultar as maiores amplitudes
+sem calcular as probabilidades de todo o vetor. Também confere que os campos
+de um resultado com medições no meio do circuito (``classical_counts``,
+``branches``) e de uma simulação por matriz densidade (``density_matrix``)
+são preservados ao gravar e recarregar o arquivo.
+
+Uso:
+    python benchmarks/bench_results.py --qubits 22 --top-k 8
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from gurudev_qc import GurudevQCSimulator, NoiseModel, SimulationResult
+
+
+def superposition_code(num_qubits):
+    """Gera um circuito com todas as amplitudes não nulas e fases distintas."""
+    lines = [f"qubits: {num_qubits}"]
+    lines += [f"harmony {q}" for q in range(num_qubits)]
+    lines += [f"rotate {q} {0.1 * (q + 1):.2f}" for q in range(num_qubits)]
+    lines += [f"entangle {q} {q + 1}" for q in range(num_qubits - 1)]
+    lines += ["measure: 0"]
+    return '\n'.join(lines)
+
+
+def round_trip(results, path):
+    """Grava e recarrega os resultados e retorna os campos que não foram preservados."""
+    results.save(path)
+    loaded = SimulationResult.load(path)
+    lost = []
+    for key, value in results.items():
+        if key in ('final_state', 'circuit_info'):
+            continue
+        if key not in loaded:
+            lost.append(key)
+        elif isinstance(value, np.ndarray):
+            if not np.array_equal(loaded[key], value):
+                lost.append(key)
+        elif loaded[key] != value:
+            lost.append(key)
+    return lost
+
+
+def timed(function, *args, **kwargs):
+    """Executa a função e retorna (resultado, segundos)."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Executa o benchmark e imprime tempos e tamanhos."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--qubits', type=int, default=22)
+    parser.add_argument('--top-k', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    simulator = GurudevQCSimulator(seed=args.seed, stabilizer_min_qubits=None)
+    results = simulator.run_gurudev_code(superposition_code(args.qubits))
+    state_mb = results['final_state'].nbytes / 2**20
+    print(f"{args.qubits} qubits, estado de {state_mb:.0f} MB\n")
+
+    print(f"{'operação':<36} {'tempo (s)':>10} {'tamanho (MB)':>13}")
+    payload, elapsed = timed(pickle.dumps, results)
+    print(f"{'pickle com estado':<36} {elapsed:>10.3f} {len(payload) / 2**20:>13.2f}")
+    payload, elapsed = timed(pickle.dumps, results.to_dict(include_state=False))
+    print(f"{'pickle sem estado':<36} {elapsed:>10.3f} {len(payload) / 2**20:>13.2f}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for compress in (False, True):
+            label = 'comprimido' if compress else 'sem compressão'
+            path = os.path.join(directory, f'resultado_{int(compress)}.npz')
+            _, elapsed = timed(results.save, path, compress=compress)
+            size = os.path.getsize(path) / 2**20
+            print(f"{'save (' + label + ')':<36} {elapsed:>10.3f} {size:>13.2f}")
+
+            loaded, elapsed = timed(SimulationResult.load, path)
+            print(f"{'load sem acessar o estado':<36} {elapsed:>10.3f}")
+            _, elapsed = timed(lambda: loaded['final_state'])
+            print(f"{'primeiro acesso ao estado':<36} {elapsed:>10.3f}")
+
+        mapped, elapsed = timed(SimulationResult.load, os.path.join(directory, 'resultado_0.npz'), mmap=True)
+        print(f"{'load com mmap':<36} {elapsed:>10.3f}")
+        _, elapsed = timed(mapped.amplitude, '1' * args.qubits)
+        print(f"{'amplitude (mmap)':<36} {elapsed:>10.3f}")
+        del mapped
+
+        branching = GurudevQCSimulator(seed=args.seed).run_gurudev_code(
+            "qubits: 2\nharmony 0\nmeasure 0 -> m0\nif m0 flip 1\nmeasure: 1"
+        )
+        noise_model = NoiseModel().add_depolarizing('harmony', 0.01)
+        density = GurudevQCSimulator(seed=args.seed, noise_model=noise_model,
+                                     noise_method='density_matrix').run_gurudev_code(
+            "qubits: 2\nharmony 0\nentangle 0 1\nmeasure: 0\nmeasure: 1"
+        )
+        for label, checked in (('medições no meio', branching), ('matriz densidade', density)):
+            lost = round_trip(checked, os.path.join(directory, 'campos.npz'))
+            print(f"{'campos após load (' + label + ')':<36} {'ok' if not lost else 'perdidos: ' + ', '.join(lost)}")
+
+    print()
+    _, elapsed = timed(results.top_amplitudes, args.top_k)
+    print(f"{f'top_amplitudes({args.top_k})':<36} {elapsed:>10.3f}")
+    _, elapsed = timed(simulator.get_state_probabilities, results['final_state'])
+    print(f"{'get_state_probabilities':<36} {elapsed:>10.3f}")
+    _, elapsed = timed(lambda: sum(block.size for _, block in results.iter_chunks()))
+    print(f"{'iter_chunks (visões)':<36} {elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
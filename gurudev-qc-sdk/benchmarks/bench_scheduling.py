@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: escalonamento por localidade de qubits
+
+Compara, em circuitos aleatórios de 24 a 28 qubits, o laço porta a porta
+(uma passada pelo estado por porta), os ladrilhos sem trocas de qubits e os
+ladrilhos com trocas (o padrão do simulador), reportando o número total de
+passadas pelo vetor de estado e o tempo de parede. O estado final dos modos
+escalonados é comparado com o do laço porta a porta.
+
+Uso:
+    python benchmarks/bench_scheduling.py --qubits 24 26 --gates 100
+    python benchmarks/bench_scheduling.py --qubits 28 --precision single
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCCompiler, GurudevQCSimulator, scheduling
+
+
+def random_code(num_qubits, num_gates, rng):
+    """Gera um circuito aleatório com o número de portas pedido."""
+    lines = [f"qubits: {num_qubits}"]
+    for _ in range(num_gates):
+        q = int(rng.integers(num_qubits))
+        kind = rng.integers(3)
+        if kind == 0:
+            lines.append(f"harmony {q}")
+        elif kind == 1:
+            lines.append(f"rotate {q} {rng.uniform(0, 2 * np.pi):.6f}")
+        else:
+            lines.append(f"entangle {q} {(q + 1) % num_qubits}")
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def timed_simulation(circuit, precision, tile_qubits, relabel=True):
+    """Simula o circuito e retorna (estado final, segundos)."""
+    simulator = GurudevQCSimulator(precision=precision, stabilizer_min_qubits=None,
+                                   tile_qubits=tile_qubits)
+    if not relabel:
+        simulator.tile_qubits = None
+        state = simulator._initial_state(circuit['qubits'])
+        start = time.perf_counter()
+        gates = simulator._merge_diagonal_runs(circuit['gates'])
+        schedule = scheduling.schedule_gates(gates, circuit['qubits'], tile_qubits, relabel=False)
+        scheduling.run_schedule(
+            state, schedule,
+            lambda block, gate: simulator._apply_gate(block, gate, circuit['qubits'])
+        )
+        return state, time.perf_counter() - start
+
+    start = time.perf_counter()
+    state = simulator._simulate(circuit)
+    return state, time.perf_counter() - start
+
+
+def main():
+    """Executa o benchmark e imprime passadas e tempos de cada modo."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--qubits', type=int, nargs='+', default=[24, 26])
+    parser.add_argument('--gates', type=int, default=100)
+    parser.add_argument('--tile-qubits', type=int, default=scheduling.TILE_QUBITS)
+    parser.add_argument('--precision', choices=('single', 'double'), default='double')
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'qubits':>6} {'modo':<24} {'passadas':>9} {'tempo (s)':>10} {'aceleração':>11}")
+    for num_qubits in args.qubits:
+        circuit = GurudevQCCompiler().compile(random_code(num_qubits, args.gates, rng))
+        gates = GurudevQCSimulator()._merge_diagonal_runs(circuit['gates'])
+        modes = (
+            ('porta a porta', None, True, len(gates)),
+            ('ladrilhos', args.tile_qubits, False,
+             scheduling.schedule_gates(gates, num_qubits, args.tile_qubits, relabel=False).sweeps),
+            ('ladrilhos + trocas', args.tile_qubits, True,
+             scheduling.schedule_gates(gates, num_qubits, args.tile_qubits).sweeps),
+        )
+
+        reference = None
+        baseline = None
+        for label, tile_qubits, relabel, sweeps in modes:
+            state, elapsed = timed_simulation(circuit, args.precision, tile_qubits, relabel)
+            if reference is None:
+                reference, baseline = state, elapsed
+                match = ''
+            else:
+                match = '' if np.allclose(state, reference, atol=1e-12) else '  (estado diferente!)'
+            del state
+            print(f"{num_qubits:>6} {label:<24} {sweeps:>9} {elapsed:>10.2f} "
+                  f"{baseline / elapsed:>10.2f}x{match}")
+        del reference
+
+
+if __name__ == "__main__":
+    main()
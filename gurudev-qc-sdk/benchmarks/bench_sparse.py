@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: estado esparso vs. vetor de estado denso
+
+Compara ``backend='sparse'`` com o vetor denso em circuitos de suporte
+pequeno: o estado GHZ com rotações RZ (duas amplitudes, não é de Clifford) e
+um circuito de permutações com ``flip``/``entangle`` (uma amplitude). O
+vetor denso só é executado até ``--max-dense-qubits``.
+
+Uso:
+    python benchmarks/bench_sparse.py --qubits 16 20 24 40 60
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCSimulator
+
+
+def ghz_rotations_code(num_qubits):
+    """Estado GHZ seguido de uma rotação RZ em cada qubit."""
+    lines = [f"qubits: {num_qubits}", "harmony 0"]
+    lines += [f"entangle 0 {q}" for q in range(1, num_qubits)]
+    lines += [f"rotate {q} {0.1 * (q + 1):.3f}" for q in range(num_qubits)]
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def permutation_code(num_qubits, num_gates, rng):
+    """Circuito aleatório só com ``flip`` e ``entangle``."""
+    lines = [f"qubits: {num_qubits}"]
+    for _ in range(num_gates):
+        if rng.random() < 0.3:
+            lines.append(f"flip {rng.integers(num_qubits)}")
+        else:
+            control, target = rng.choice(num_qubits, 2, replace=False)
+            lines.append(f"entangle {control} {target}")
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def timed_run(simulator, circuit):
+    """Executa o circuito e retorna o tempo em segundos."""
+    start = time.perf_counter()
+    simulator.run(circuit)
+    return time.perf_counter() - start
+
+
+def main():
+    """Executa o benchmark para cada número de qubits."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--qubits', type=int, nargs='+', default=[16, 20, 24, 40, 60])
+    parser.add_argument('--gates', type=int, default=500)
+    parser.add_argument('--max-dense-qubits', type=int, default=24)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    sparse = GurudevQCSimulator(seed=args.seed, backend='sparse')
+    dense = GurudevQCSimulator(seed=args.seed, stabilizer_min_qubits=None)
+
+    print(f"{'qubits':>6} {'circuito':<14} {'portas':>7} {'esparso (s)':>12} {'denso (s)':>10} {'speedup':>9}")
+    for num_qubits in args.qubits:
+        codes = {
+            'ghz + rotate': ghz_rotations_code(num_qubits),
+            'permutações': permutation_code(num_qubits, args.gates, rng),
+        }
+        for name, code in codes.items():
+            circuit = sparse.compiler.compile(code)
+            sparse_time = timed_run(sparse, circuit)
+            if num_qubits <= args.max_dense_qubits:
+                dense_time = timed_run(dense, circuit)
+                columns = f"{dense_time:>10.3f} {dense_time / sparse_time:>8.1f}x"
+            else:
+                columns = f"{'-':>10} {'-':>9}"
+            print(f"{num_qubits:>6} {name:<14} {len(circuit['gates']):>7} {sparse_time:>12.4f} {columns}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: tableau de estabilizadores vs. vetor de estado
+
+Mede o tempo de ``run`` para o estado GHZ de ``GurudevQCAlgorithms`` e para
+circuitos de Clifford aleatórios densos (camada de Hadamards seguida de CNOTs
+e portas de um qubit aleatórias), com todos os qubits medidos. O vetor de
+estado só é executado até ``--max-statevector-qubits``.
+
+Uso:
+    python benchmarks/bench_stabilizer.py --qubits 10 20 100 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCSimulator
+from gurudev_qc.algorithms import GurudevQCAlgorithms
+
+
+def random_clifford_code(num_qubits, depth, rng):
+    """Gera um programa de Clifford aleatório com ``depth`` portas por qubit."""
+    lines = [f"qubits: {num_qubits}"]
+    lines += [f"harmony {q}" for q in range(0, num_qubits, 2)]
+    for _ in range(depth * num_qubits // 2):
+        control, target = rng.choice(num_qubits, 2, replace=False)
+        lines.append(f"entangle {control} {target}")
+        lines.append(f"{rng.choice(['harmony', 'phase', 'flip'])} {rng.integers(num_qubits)}")
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def timed_run(simulator, circuit):
+    """Executa o circuito e retorna (tempo em s, número de resultados distintos)."""
+    start = time.perf_counter()
+    results = simulator.run(circuit)
+    return time.perf_counter() - start, len(results['measurement_counts'])
+
+
+def main():
+    """Executa o benchmark para cada número de qubits."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--qubits', type=int, nargs='+', default=[10, 20, 50, 100, 500, 1000])
+    parser.add_argument('--depth', type=int, default=10)
+    parser.add_argument('--max-statevector-qubits', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    stabilizer = GurudevQCSimulator(seed=args.seed, backend='stabilizer')
+    statevector = GurudevQCSimulator(seed=args.seed, stabilizer_min_qubits=None)
+    algorithms = GurudevQCAlgorithms()
+
+    print(f"{'qubits':>6} {'circuito':<10} {'portas':>7} {'tableau (s)':>12} "
+          f"{'vetor (s)':>10} {'resultados':>11}")
+
+    for num_qubits in args.qubits:
+        codes = {
+            'ghz': algorithms.ghz_state(num_qubits),
+            'clifford': random_clifford_code(num_qubits, args.depth, rng),
+        }
+        for name, code in codes.items():
+            circuit = stabilizer.compiler.compile(code)
+            tableau_time, outcomes = timed_run(stabilizer, circuit)
+            if num_qubits <= args.max_statevector_qubits:
+                vector_time = f"{timed_run(statevector, circuit)[0]:>10.3f}"
+            else:
+                vector_time = f"{'-':>10}"
+            print(f"{num_qubits:>6} {name:<10} {len(circuit['gates']):>7} {tableau_time:>12.3f} "
+                  f"{vector_time} {outcomes:>11}")
+
+
+if __name__ == "__main__":
+    main()
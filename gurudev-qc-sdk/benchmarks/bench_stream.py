@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compilação em fluxo vs. compilação do programa inteiro
+
+Gera um programa Gurudev-QC grande em um arquivo temporário e compara o tempo
+e o pico de memória Python (medido com ``tracemalloc``) entre ler o arquivo
+inteiro, compilá-lo com ``compile`` e executar, e executá-lo em fluxo com
+``run_stream``, que aplica cada porta assim que a sua linha é lida.
+
+Uso:
+    python benchmarks/bench_stream.py --gates 1000000 --qubits 10
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCSimulator
+
+
+def write_program(path, num_qubits, num_gates, rng):
+    """Escreve um programa aleatório no arquivo, em blocos, sem montá-lo em memória."""
+    names = np.array(['harmony', 'flip', 'phase', 'rotate', 'entangle'])
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(f"qubits: {num_qubits}\n")
+        for start in range(0, num_gates, 100_000):
+            size = min(100_000, num_gates - start)
+            ops = rng.integers(len(names), size=size)
+            targets = rng.integers(num_qubits, size=size)
+            angles = rng.uniform(0, 2 * np.pi, size=size)
+            lines = []
+            for op, target, angle in zip(ops.tolist(), targets.tolist(), angles.tolist()):
+                if op == 3:
+                    lines.append(f"rotate {target} {angle:.6f}\n")
+                elif op == 4:
+                    lines.append(f"entangle {target} {(target + 1) % num_qubits}\n")
+                else:
+                    lines.append(f"{names[op]} {target}\n")
+            file.writelines(lines)
+        file.writelines(f"measure: {q}\n" for q in range(num_qubits))
+
+
+def measure(function):
+    """Executa a função e retorna (resultado, tempo em s, pico de memória em bytes)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    """Executa o benchmark e imprime tempo e pico de memória."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--gates', type=int, default=1_000_000)
+    parser.add_argument('--qubits', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    simulator = GurudevQCSimulator(seed=args.seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'programa.gqc')
+        write_program(path, args.qubits, args.gates, np.random.default_rng(args.seed))
+        size = os.path.getsize(path)
+
+        def run_whole():
+            with open(path, encoding='utf-8') as file:
+                code = file.read()
+            return simulator.run(simulator.compiler.compile(code))
+
+        print(f"{args.gates} portas, {args.qubits} qubits, arquivo de {size / 2**20:.1f} MB\n")
+        print(f"{'modo':<22} {'tempo (s)':>10} {'pico (MB)':>10}")
+
+        states = []
+        for label, function in (('compile + run', run_whole),
+                                ('run_stream', lambda: simulator.run_stream(path))):
+            results, elapsed, peak = measure(function)
+            states.append(results['final_state'])
+            print(f"{label:<22} {elapsed:>10.2f} {peak / 2**20:>10.1f}")
+            del results
+
+    print(f"\nDesvio máximo entre estados: {np.max(np.abs(states[0] - states[1])):.1e}")
+
+
+if __name__ == "__main__":
+    main()
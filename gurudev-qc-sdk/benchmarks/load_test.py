@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Teste de carga do serviço de simulação assíncrono
+
+Inicia um ``SimulationService`` com a interface HTTP em uma porta local e
+dispara pedidos ``POST /run`` a partir de clientes concorrentes (conexões
+HTTP/1.1 persistentes), com uma mistura de circuitos pequenos (GHZ e
+aleatórios) e médios, parte deles repetidos com a mesma semente para exercitar
+o agrupamento de pedidos idênticos. Reporta latência p50/p99, trabalhos por
+segundo e os contadores do serviço, e compara com a execução bloqueante
+sequencial dos mesmos pedidos com ``run_gurudev_code``.
+
+Uso:
+    python benchmarks/load_test.py --requests 400 --concurrency 32 --workers 2
+    python benchmarks/load_test.py --mode inprocess
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gurudev_qc import GurudevQCAlgorithms, GurudevQCSimulator, SimulationService
+
+
+def random_code(num_qubits, num_gates, rng):
+    """Gera um circuito aleatório com todos os qubits medidos."""
+    lines = [f"qubits: {num_qubits}"]
+    for _ in range(num_gates):
+        q = int(rng.integers(num_qubits))
+        kind = rng.integers(3)
+        if kind == 0:
+            lines.append(f"harmony {q}")
+        elif kind == 1:
+            lines.append(f"rotate {q} {rng.uniform(0, 2 * np.pi):.6f}")
+        else:
+            lines.append(f"entangle {q} {(q + 1) % num_qubits}")
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def workload(num_requests, duplicates, rng):
+    """Gera os pedidos: (código, shots, semente)."""
+    algorithms = GurudevQCAlgorithms()
+    popular = [(algorithms.ghz_state(n), 1000, 7) for n in (4, 6, 8)]
+    requests = []
+    for _ in range(num_requests):
+        draw = rng.random()
+        if draw < duplicates:
+            requests.append(popular[int(rng.integers(len(popular)))])
+        elif draw < duplicates + (1 - duplicates) * 0.8:
+            code = random_code(int(rng.integers(6, 12)), 60, rng)
+            requests.append((code, 1000, int(rng.integers(1 << 30))))
+        else:
+            requests.append((random_code(16, 80, rng), 1000, int(rng.integers(1 << 30))))
+    return requests
+
+
+class HttpClient:
+    """Cliente HTTP/1.1 mínimo com conexão persistente."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def post(self, path, payload):
+        """Envia um POST com corpo JSON e retorna (código, corpo decodificado)."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        data = json.dumps(payload).encode('utf-8')
+        self.writer.write(
+            f"POST {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n\r\n".encode('latin-1') + data
+        )
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    def close(self):
+        """Fecha a conexão."""
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def drive(service, requests, concurrency, mode, port):
+    """Dispara os pedidos com ``concurrency`` clientes e retorna latências e códigos."""
+    pending = iter(requests)
+    latencies = []
+    statuses = Counter()
+
+    async def client():
+        http = HttpClient('127.0.0.1', port) if mode == 'http' else None
+        try:
+            for code, shots, seed in pending:
+                start = time.perf_counter()
+                if http is not None:
+                    status, _ = await http.post('/run', {'code': code, 'shots': shots, 'seed': seed})
+                else:
+                    try:
+                        await service.run(code, shots=shots, seed=seed)
+                        status = 200
+                    except Exception:
+                        status = 500
+                latencies.append(time.perf_counter() - start)
+                statuses[status] += 1
+        finally:
+            if http is not None:
+                http.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies, statuses, time.perf_counter() - start
+
+
+async def serve_and_drive(args, requests):
+    """Inicia o serviço, executa a carga e retorna as métricas."""
+    service = SimulationService(max_workers=args.workers, max_queue=args.max_queue,
+                                timeout=args.timeout, small_qubits=args.small_qubits)
+    server = await service.serve_http('127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        latencies, statuses, elapsed = await drive(service, requests, args.concurrency, args.mode, port)
+    finally:
+        server.close()
+        await server.wait_closed()
+        await service.stop()
+    return latencies, statuses, elapsed, dict(service.stats)
+
+
+def main():
+    """Executa o teste de carga e imprime as métricas."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--max-queue', type=int, default=256)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--small-qubits', type=int, default=12)
+    parser.add_argument('--duplicates', type=float, default=0.3,
+                        help='fração de pedidos repetidos (mesmo circuito e semente)')
+    parser.add_argument('--mode', choices=('http', 'inprocess'), default='http')
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    requests = workload(args.requests, args.duplicates, np.random.default_rng(args.seed))
+    print(f"{args.requests} pedidos, {args.concurrency} clientes, {args.workers} trabalhadores, "
+          f"modo {args.mode}\n")
+
+    latencies, statuses, elapsed, stats = asyncio.run(serve_and_drive(args, requests))
+
+    # Referência: cada pedido bloqueia um trabalhador por um run_gurudev_code inteiro
+    start = time.perf_counter()
+    blocking = []
+    for code, shots, seed in requests:
+        began = time.perf_counter()
+        GurudevQCSimulator(shots=shots, seed=seed).run_gurudev_code(code)
+        blocking.append(time.perf_counter() - began)
+    blocking_elapsed = time.perf_counter() - start
+
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    print(f"{'modo':<28} {'trabalhos/s':>12} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    print(f"{'serviço assíncrono':<28} {len(latencies) / elapsed:>12.1f} {p50:>10.2f} {p99:>10.2f}")
+    blocking_p50, blocking_p99 = np.percentile(blocking, [50, 99]) * 1e3
+    print(f"{'bloqueante (sequencial)':<28} {len(blocking) / blocking_elapsed:>12.1f} "
+          f"{blocking_p50:>10.2f} {blocking_p99:>10.2f}  (tempo de serviço, sem fila)")
+
+    print(f"\nRespostas: {dict(statuses)}")
+    print(f"Agrupados: {stats['coalesced']} de {stats['submitted']} pedidos; "
+          f"{stats['executions']} execuções em {stats['executor_calls']} chamadas ao executor "
+          f"({stats['executions'] / max(1, stats['executor_calls']):.1f} por chamada)")
+    print(f"Rejeitados: {stats['rejected']}, prazos esgotados: {stats['timed_out']}")
+
+
+if __name__ == "__main__":
+    main()
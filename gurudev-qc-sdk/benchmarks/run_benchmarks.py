@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Suíte de benchmarks reprodutível do compilador e do simulador
+
+Mede como ``GurudevQCCompiler.compile``, ``GurudevQCSimulator.run``,
+``_measure`` e ``export_qasm`` escalam com o número de qubits, de portas e de
+shots, usando os geradores de ``GurudevQCAlgorithms`` (GHZ até centenas de
+qubits, pelo tableau de estabilizadores) e circuitos aleatórios com semente
+fixa. Para cada caso registra as latências (p50, p90, p99), a vazão (trabalho
+por segundo na mediana) e o pico de memória alocada (``tracemalloc``, em uma
+execução separada das cronometradas), grava tudo em JSON e compara com uma
+linha de base, sinalizando regressões acima de um limiar.
+
+Uso:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --quick --output resultados.json
+    python benchmarks/run_benchmarks.py --update-baseline
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --threshold 0.25
+
+O código de saída é 1 quando algum caso regride em relação à linha de base.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gurudev_qc
+from gurudev_qc import GurudevQCAlgorithms, GurudevQCCompiler, GurudevQCSimulator
+
+# Linha de base usada quando --baseline não é informado
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+SEED = 1234
+
+
+def random_code(num_qubits, num_gates, rng):
+    """Gera um circuito aleatório com o número de portas pedido e todos os qubits medidos."""
+    lines = [f"qubits: {num_qubits}"]
+    for _ in range(num_gates):
+        q = int(rng.integers(num_qubits))
+        kind = rng.integers(3)
+        if kind == 0:
+            lines.append(f"harmony {q}")
+        elif kind == 1:
+            lines.append(f"rotate {q} {rng.uniform(0, 2 * np.pi):.6f}")
+        else:
+            lines.append(f"entangle {q} {(q + 1) % num_qubits}")
+    lines += [f"measure: {q}" for q in range(num_qubits)]
+    return '\n'.join(lines)
+
+
+def compile_case(code):
+    """Compila o código a cada chamada (sem cache)."""
+    compiler = GurudevQCCompiler()
+    return lambda: compiler.compile(code)
+
+
+def run_case(code, stabilizer_min_qubits=None, shots=1024):
+    """Simula e mede o circuito a cada chamada."""
+    circuit = GurudevQCCompiler().compile(code)
+    simulator = GurudevQCSimulator(shots=shots, seed=SEED, stabilizer_min_qubits=stabilizer_min_qubits)
+    return lambda: simulator.run(circuit)
+
+
+def measure_case(code, shots):
+    """Amostra os shots do estado final já simulado a cada chamada."""
+    circuit = GurudevQCCompiler().compile(code)
+    simulator = GurudevQCSimulator(seed=SEED, stabilizer_min_qubits=None)
+    state = simulator._simulate(circuit)
+    return lambda: simulator._measure(state, circuit['measurements'], circuit['qubits'], False, shots)
+
+
+def export_case(code):
+    """Exporta o circuito compilado para QASM a cada chamada."""
+    compiler = GurudevQCCompiler()
+    circuit = compiler.compile(code)
+    return lambda: compiler.export_qasm(circuit)
+
+
+def build_cases(quick):
+    """
+    Monta a lista de casos da suíte.
+
+    Returns:
+        Lista de tuplas (nome, unidade de trabalho, quantidade, fábrica da
+        função cronometrada)
+    """
+    algorithms = GurudevQCAlgorithms()
+    rng = np.random.default_rng(SEED)
+    scale = 1 if quick else 4
+
+    ghz_compile = (64, 512) if quick else (64, 512, 4096)
+    ghz_dense = (10, 16) if quick else (10, 16, 22)
+    ghz_stabilizer = (100,) if quick else (100, 1000)
+    random_sizes = ((12, 500 * scale), (18, 200 * scale))
+    shot_counts = (1024, 100_000) if quick else (1024, 100_000, 1_000_000)
+
+    cases = []
+    for n in ghz_compile:
+        cases.append((f"compile/ghz/q{n}", 'gates', n, lambda n=n: compile_case(algorithms.ghz_state(n))))
+    gates = 20_000 * scale
+    random_compile = random_code(16, gates, rng)
+    cases.append((f"compile/random/g{gates}", 'gates', gates, lambda: compile_case(random_compile)))
+
+    for n in ghz_dense:
+        cases.append((f"run/ghz/q{n}", 'gates', n, lambda n=n: run_case(algorithms.ghz_state(n))))
+    for n in ghz_stabilizer:
+        cases.append((f"run/ghz-stabilizer/q{n}", 'gates', n,
+                      lambda n=n: run_case(algorithms.ghz_state(n), stabilizer_min_qubits=20)))
+    for n, gates in random_sizes:
+        code = random_code(n, gates, rng)
+        cases.append((f"run/random/q{n}-g{gates}", 'gates', gates, lambda code=code: run_case(code)))
+
+    measured = random_code(16, 100, rng)
+    for shots in shot_counts:
+        cases.append((f"measure/q16/s{shots}", 'shots', shots,
+                      lambda shots=shots: measure_case(measured, shots)))
+
+    for gates in (10_000 * scale, 50_000 * scale):
+        code = random_code(16, gates, rng)
+        cases.append((f"export_qasm/g{gates}", 'gates', gates, lambda code=code: export_case(code)))
+    return cases
+
+
+def measure(function, repeat, min_seconds):
+    """
+    Cronometra a função e mede o pico de memória em uma execução separada.
+
+    Args:
+        function: Função sem argumentos
+        repeat: Número mínimo de execuções cronometradas
+        min_seconds: Tempo mínimo total das execuções cronometradas
+
+    Returns:
+        Tupla (lista de latências em segundos, pico de bytes alocados)
+    """
+    function()  # aquecimento
+
+    latencies = []
+    total = 0.0
+    while len(latencies) < repeat or total < min_seconds:
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        latencies.append(elapsed)
+        total += elapsed
+        if len(latencies) >= 10 * repeat:
+            break
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return latencies, peak
+
+
+def run_suite(cases, repeat, min_seconds, pattern=None):
+    """Executa os casos e retorna o dicionário de resultados por nome."""
+    results = {}
+    for name, unit, work, factory in cases:
+        if pattern and pattern not in name:
+            continue
+        latencies, peak = measure(factory(), repeat, min_seconds)
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+        results[name] = {
+            'unit': unit,
+            'work': work,
+            'samples': len(latencies),
+            'p50_s': float(p50),
+            'p90_s': float(p90),
+            'p99_s': float(p99),
+            'mean_s': float(np.mean(latencies)),
+            'throughput': work / float(p50),
+            'peak_memory_bytes': int(peak),
+        }
+        print(f"{name:<32} {p50 * 1e3:>10.3f} {p90 * 1e3:>10.3f} {p99 * 1e3:>10.3f} "
+              f"{work / p50:>12.3g} {unit:<6} {peak / 2**20:>9.1f}")
+    return results
+
+
+def metadata():
+    """Informações do ambiente gravadas junto dos resultados."""
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'gurudev_qc': gurudev_qc.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compara os resultados com a linha de base.
+
+    Um caso regride quando a latência p50 ou o pico de memória crescem mais
+    que ``threshold`` (fração) em relação à linha de base.
+
+    Returns:
+        Lista de nomes dos casos que regrediram
+    """
+    regressions = []
+    print(f"\n{'caso':<32} {'p50 base':>10} {'p50 atual':>10} {'variação':>9} {'memória':>9}")
+    for name, current in results.items():
+        reference = baseline.get('cases', {}).get(name)
+        if reference is None:
+            print(f"{name:<32} {'-':>10} {current['p50_s'] * 1e3:>10.3f} {'novo':>9}")
+            continue
+        change = current['p50_s'] / reference['p50_s'] - 1
+        memory_change = ((current['peak_memory_bytes'] + 1) / (reference['peak_memory_bytes'] + 1)) - 1
+        regressed = change > threshold or memory_change > threshold
+        flag = '  REGRESSÃO' if regressed else ''
+        print(f"{name:<32} {reference['p50_s'] * 1e3:>10.3f} {current['p50_s'] * 1e3:>10.3f} "
+              f"{change * 100:>8.1f}% {memory_change * 100:>8.1f}%{flag}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    """Executa a suíte, grava o JSON e compara com a linha de base."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--quick', action='store_true', help='casos menores, para verificações rápidas')
+    parser.add_argument('--repeat', type=int, default=5, help='mínimo de execuções por caso')
+    parser.add_argument('--min-time', type=float, default=0.2, help='tempo mínimo cronometrado por caso (s)')
+    parser.add_argument('--filter', default=None, help='executa apenas casos cujo nome contém o texto')
+    parser.add_argument('--output', default=None, help='arquivo JSON dos resultados')
+    parser.add_argument('--baseline', default=None,
+                        help=f'linha de base para comparação (padrão: {os.path.basename(DEFAULT_BASELINE)}, se existir)')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='aumento relativo de p50 ou memória considerado regressão')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='grava os resultados como a nova linha de base')
+    args = parser.parse_args()
+
+    print(f"{'caso':<32} {'p50 (ms)':>10} {'p90 (ms)':>10} {'p99 (ms)':>10} "
+          f"{'vazão':>12} {'':<6} {'pico (MB)':>9}")
+    report = {
+        'metadata': metadata(),
+        'settings': {'quick': args.quick, 'repeat': args.repeat, 'min_time': args.min_time},
+        'cases': run_suite(build_cases(args.quick), args.repeat, args.min_time, args.filter),
+    }
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"\nResultados gravados em {args.output}")
+
+    if args.update_baseline:
+        baseline_path = args.baseline or DEFAULT_BASELINE
+        with open(baseline_path, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"\nLinha de base gravada em {baseline_path}")
+        return 0
+
+    baseline_path = args.baseline or (DEFAULT_BASELINE if os.path.exists(DEFAULT_BASELINE) else None)
+    if baseline_path is None:
+        return 0
+
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+    if baseline.get('settings', {}).get('quick') != args.quick:
+        print("\nAviso: a linha de base foi gravada com outro valor de --quick")
+    regressions = compare(report['cases'], baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regressão(ões) acima de {args.threshold * 100:.0f}%: {', '.join(regressions)}")
+        return 1
+    print(f"\nNenhuma regressão acima de {args.threshold * 100:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
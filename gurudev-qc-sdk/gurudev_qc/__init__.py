@@ -7,12 +7,33 @@ Um SDK para desenvolvimento de algoritmos quânticos usando os princípios de Gu
 __version__ = "0.1.0"
 __author__ = "QIQU Team - Hubstry DeepTech"
 
-from .compiler import GurudevQCCompiler
+from .cache import CircuitCache
+from .compiler import GurudevQCCompiler, GurudevQCSyntaxError, CircuitStream
 from .simulator import GurudevQCSimulator
+from .parallel import ParallelSimulator
+from .results import SimulationResult
+from .noise import NoiseModel
+from .observables import Observable
+from .profiling import Profiler
+from .service import SimulationService, ServiceBusyError
+from .sparse import SparseState
+from .stabilizer import StabilizerTableau
 from .algorithms import *
 
 __all__ = [
+    "CircuitCache",
     "GurudevQCCompiler",
+    "GurudevQCSyntaxError",
+    "CircuitStream",
     "GurudevQCSimulator",
+    "ParallelSimulator",
+    "SimulationResult",
+    "NoiseModel",
+    "Observable",
+    "Profiler",
+    "SimulationService",
+    "ServiceBusyError",
+    "SparseState",
+    "StabilizerTableau",
 ]
 
@@ -0,0 +1,103 @@
+"""
+Kernels Compilados do Numba Gurudev-QC
+
+Funções ``numba.njit`` usadas por ``gurudev_qc.numba_kernels.NumbaKernels``.
+Este módulo importa o Numba e só é carregado por ``numba_kernels`` quando um
+kernel compilado é usado pela primeira vez.
+"""
+
+from numba import njit, prange
+
+
+# Kernels paralelos, com o GIL liberado e guardados em cache no disco
+_jit = njit(parallel=True, nogil=True, cache=True)
+
+
+@njit(inline='always')
+def _insert_zero(index, bit):
+    """Insere um bit 0 na posição ``bit`` do índice."""
+    low = index & ((1 << bit) - 1)
+    return ((index >> bit) << (bit + 1)) | low
+
+
+@_jit
+def single_qubit(state, target, m00, m01, m10, m11):
+    stride = 1 << target
+    for k in prange(state.size >> 1):
+        i0 = _insert_zero(k, target)
+        i1 = i0 | stride
+        a0 = state[i0]
+        a1 = state[i1]
+        state[i0] = m00 * a0 + m01 * a1
+        state[i1] = m10 * a0 + m11 * a1
+
+
+@_jit
+def diagonal(state, target, phase0, phase1):
+    # Percorre o vetor em ordem, o que permite vetorizar o laço
+    for k in prange(state.size):
+        if (k >> target) & 1:
+            state[k] *= phase1
+        else:
+            state[k] *= phase0
+
+
+@_jit
+def pauli_x(state, target):
+    stride = 1 << target
+    for k in prange(state.size >> 1):
+        i0 = _insert_zero(k, target)
+        i1 = i0 | stride
+        a0 = state[i0]
+        state[i0] = state[i1]
+        state[i1] = a0
+
+
+@_jit
+def pauli_y(state, target):
+    stride = 1 << target
+    for k in prange(state.size >> 1):
+        i0 = _insert_zero(k, target)
+        i1 = i0 | stride
+        a0 = state[i0]
+        state[i0] = -1j * state[i1]
+        state[i1] = 1j * a0
+
+
+@_jit
+def pauli_z(state, target):
+    stride = 1 << target
+    for k in prange(state.size >> 1):
+        i1 = _insert_zero(k, target) | stride
+        state[i1] = -state[i1]
+
+
+@_jit
+def cnot(state, control, target):
+    low, high = min(control, target), max(control, target)
+    control_bit, target_bit = 1 << control, 1 << target
+    for k in prange(state.size >> 2):
+        i0 = _insert_zero(_insert_zero(k, low), high) | control_bit
+        i1 = i0 | target_bit
+        a0 = state[i0]
+        state[i0] = state[i1]
+        state[i1] = a0
+
+
+@_jit
+def two_qubit(state, qubit_a, qubit_b, matrix):
+    low, high = min(qubit_a, qubit_b), max(qubit_a, qubit_b)
+    bit_a, bit_b = 1 << qubit_a, 1 << qubit_b
+    for k in prange(state.size >> 2):
+        i00 = _insert_zero(_insert_zero(k, low), high)
+        i01 = i00 | bit_b
+        i10 = i00 | bit_a
+        i11 = i10 | bit_b
+        a0 = state[i00]
+        a1 = state[i01]
+        a2 = state[i10]
+        a3 = state[i11]
+        state[i00] = matrix[0, 0] * a0 + matrix[0, 1] * a1 + matrix[0, 2] * a2 + matrix[0, 3] * a3
+        state[i01] = matrix[1, 0] * a0 + matrix[1, 1] * a1 + matrix[1, 2] * a2 + matrix[1, 3] * a3
+        state[i10] = matrix[2, 0] * a0 + matrix[2, 1] * a1 + matrix[2, 2] * a2 + matrix[2, 3] * a3
+        state[i11] = matrix[3, 0] * a0 + matrix[3, 1] * a1 + matrix[3, 2] * a2 + matrix[3, 3] * a3
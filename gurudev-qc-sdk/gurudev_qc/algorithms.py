@@ -82,12 +82,16 @@ class GurudevQCAlgorithms:
         entangle 0 1
         harmony 0
         
-        # Medições de Alice
+        # Medições de Alice, gravadas nos bits clássicos m0 e m1
+        measure 0 -> m0
+        measure 1 -> m1
+        
+        # Correções de Bob condicionadas aos resultados de Alice
+        if m1 flip 2
+        if m0 phase 2
+        
         measure: 0
         measure: 1
-        
-        # Bob aplicará correções baseadas nos resultados de Alice
-        # (em uma implementação real, isso seria feito condicionalmente)
         measure: 2
         """
     
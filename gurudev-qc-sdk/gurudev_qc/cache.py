@@ -0,0 +1,202 @@
+"""
+Cache de Circuitos Gurudev-QC
+
+Este módulo contém o cache LRU de circuitos compilados, indexado pelo hash do
+código fonte normalizado e pelas opções do compilador, com uma camada
+persistente opcional em disco para que novos processos já iniciem aquecidos.
+
+Os arquivos da camada em disco são lidos com ``pickle``, que pode executar
+código arbitrário: o diretório deve ser confiável e gravável apenas pelo
+usuário que executa o compilador. Entradas que não podem ser lidas
+(corrompidas ou gravadas por outra versão do pacote) contam como faltas.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def normalize_source(gurudev_code: str) -> str:
+    """
+    Normaliza o código fonte sem alterar o seu significado para o compilador.
+
+    Linhas vazias e comentários de linha inteira são removidos e os espaços
+    em branco de cada linha são colapsados.
+
+    Args:
+        gurudev_code: Código fonte em Gurudev-QC
+
+    Returns:
+        Código fonte normalizado
+    """
+    lines = []
+    for line in gurudev_code.strip().split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        lines.append(' '.join(line.split()))
+    return '\n'.join(lines)
+
+
+class CircuitCache:
+    """
+    Cache LRU limitado de circuitos compilados.
+
+    Os circuitos retornados pelo cache são compartilhados entre as chamadas e
+    devem ser tratados como somente leitura.
+    """
+
+    def __init__(self, maxsize: int = 256, persist_dir: Optional[str] = None):
+        """
+        Inicializa o cache.
+
+        Args:
+            maxsize: Número máximo de circuitos mantidos em memória
+            persist_dir: Diretório da camada persistente em disco (opcional;
+                deve ser confiável, pois os arquivos são lidos com ``pickle``)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize deve ser pelo menos 1")
+
+        self.maxsize = maxsize
+        self.persist_dir = persist_dir
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if persist_dir is not None:
+            os.makedirs(persist_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(gurudev_code: str, **options: Any) -> str:
+        """
+        Calcula a chave do cache para um código fonte e opções do compilador.
+
+        Args:
+            gurudev_code: Código fonte em Gurudev-QC
+            **options: Opções passadas ao compilador (ex: optimize)
+
+        Returns:
+            Hash SHA-256 hexadecimal da fonte normalizada e das opções
+        """
+        payload = json.dumps(
+            {'source': normalize_source(gurudev_code), 'options': options},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca um circuito no cache, consultando o disco em caso de falta.
+
+        Args:
+            key: Chave calculada por ``make_key``
+
+        Returns:
+            Circuito compilado ou None se não estiver no cache
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        circuit = self._load(key)
+
+        with self._lock:
+            if circuit is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._insert(key, circuit)
+            return circuit
+
+    def put(self, key: str, circuit: Dict[str, Any]) -> None:
+        """
+        Armazena um circuito compilado no cache (e no disco, se configurado).
+
+        Args:
+            key: Chave calculada por ``make_key``
+            circuit: Circuito compilado
+        """
+        with self._lock:
+            self._insert(key, circuit)
+        self._store(key, circuit)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna os contadores do cache.
+
+        Returns:
+            Dicionário com acertos, faltas, despejos, acertos em disco e tamanho
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'disk_hits': self.disk_hits,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Esvazia a camada em memória (a camada em disco é mantida)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _insert(self, key: str, circuit: Dict[str, Any]) -> None:
+        """Insere uma entrada e despeja as menos usadas recentemente."""
+        self._entries[key] = circuit
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key: str) -> str:
+        """Caminho do arquivo persistente de uma chave."""
+        return os.path.join(self.persist_dir, f"{key}.pkl")
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Carrega um circuito da camada em disco, se existir.
+
+        Qualquer erro ao ler a entrada (arquivo ausente, truncado ou que
+        referencia classes que mudaram desde a gravação) é tratado como
+        falta, e o circuito é compilado novamente.
+        """
+        if self.persist_dir is None:
+            return None
+
+        try:
+            with open(self._path(key), 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def _store(self, key: str, circuit: Dict[str, Any]) -> None:
+        """Grava um circuito na camada em disco de forma atômica."""
+        if self.persist_dir is None:
+            return
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.persist_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(circuit, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
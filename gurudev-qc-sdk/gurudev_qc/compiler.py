@@ -2,11 +2,138 @@
 Compilador Gurudev-QC
 
 Este módulo contém o compilador que traduz código Gurudev para circuitos quânticos.
+
+Além das medições finais (``measure: <qubit>``), a linguagem aceita medições
+no meio do circuito, que gravam o resultado em um bit clássico, e portas
+condicionadas a esse bit (aplicadas quando ele vale 1)::
+
+    measure 0 -> a
+    if a flip 2
+
+No circuito compilado a medição é uma porta ``'MEASURE'`` com o nome do bit
+em ``bit``, as portas condicionais trazem o bit em ``condition`` e os bits
+aparecem, na ordem da primeira medição, em ``classical_bits``.
+
+Programas OpenQASM 2.0 (portas h, x, y, z, cx, rz e measure) são lidos para
+a mesma estrutura por ``import_qasm`` e ``stream_qasm`` (ver
+``gurudev_qc.qasm``); ``write_qasm`` exporta o circuito para um arquivo ou
+fluxo de texto em blocos de linhas, sem montar a saída inteira na memória.
 """
 
+import io
+import os
 import numpy as np
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union, Iterable, Iterator, Tuple
 import json
+from .cache import CircuitCache
+from .ir import CompactCircuit, CompactCircuitBuilder, OP_H, OP_X, OP_Y, OP_Z, OP_RZ, OP_CNOT, OP_U, OP_U2
+from .optimizer import GurudevQCOptimizer, gate_qubits
+from .qasm import QasmReader, split_statements
+
+
+# Linhas QASM montadas antes de cada escrita no destino
+_QASM_CHUNK = 1 << 10
+
+# Linha QASM de cada porta exportável, a partir do dicionário da porta
+_QASM_LINES = {
+    'H': lambda gate: f"h q[{gate['target']}];\n",
+    'X': lambda gate: f"x q[{gate['target']}];\n",
+    'Y': lambda gate: f"y q[{gate['target']}];\n",
+    'Z': lambda gate: f"z q[{gate['target']}];\n",
+    'CNOT': lambda gate: f"cx q[{gate['control']}],q[{gate['target']}];\n",
+    'RZ': lambda gate: f"rz({gate['angle']}) q[{gate['target']}];\n",
+    'MEASURE': lambda gate: f"measure q[{gate['target']}] -> {gate['bit']}[0];\n",
+}
+
+
+def _interned(matrix: np.ndarray) -> np.ndarray:
+    """Marca uma matriz de porta compartilhada como somente leitura."""
+    matrix.setflags(write=False)
+    return matrix
+
+
+# Matrizes das portas fixas, criadas uma única vez
+_HADAMARD = _interned(np.array([[1, 1], [1, -1]]) / np.sqrt(2))
+_PAULI_X = _interned(np.array([[0, 1], [1, 0]]))
+_PAULI_Y = _interned(np.array([[0, -1j], [1j, 0]]))
+_PAULI_Z = _interned(np.array([[1, 0], [0, -1]]))
+_CNOT = _interned(np.array([[1, 0, 0, 0],
+                            [0, 1, 0, 0],
+                            [0, 0, 0, 1],
+                            [0, 0, 1, 0]]))
+
+
+class GurudevQCSyntaxError(ValueError):
+    """
+    Erro de sintaxe em um programa Gurudev-QC, com o número da linha.
+    """
+    
+    def __init__(self, message: str, lineno: int, line: str = ''):
+        """
+        Inicializa o erro.
+        
+        Args:
+            message: Descrição do erro
+            lineno: Número da linha (a partir de 1)
+            line: Conteúdo da linha
+        """
+        self.message = message
+        self.lineno = lineno
+        self.line = line
+        text = f"linha {lineno}: {message}"
+        if line:
+            text += f" ('{line}')"
+        super().__init__(text)
+    
+    def __reduce__(self):
+        return self.__class__, (self.message, self.lineno, self.line)
+
+
+def _parse_int(token: str, description: str) -> int:
+    """Converte um token para inteiro, com uma mensagem de erro descritiva."""
+    try:
+        return int(token)
+    except ValueError:
+        raise ValueError(f"{description} inválido: '{token.strip()}'") from None
+
+
+def _parse_float(token: str, description: str) -> float:
+    """Converte um token para número real, com uma mensagem de erro descritiva."""
+    try:
+        return float(token)
+    except ValueError:
+        raise ValueError(f"{description} inválido: '{token.strip()}'") from None
+
+
+def _register_classical(gate: Dict[str, Any], classical_bits: List[str]) -> None:
+    """
+    Registra o bit de uma medição no meio do circuito e valida condições.
+
+    Args:
+        gate: Porta compilada
+        classical_bits: Bits clássicos já medidos (atualizada no próprio lugar)
+    """
+    if 'condition' in gate and gate['condition'] not in classical_bits:
+        raise ValueError(f"bit clássico '{gate['condition']}' usado antes de ser medido")
+    if gate['gate'] == 'MEASURE' and gate['bit'] not in classical_bits:
+        classical_bits.append(gate['bit'])
+
+
+def _source_lines(source: Union[str, os.PathLike, Iterable[str]]) -> Iterator[str]:
+    """Itera sobre as linhas de um arquivo (caminho) ou de um iterador de linhas."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding='utf-8') as file:
+            yield from file
+    else:
+        yield from source
+
+
+@lru_cache(maxsize=4096)
+def _rotation_z_matrix(angle: float) -> np.ndarray:
+    """Matriz RZ compartilhada para um ângulo."""
+    return _interned(np.array([[np.exp(-1j * angle / 2), 0],
+                               [0, np.exp(1j * angle / 2)]]))
 
 
 class GurudevQCCompiler:
@@ -18,7 +145,16 @@ class GurudevQCCompiler:
     quânticos de forma holística e simbólica.
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[CircuitCache] = None):
+        """
+        Inicializa o compilador.
+        
+        Args:
+            cache: Cache de circuitos compilados (opcional). Circuitos vindos
+                do cache são compartilhados e devem ser tratados como somente
+                leitura.
+        """
+        self.cache = cache
         self.quantum_gates = {
             'H': self._hadamard_gate,
             'X': self._pauli_x_gate,
@@ -35,41 +171,227 @@ class GurudevQCCompiler:
             'entangle': 'CNOT',  # CNOT para emaranhamento
             'rotate': 'RZ',  # Rotação Z
         }
+        
+        self.optimizer = GurudevQCOptimizer(self)
     
-    def compile(self, gurudev_code: str) -> Dict[str, Any]:
+    def compile(self, gurudev_code: str, optimize: int = 0,
+                compact: bool = False) -> Union[Dict[str, Any], CompactCircuit]:
         """
         Compila código Gurudev-QC para um circuito quântico.
         
         Args:
             gurudev_code: Código fonte em Gurudev-QC
+            optimize: Nível de otimização (0 a 3, ver ``gurudev_qc.optimizer``)
+            compact: Se True, retorna um ``CompactCircuit`` (ver ``gurudev_qc.ir``)
             
         Returns:
             Dicionário representando o circuito quântico compilado
+        
+        Erros de sintaxe levantam ``GurudevQCSyntaxError`` com o número da linha.
+        """
+        if self.cache is None:
+            return self._compile(gurudev_code, optimize, compact)
+        
+        key = self.cache.make_key(gurudev_code, optimize=optimize, compact=compact)
+        circuit = self.cache.get(key)
+        if circuit is None:
+            circuit = self._compile(gurudev_code, optimize, compact)
+            self.cache.put(key, circuit)
+        return circuit
+    
+    def _compile(self, gurudev_code: str, optimize: int,
+                 compact: bool = False) -> Union[Dict[str, Any], CompactCircuit]:
+        """Compila o código fonte sem consultar o cache."""
+        return self._build(self._statements(io.StringIO(gurudev_code)), optimize, compact)
+    
+    def _build(self, statements: Iterable[Tuple[int, str, str, Any]], optimize: int,
+               compact: bool = False) -> Union[Dict[str, Any], CompactCircuit]:
+        """
+        Monta o circuito a partir das declarações de ``_statements``.
+        
+        Args:
+            statements: Tuplas (número da linha, linha, tipo, valor)
+            optimize: Nível de otimização
+            compact: Se True, retorna um ``CompactCircuit``
+            
+        Returns:
+            Circuito compilado
         """
-        lines = gurudev_code.strip().split('\n')
         circuit = {
             'qubits': 0,
             'gates': [],
-            'measurements': []
+            'measurements': [],
+            'parameters': [],
+            'classical_bits': []
         }
         
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            if line.startswith('qubits:'):
-                circuit['qubits'] = int(line.split(':')[1].strip())
-            elif line.startswith('measure:'):
-                qubit = int(line.split(':')[1].strip())
-                circuit['measurements'].append(qubit)
+        # Sem otimização, a forma compacta é montada diretamente, sem manter
+        # a lista de dicionários em memória
+        builder = CompactCircuitBuilder() if compact and not optimize else None
+        
+        # O número de qubits pode ser declarado depois das portas, então o
+        # intervalo é verificado no final; basta guardar as linhas em que o
+        # maior qubit usado aumenta, pois a primeira linha fora do intervalo
+        # está sempre entre elas
+        highest: List[Tuple[int, int, str]] = []
+        
+        def track(qubits, lineno, line):
+            for qubit in qubits:
+                if qubit < 0:
+                    raise GurudevQCSyntaxError(f"qubit {qubit} fora do intervalo", lineno, line)
+                if not highest or qubit > highest[-1][0]:
+                    highest.append((qubit, lineno, line))
+        
+        for lineno, line, kind, value in statements:
+            if kind == 'qubits':
+                circuit['qubits'] = value
+            elif kind == 'measure':
+                track((value,), lineno, line)
+                circuit['measurements'].append(value)
             else:
-                gate_info = self._parse_gate(line)
-                if gate_info:
-                    circuit['gates'].append(gate_info)
+                gate_info = value
+                track(gate_qubits(gate_info), lineno, line)
+                try:
+                    _register_classical(gate_info, circuit['classical_bits'])
+                except ValueError as error:
+                    raise GurudevQCSyntaxError(str(error), lineno, line) from None
+                if builder is not None:
+                    builder.append(gate_info)
+                    continue
+                circuit['gates'].append(gate_info)
+                if 'param' in gate_info and gate_info['param'] not in circuit['parameters']:
+                    circuit['parameters'].append(gate_info['param'])
         
+        for qubit, lineno, line in highest:
+            if qubit >= circuit['qubits']:
+                raise GurudevQCSyntaxError(
+                    f"qubit {qubit} fora do intervalo (o programa declara {circuit['qubits']})",
+                    lineno, line)
+        
+        if builder is not None:
+            return builder.build(circuit['qubits'], circuit['measurements'])
+        
+        if optimize:
+            circuit = self.optimizer.optimize(circuit, optimize)
+        
+        if compact:
+            return CompactCircuit.from_circuit(circuit)
         return circuit
     
+    def stream(self, source: Union[str, os.PathLike, Iterable[str]]) -> 'CircuitStream':
+        """
+        Compila um programa Gurudev-QC sob demanda, linha a linha.
+        
+        Diferente de ``compile``, o programa não é carregado inteiro na
+        memória: as portas são produzidas à medida que são consumidas, o que
+        permite ao simulador executá-las enquanto o arquivo é lido (ver
+        ``GurudevQCSimulator.run_stream``). Não há otimização nem cache.
+        
+        Args:
+            source: Caminho do arquivo fonte ou iterador de linhas (ex: um
+                arquivo aberto). Strings são sempre tratadas como caminhos.
+            
+        Returns:
+            Fluxo de portas do programa
+        """
+        return CircuitStream(self, source)
+    
+    def import_qasm(self, qasm_code: str, optimize: int = 0,
+                    compact: bool = False) -> Union[Dict[str, Any], CompactCircuit]:
+        """
+        Converte um programa OpenQASM 2.0 para um circuito compilado.
+        
+        Args:
+            qasm_code: Código fonte OpenQASM 2.0
+            optimize: Nível de otimização (0 a 3, ver ``gurudev_qc.optimizer``)
+            compact: Se True, retorna um ``CompactCircuit``
+            
+        Returns:
+            Circuito no mesmo formato de ``compile``
+        
+        Instruções fora do subconjunto aceito (ver ``gurudev_qc.qasm``)
+        levantam ``GurudevQCSyntaxError`` com o número da linha.
+        """
+        if self.cache is None:
+            return self._build(self._qasm_statements(io.StringIO(qasm_code)), optimize, compact)
+        
+        key = self.cache.make_key(qasm_code, optimize=optimize, compact=compact, language='qasm')
+        circuit = self.cache.get(key)
+        if circuit is None:
+            circuit = self._build(self._qasm_statements(io.StringIO(qasm_code)), optimize, compact)
+            self.cache.put(key, circuit)
+        return circuit
+    
+    def stream_qasm(self, source: Union[str, os.PathLike, Iterable[str]]) -> 'CircuitStream':
+        """
+        Lê um programa OpenQASM 2.0 sob demanda, instrução a instrução.
+        
+        Equivalente a ``stream`` para arquivos QASM; o resultado pode ser
+        executado por ``GurudevQCSimulator.run_stream``. As medições finais
+        ficam disponíveis após o consumo de todas as portas.
+        
+        Args:
+            source: Caminho do arquivo QASM ou iterador de linhas. Strings são
+                sempre tratadas como caminhos.
+            
+        Returns:
+            Fluxo de portas do programa
+        """
+        return CircuitStream(self, source, language='qasm')
+    
+    def _qasm_statements(self, lines: Iterable[str]) -> Iterator[Tuple[int, str, str, Any]]:
+        """
+        Analisa as instruções de um programa OpenQASM 2.0 uma a uma.
+        
+        Args:
+            lines: Linhas do código fonte
+            
+        Yields:
+            Tuplas (número da linha, instrução, tipo, valor) no formato de
+            ``_statements``
+        """
+        concepts = {gate: op for op, gate in self.gurudev_mappings.items()}
+        reader = QasmReader(concepts)
+        for lineno, statement in split_statements(lines):
+            try:
+                parsed = reader.parse(statement)
+            except ValueError as error:
+                raise GurudevQCSyntaxError(str(error), lineno, statement) from None
+            for kind, value in parsed:
+                yield lineno, statement, kind, value
+        for kind, value in reader.finish():
+            yield 0, '', kind, value
+    
+    def _statements(self, lines: Iterable[str]) -> Iterator[Tuple[int, str, str, Any]]:
+        """
+        Analisa as linhas de um programa uma a uma.
+        
+        Args:
+            lines: Linhas do código fonte
+            
+        Yields:
+            Tuplas (número da linha, linha, tipo, valor), em que o tipo é
+            'qubits', 'measure' ou 'gate' e o valor é um inteiro ou o
+            dicionário da porta
+        """
+        for lineno, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            try:
+                if line.startswith('qubits:'):
+                    kind, value = 'qubits', _parse_int(line.split(':')[1], 'número de qubits')
+                elif line.startswith('measure:'):
+                    kind, value = 'measure', _parse_int(line.split(':')[1], 'qubit medido')
+                else:
+                    kind, value = 'gate', self._parse_gate(line)
+            except ValueError as error:
+                raise GurudevQCSyntaxError(str(error), lineno, line) from None
+            
+            if value is not None:
+                yield lineno, line, kind, value
+    
     def _parse_gate(self, line: str) -> Optional[Dict[str, Any]]:
         """
         Analisa uma linha de código e extrai informações sobre a porta quântica.
@@ -85,7 +407,12 @@ class GurudevQCCompiler:
             return None
             
         gurudev_op = parts[0]
-        target = int(parts[1])
+        if gurudev_op == 'measure':
+            return self._parse_measurement(parts)
+        if gurudev_op == 'if':
+            return self._parse_conditional(parts)
+        
+        target = _parse_int(parts[1], 'qubit')
         
         if gurudev_op in self.gurudev_mappings:
             quantum_gate = self.gurudev_mappings[gurudev_op]
@@ -97,78 +424,396 @@ class GurudevQCCompiler:
             }
             
             # Para portas de dois qubits como CNOT
-            if quantum_gate == 'CNOT' and len(parts) >= 3:
+            if quantum_gate == 'CNOT':
+                if len(parts) < 3:
+                    raise ValueError(f"'{gurudev_op}' requer qubits de controle e alvo")
                 gate_info['control'] = target
-                gate_info['target'] = int(parts[2])
+                gate_info['target'] = _parse_int(parts[2], 'qubit alvo')
+                if gate_info['control'] == gate_info['target']:
+                    raise ValueError(f"controle e alvo da '{gurudev_op}' devem ser qubits diferentes")
             
-            # Para portas parametrizadas como rotações
-            if quantum_gate == 'RZ' and len(parts) >= 3:
-                gate_info['angle'] = float(parts[2])
+            # Para portas parametrizadas como rotações: ângulo numérico ou
+            # parâmetro simbólico (ex: "rotate 0 theta"), vinculado depois
+            if quantum_gate == 'RZ':
+                if len(parts) < 3:
+                    raise ValueError(f"'{gurudev_op}' requer um ângulo")
+                if parts[2].isidentifier():
+                    gate_info['param'] = parts[2]
+                else:
+                    gate_info['angle'] = _parse_float(parts[2], 'ângulo')
             
             return gate_info
         
         return None
     
+    def _parse_measurement(self, parts: List[str]) -> Dict[str, Any]:
+        """
+        Analisa uma medição no meio do circuito (``measure <qubit> -> <bit>``).
+        
+        Args:
+            parts: Tokens da linha
+            
+        Returns:
+            Dicionário da porta 'MEASURE'
+        """
+        if len(parts) != 4 or parts[2] != '->' or not parts[3].isidentifier():
+            raise ValueError("medição no meio do circuito deve ter a forma 'measure <qubit> -> <bit>'")
+        return {
+            'gate': 'MEASURE',
+            'target': _parse_int(parts[1], 'qubit medido'),
+            'bit': parts[3],
+            'gurudev_concept': 'measure'
+        }
+    
+    def _parse_conditional(self, parts: List[str]) -> Dict[str, Any]:
+        """
+        Analisa uma porta condicional (``if <bit> <operação> <qubits>``).
+        
+        Args:
+            parts: Tokens da linha
+            
+        Returns:
+            Dicionário da porta com o bit de controle em ``condition``
+        """
+        if len(parts) < 3 or not parts[1].isidentifier():
+            raise ValueError("porta condicional deve ter a forma 'if <bit> <operação> <qubits>'")
+        
+        operation = ' '.join(parts[2:])
+        gate_info = self._parse_gate(operation)
+        if gate_info is None or gate_info['gate'] == 'MEASURE' or 'condition' in gate_info:
+            raise ValueError(f"operação condicional inválida: '{operation}'")
+        
+        gate_info['condition'] = parts[1]
+        return gate_info
+    
     def _hadamard_gate(self):
         """Matriz da porta Hadamard"""
-        return np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+        return _HADAMARD
     
     def _pauli_x_gate(self):
         """Matriz da porta Pauli-X"""
-        return np.array([[0, 1], [1, 0]])
+        return _PAULI_X
     
     def _pauli_y_gate(self):
         """Matriz da porta Pauli-Y"""
-        return np.array([[0, -1j], [1j, 0]])
+        return _PAULI_Y
     
     def _pauli_z_gate(self):
         """Matriz da porta Pauli-Z"""
-        return np.array([[1, 0], [0, -1]])
+        return _PAULI_Z
     
     def _cnot_gate(self):
         """Matriz da porta CNOT"""
-        return np.array([[1, 0, 0, 0],
-                        [0, 1, 0, 0],
-                        [0, 0, 0, 1],
-                        [0, 0, 1, 0]])
+        return _CNOT
     
     def _rotation_z_gate(self, angle: float):
         """Matriz da porta de rotação Z"""
-        return np.array([[np.exp(-1j * angle / 2), 0],
-                        [0, np.exp(1j * angle / 2)]])
+        return _rotation_z_matrix(angle)
     
-    def export_qasm(self, circuit: Dict[str, Any]) -> str:
+    def bind(self, circuit: Dict[str, Any], values: Dict[str, float]) -> Dict[str, Any]:
+        """
+        Vincula valores aos parâmetros simbólicos de um circuito.
+        
+        Apenas as portas parametrizadas são copiadas; as demais são
+        compartilhadas com o circuito original.
+        
+        Args:
+            circuit: Circuito compilado com parâmetros simbólicos
+            values: Dicionário {nome do parâmetro: ângulo}
+            
+        Returns:
+            Novo circuito sem parâmetros livres
+        """
+        missing = [name for name in circuit.get('parameters', []) if name not in values]
+        if missing:
+            raise ValueError(f"Parâmetros sem valor: {', '.join(missing)}")
+        
+        gates = []
+        for gate in circuit['gates']:
+            if 'param' in gate:
+                name = gate['param']
+                gate = {key: value for key, value in gate.items() if key != 'param'}
+                gate['angle'] = float(values[name])
+            gates.append(gate)
+        
+        bound = dict(circuit)
+        bound['gates'] = gates
+        bound['parameters'] = []
+        return bound
+    
+    def gate_matrix(self, gate: Dict[str, Any]) -> np.ndarray:
+        """
+        Retorna a matriz unitária de uma porta compilada.
+        
+        Args:
+            gate: Informações da porta
+            
+        Returns:
+            Matriz 2x2 (portas de um qubit) ou 4x4 (portas de dois qubits)
+        """
+        gate_type = gate['gate']
+        
+        if gate_type in ('U', 'U2'):
+            return gate['matrix']
+        if gate_type == 'RZ':
+            return self._rotation_z_gate(gate['angle'])
+        return self.quantum_gates[gate_type]()
+    
+    def export_qasm(self, circuit: Union[Dict[str, Any], CompactCircuit]) -> str:
         """
         Exporta o circuito compilado para formato QASM.
         
         Args:
-            circuit: Circuito quântico compilado
+            circuit: Circuito quântico compilado (dicionário ou ``CompactCircuit``)
             
         Returns:
             Código QASM representando o circuito
         """
-        qasm_code = f"OPENQASM 2.0;\ninclude \"qelib1.inc\";\n"
-        qasm_code += f"qreg q[{circuit['qubits']}];\n"
-        qasm_code += f"creg c[{len(circuit['measurements'])}];\n\n"
+        return ''.join(self._qasm_parts(circuit))
+    
+    def write_qasm(self, circuit: Union[Dict[str, Any], CompactCircuit],
+                   destination: Union[str, os.PathLike, Any]) -> None:
+        """
+        Escreve o circuito compilado em formato QASM em um arquivo ou fluxo.
         
-        for gate in circuit['gates']:
-            if gate['gate'] == 'H':
-                qasm_code += f"h q[{gate['target']}];\n"
-            elif gate['gate'] == 'X':
-                qasm_code += f"x q[{gate['target']}];\n"
-            elif gate['gate'] == 'Y':
-                qasm_code += f"y q[{gate['target']}];\n"
-            elif gate['gate'] == 'Z':
-                qasm_code += f"z q[{gate['target']}];\n"
-            elif gate['gate'] == 'CNOT':
-                qasm_code += f"cx q[{gate['control']}],q[{gate['target']}];\n"
-            elif gate['gate'] == 'RZ':
-                qasm_code += f"rz({gate['angle']}) q[{gate['target']}];\n"
+        As linhas são montadas e escritas em blocos de ``_QASM_CHUNK`` portas,
+        de modo que o tempo é linear no número de portas e a memória não
+        depende do tamanho do circuito. Se uma porta não puder ser exportada,
+        o ValueError é levantado ao chegar ao seu bloco e o destino fica com
+        a saída dos blocos anteriores.
+        
+        Args:
+            circuit: Circuito quântico compilado (dicionário ou ``CompactCircuit``)
+            destination: Caminho do arquivo ou objeto com ``write`` (ex: um
+                arquivo de texto aberto ou ``io.StringIO``)
+        """
+        if isinstance(destination, (str, os.PathLike)):
+            with open(destination, 'w', encoding='utf-8') as file:
+                self.write_qasm(circuit, file)
+            return
         
-        for i, qubit in enumerate(circuit['measurements']):
-            qasm_code += f"measure q[{qubit}] -> c[{i}];\n"
+        for part in self._qasm_parts(circuit):
+            destination.write(part)
+    
+    def _qasm_parts(self, circuit: Union[Dict[str, Any], CompactCircuit]) -> Iterator[str]:
+        """
+        Gera o texto QASM do circuito em partes: cabeçalho, blocos de portas
+        e medições finais.
         
-        return qasm_code
+        Args:
+            circuit: Circuito quântico compilado (dicionário ou ``CompactCircuit``)
+            
+        Yields:
+            Trechos consecutivos do código QASM
+        """
+        header = ["OPENQASM 2.0;\ninclude \"qelib1.inc\";\n",
+                  f"qreg q[{circuit['qubits']}];\n",
+                  f"creg c[{len(circuit['measurements'])}];\n"]
+        # Um registrador de um bit por bit clássico, para as condições if(bit==1)
+        for bit in circuit.get('classical_bits', []):
+            if bit in ('q', 'c'):
+                raise ValueError(f"Bit clássico '{bit}' conflita com os registradores do QASM")
+            header.append(f"creg {bit}[1];\n")
+        header.append("\n")
+        yield ''.join(header)
+        
+        if isinstance(circuit, CompactCircuit):
+            yield from self._compact_qasm_chunks(circuit)
+        else:
+            yield from self._qasm_chunks(circuit['gates'])
+        
+        yield ''.join(
+            f"measure q[{qubit}] -> c[{i}];\n" for i, qubit in enumerate(circuit['measurements'])
+        )
+    
+    def _qasm_chunks(self, gates: List[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Gera as linhas QASM das portas em blocos de ``_QASM_CHUNK`` portas.
+        
+        Args:
+            gates: Portas do circuito compilado
+            
+        Yields:
+            Texto QASM de cada bloco
+        """
+        for start in range(0, len(gates), _QASM_CHUNK):
+            lines = []
+            for gate in gates[start:start + _QASM_CHUNK]:
+                line = _QASM_LINES.get(gate['gate'])
+                if line is None or 'param' in gate:
+                    self._check_exportable(gate)
+                elif 'condition' in gate:
+                    lines.append(f"if({gate['condition']}==1) " + line(gate))
+                else:
+                    lines.append(line(gate))
+            yield ''.join(lines)
+    
+    def _check_exportable(self, gate: Dict[str, Any]) -> None:
+        """Levanta ValueError para portas fundidas e rotações simbólicas."""
+        if 'param' in gate:
+            raise ValueError(
+                f"Parâmetro simbólico '{gate['param']}' sem valor; "
+                "use bind antes de exportar para QASM"
+            )
+        if gate['gate'] in ('U', 'U2'):
+            raise ValueError(
+                f"Porta fundida '{gate['gate']}' não pode ser exportada para QASM; "
+                "compile com optimize <= 1"
+            )
+    
+    def _compact_qasm_chunks(self, circuit: CompactCircuit) -> Iterator[str]:
+        """
+        Gera as linhas QASM das portas de um circuito compacto em blocos.
+        
+        Args:
+            circuit: Circuito compacto
+            
+        Yields:
+            Texto QASM de cada bloco de ``_QASM_CHUNK`` portas
+        """
+        records = circuit.records
+        fused = np.isin(records['op'], (OP_U, OP_U2))
+        if fused.any():
+            raise ValueError(
+                f"Porta fundida '{circuit.gate_dict(int(np.argmax(fused)))['gate']}' não pode "
+                "ser exportada para QASM; compile com optimize <= 1"
+            )
+        symbolic = (records['op'] == OP_RZ) & (records['slot'] >= 0)
+        if symbolic.any():
+            raise ValueError(
+                f"Parâmetro simbólico '{circuit.gate_dict(int(np.argmax(symbolic)))['param']}' "
+                "sem valor; use bind antes de exportar para QASM"
+            )
+        
+        templates = {
+            OP_H: "h q[{1}];\n",
+            OP_X: "x q[{1}];\n",
+            OP_Y: "y q[{1}];\n",
+            OP_Z: "z q[{1}];\n",
+            OP_CNOT: "cx q[{2}],q[{1}];\n",
+            OP_RZ: "rz({3}) q[{1}];\n",
+        }
+        for start in range(0, len(records), _QASM_CHUNK):
+            chunk = records[start:start + _QASM_CHUNK]
+            columns = [chunk[field].tolist() for field in ('op', 'target', 'control', 'angle')]
+            yield ''.join([templates[row[0]].format(*row) for row in zip(*columns)])
+
+
+class CircuitStream:
+    """
+    Programa Gurudev-QC compilado sob demanda, produzido por
+    ``GurudevQCCompiler.stream`` (ou ``stream_qasm``, para OpenQASM 2.0).
+    
+    A declaração ``qubits:`` deve preceder a primeira porta, para que o
+    tamanho do estado seja conhecido antes da execução. As medições e os
+    parâmetros simbólicos são registrados à medida que as linhas são lidas e
+    ficam completos após o consumo de todas as portas. O fluxo só pode ser
+    percorrido uma vez.
+    """
+    
+    def __init__(self, compiler: GurudevQCCompiler, source: Union[str, os.PathLike, Iterable[str]],
+                 language: str = 'gurudev'):
+        """
+        Inicializa o fluxo.
+        
+        Args:
+            compiler: Compilador usado na análise das linhas
+            source: Caminho do arquivo fonte ou iterador de linhas
+            language: Linguagem do código fonte: 'gurudev' ou 'qasm'
+        """
+        if language not in ('gurudev', 'qasm'):
+            raise ValueError(f"Linguagem inválida: '{language}' (use 'gurudev' ou 'qasm')")
+        self.qubits = None
+        self.measurements = []
+        self.parameters = []
+        self.classical_bits = []
+        self.gate_count = 0
+        parse = compiler._qasm_statements if language == 'qasm' else compiler._statements
+        self._statements = parse(_source_lines(source))
+        self._pending = None
+        self._started = False
+        self._consumed = False
+    
+    def header(self) -> int:
+        """
+        Lê as linhas até a primeira porta.
+        
+        Returns:
+            Número de qubits declarado
+        """
+        if not self._started:
+            self._started = True
+            for lineno, line, kind, value in self._statements:
+                if kind == 'gate':
+                    if self.qubits is None:
+                        raise GurudevQCSyntaxError(
+                            "a declaração 'qubits:' deve preceder a primeira porta", lineno, line
+                        )
+                    self._pending = (lineno, line, value)
+                    break
+                self._record(kind, value)
+            if self.qubits is None:
+                self.qubits = 0
+        return self.qubits
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Produz as portas do programa, na ordem do código fonte."""
+        self.header()
+        if self._consumed:
+            raise RuntimeError("O fluxo de portas já foi consumido")
+        self._consumed = True
+        
+        if self._pending is not None:
+            yield self._checked(*self._pending)
+            self._pending = None
+        
+        for lineno, line, kind, value in self._statements:
+            if kind == 'gate':
+                yield self._checked(lineno, line, value)
+            elif kind == 'qubits':
+                raise GurudevQCSyntaxError("'qubits:' redeclarado após as portas", lineno, line)
+            else:
+                self._record(kind, value)
+    
+    def _record(self, kind: str, value: int) -> None:
+        """Registra uma declaração de qubits ou de medição."""
+        if kind == 'qubits':
+            self.qubits = value
+        else:
+            self.measurements.append(value)
+    
+    def _checked(self, lineno: int, line: str, gate: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida os qubits de uma porta e registra o seu parâmetro e bit clássico."""
+        for qubit in gate_qubits(gate):
+            if not 0 <= qubit < self.qubits:
+                raise GurudevQCSyntaxError(
+                    f"qubit {qubit} fora do intervalo (o programa declara {self.qubits})",
+                    lineno, line
+                )
+        try:
+            _register_classical(gate, self.classical_bits)
+        except ValueError as error:
+            raise GurudevQCSyntaxError(str(error), lineno, line) from None
+        if 'param' in gate and gate['param'] not in self.parameters:
+            self.parameters.append(gate['param'])
+        self.gate_count += 1
+        return gate
+    
+    def circuit_info(self) -> Dict[str, Any]:
+        """
+        Resumo do circuito lido até o momento.
+        
+        Returns:
+            Dicionário com qubits, medições, parâmetros, bits clássicos e
+            número de portas (``gate_count``), sem a lista de portas
+        """
+        return {
+            'qubits': self.header(),
+            'measurements': list(self.measurements),
+            'parameters': list(self.parameters),
+            'classical_bits': list(self.classical_bits),
+            'gate_count': self.gate_count,
+        }
 
 
 # Exemplo de uso
@@ -191,4 +836,3 @@ if __name__ == "__main__":
     
     print("\nCódigo QASM:")
     print(compiler.export_qasm(circuit))
-
@@ -0,0 +1,296 @@
+"""
+Representação Compacta de Circuitos Gurudev-QC
+
+Este módulo contém o ``CompactCircuit``, uma representação intermediária em
+que as portas ficam em um array estruturado NumPy com códigos de operação
+inteiros, índices de qubits e posições de parâmetros, em vez de uma lista de
+dicionários. Cada porta ocupa ``GATE_DTYPE.itemsize`` bytes.
+
+O acesso por chave (``circuito['gates']``, ``circuito['qubits']``...) é uma
+visão de compatibilidade que reproduz o formato de dicionário do compilador.
+"""
+
+import math
+from array import array
+from collections.abc import Sequence
+import numpy as np
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Códigos de operação das portas
+OP_H, OP_X, OP_Y, OP_Z, OP_RZ, OP_CNOT, OP_U, OP_U2 = range(8)
+
+GATE_NAMES = ['H', 'X', 'Y', 'Z', 'RZ', 'CNOT', 'U', 'U2']
+OPCODES = {name: opcode for opcode, name in enumerate(GATE_NAMES)}
+
+# op: código da porta; target: qubit alvo; control: controle da CNOT ou
+# primeiro qubit da U2 (-1 se não houver); angle: ângulo da RZ; slot: índice
+# do parâmetro simbólico (RZ) ou da matriz (U/U2), -1 se não houver;
+# concept: índice do conceito Gurudev na tabela de conceitos
+GATE_DTYPE = np.dtype([
+    ('op', np.uint8),
+    ('target', np.int32),
+    ('control', np.int32),
+    ('angle', np.float64),
+    ('slot', np.int32),
+    ('concept', np.int32),
+])
+
+
+class CompactCircuit:
+    """
+    Circuito compilado com as portas em um array estruturado NumPy.
+    """
+
+    __slots__ = ('qubits', 'records', 'measurements', 'parameters',
+                 'matrices', 'concepts', 'metadata')
+
+    def __init__(self, qubits: int, records: np.ndarray, measurements: List[int],
+                 parameters: List[str], matrices: List[np.ndarray], concepts: List[str],
+                 metadata: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa o circuito compacto.
+
+        Args:
+            qubits: Número de qubits
+            records: Array estruturado de portas com dtype ``GATE_DTYPE``
+            measurements: Lista de qubits medidos
+            parameters: Nomes dos parâmetros simbólicos
+            matrices: Tabela de matrizes das portas fundidas (U/U2)
+            concepts: Tabela de conceitos Gurudev
+            metadata: Demais chaves do circuito (ex: optimization)
+        """
+        self.qubits = qubits
+        self.records = records
+        self.measurements = measurements
+        self.parameters = parameters
+        self.matrices = matrices
+        self.concepts = concepts
+        self.metadata = metadata or {}
+
+    @classmethod
+    def from_circuit(cls, circuit: Dict[str, Any]) -> 'CompactCircuit':
+        """
+        Converte um circuito no formato de dicionário.
+
+        Args:
+            circuit: Circuito compilado pelo GurudevQCCompiler
+
+        Returns:
+            Circuito compacto equivalente
+        """
+        builder = CompactCircuitBuilder(circuit.get('parameters', []))
+        for gate in circuit['gates']:
+            builder.append(gate)
+
+        metadata = {
+            key: value for key, value in circuit.items()
+            if key not in ('qubits', 'gates', 'measurements', 'parameters')
+        }
+        return builder.build(circuit['qubits'], list(circuit['measurements']), metadata)
+
+    def to_circuit(self) -> Dict[str, Any]:
+        """
+        Converte para o formato de dicionário do compilador.
+
+        Returns:
+            Circuito com ``gates`` como lista de dicionários
+        """
+        circuit = {
+            'qubits': self.qubits,
+            'gates': list(self.gate_dicts()),
+            'measurements': list(self.measurements),
+            'parameters': list(self.parameters),
+        }
+        circuit.update(self.metadata)
+        return circuit
+
+    def gate_dict(self, index: int) -> Dict[str, Any]:
+        """Retorna a porta de uma posição no formato de dicionário."""
+        return self._record_to_dict(self.records[index])
+
+    def gate_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Itera sobre as portas no formato de dicionário."""
+        for record in self.records:
+            yield self._record_to_dict(record)
+
+    def _record_to_dict(self, record: np.void) -> Dict[str, Any]:
+        """Converte um registro do array na porta em formato de dicionário."""
+        op = int(record['op'])
+        gate = {
+            'gate': GATE_NAMES[op],
+            'target': int(record['target']),
+            'gurudev_concept': self.concepts[record['concept']],
+        }
+
+        if op == OP_CNOT:
+            gate['control'] = int(record['control'])
+        elif op == OP_RZ:
+            if record['slot'] >= 0:
+                gate['param'] = self.parameters[record['slot']]
+            else:
+                gate['angle'] = float(record['angle'])
+        elif op == OP_U:
+            gate['matrix'] = self.matrices[record['slot']]
+        elif op == OP_U2:
+            gate['qubits'] = [int(record['control']), int(record['target'])]
+            gate['matrix'] = self.matrices[record['slot']]
+
+        return gate
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelo array de portas e pelas matrizes."""
+        return self.records.nbytes + sum(matrix.nbytes for matrix in self.matrices)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # Visão de compatibilidade com o formato de dicionário
+
+    def keys(self) -> List[str]:
+        return ['qubits', 'gates', 'measurements', 'parameters'] + list(self.metadata)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'gates':
+            return GateListView(self)
+        if key in ('qubits', 'measurements', 'parameters'):
+            return getattr(self, key)
+        return self.metadata[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def __repr__(self) -> str:
+        return (f"CompactCircuit(qubits={self.qubits}, gates={len(self.records)}, "
+                f"measurements={self.measurements})")
+
+
+class GateListView(Sequence):
+    """
+    Visão somente leitura das portas de um ``CompactCircuit`` como dicionários.
+
+    Os dicionários são criados sob demanda, a cada acesso.
+    """
+
+    def __init__(self, circuit: CompactCircuit):
+        self.circuit = circuit
+
+    def __len__(self) -> int:
+        return len(self.circuit.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.circuit.gate_dict(i) for i in range(*index.indices(len(self)))]
+        return self.circuit.gate_dict(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.circuit.gate_dicts()
+
+
+class CompactCircuitBuilder:
+    """
+    Acumula portas em arrays tipados e produz um ``CompactCircuit``.
+
+    Permite que o compilador gere a representação compacta sem manter a
+    lista de dicionários em memória.
+    """
+
+    def __init__(self, parameters: Optional[List[str]] = None):
+        """
+        Inicializa o construtor.
+
+        Args:
+            parameters: Nomes de parâmetros simbólicos já conhecidos
+        """
+        self.parameters = list(parameters or [])
+        self.matrices = []
+        self.concepts = []
+        self._parameter_index = {name: i for i, name in enumerate(self.parameters)}
+        self._concept_index = {}
+        self._ops = array('B')
+        self._targets = array('i')
+        self._controls = array('i')
+        self._angles = array('d')
+        self._slots = array('i')
+        self._concept_ids = array('i')
+
+    def append(self, gate: Dict[str, Any]) -> None:
+        """
+        Adiciona uma porta no formato de dicionário.
+
+        Args:
+            gate: Informações da porta
+        """
+        if gate['gate'] == 'MEASURE' or 'condition' in gate:
+            raise ValueError(
+                "CompactCircuit não suporta medições no meio do circuito nem portas "
+                "condicionais; compile com compact=False"
+            )
+        op = OPCODES[gate['gate']]
+        control = -1
+        angle = math.nan
+        slot = -1
+
+        if op == OP_CNOT:
+            control = gate['control']
+        elif op == OP_RZ:
+            if 'param' in gate:
+                slot = self._parameter_slot(gate['param'])
+            elif 'angle' in gate:
+                angle = gate['angle']
+            else:
+                raise ValueError(f"Porta rotate sem ângulo no qubit {gate['target']}")
+        elif op in (OP_U, OP_U2):
+            slot = len(self.matrices)
+            self.matrices.append(gate['matrix'])
+            if op == OP_U2:
+                control = gate['qubits'][0]
+
+        self._ops.append(op)
+        self._targets.append(gate['target'])
+        self._controls.append(control)
+        self._angles.append(angle)
+        self._slots.append(slot)
+        self._concept_ids.append(self._concept_slot(gate.get('gurudev_concept', '')))
+
+    def _parameter_slot(self, name: str) -> int:
+        """Índice de um parâmetro simbólico, registrando-o se for novo."""
+        if name not in self._parameter_index:
+            self._parameter_index[name] = len(self.parameters)
+            self.parameters.append(name)
+        return self._parameter_index[name]
+
+    def _concept_slot(self, concept: str) -> int:
+        """Índice de um conceito Gurudev na tabela de conceitos."""
+        if concept not in self._concept_index:
+            self._concept_index[concept] = len(self.concepts)
+            self.concepts.append(concept)
+        return self._concept_index[concept]
+
+    def build(self, qubits: int, measurements: List[int],
+              metadata: Optional[Dict[str, Any]] = None) -> CompactCircuit:
+        """
+        Produz o circuito compacto com as portas acumuladas.
+
+        Args:
+            qubits: Número de qubits
+            measurements: Lista de qubits medidos
+            metadata: Demais chaves do circuito
+
+        Returns:
+            Circuito compacto
+        """
+        records = np.empty(len(self._ops), dtype=GATE_DTYPE)
+        records['op'] = np.frombuffer(self._ops, dtype=np.uint8)
+        records['target'] = np.frombuffer(self._targets, dtype=np.intc)
+        records['control'] = np.frombuffer(self._controls, dtype=np.intc)
+        records['angle'] = np.frombuffer(self._angles, dtype=np.float64)
+        records['slot'] = np.frombuffer(self._slots, dtype=np.intc)
+        records['concept'] = np.frombuffer(self._concept_ids, dtype=np.intc)
+
+        return CompactCircuit(qubits, records, measurements, self.parameters,
+                              self.matrices, self.concepts, metadata)
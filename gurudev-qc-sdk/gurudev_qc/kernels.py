@@ -0,0 +1,430 @@
+"""
+Kernels Vetorizados Gurudev-QC
+
+Este módulo contém os kernels NumPy que aplicam portas de um e dois qubits
+diretamente sobre o vetor de estado, sem laços Python por amplitude.
+
+O vetor de estado é visto como um tensor em que o bit ``q`` do índice
+computacional corresponde ao qubit ``q`` (convenção little-endian usada pelo
+simulador). Todas as funções modificam o estado no próprio lugar e aceitam
+dimensões iniciais extras (por exemplo ``(lote, 2**n)``), o que permite
+reutilizá-las em execuções em lote.
+
+Vetores de estado (unidimensionais) maiores que ``BLOCK_SIZE`` amplitudes
+são percorridos em blocos: cada bloco cobre pares (ou quádruplas) completos
+de amplitudes e os temporários criados têm no máximo o tamanho do bloco. Isso
+mantém o trabalho de cada porta dentro da cache e permite operar sobre
+estados em ``numpy.memmap`` sem cópias do tamanho do estado.
+
+Os coeficientes das portas são convertidos para o dtype do estado, de modo
+que estados ``complex64`` são atualizados inteiramente em precisão simples.
+"""
+
+import numpy as np
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+
+# Número máximo de amplitudes tocadas por bloco (4 MB em complex128)
+BLOCK_SIZE = 1 << 18
+
+
+def _pair_view(state: np.ndarray, target: int) -> np.ndarray:
+    """
+    Retorna uma visão ``(..., blocos, 2, 2**target)`` do estado.
+
+    O eixo de tamanho 2 corresponde ao bit do qubit alvo.
+    """
+    return state.reshape(state.shape[:-1] + (-1, 2, 1 << target))
+
+
+def _two_qubit_view(state: np.ndarray, qubit_a: int, qubit_b: int) -> Tuple[np.ndarray, int, int]:
+    """
+    Retorna uma visão do estado com um eixo de tamanho 2 para cada qubit.
+
+    Returns:
+        Tupla (visão, eixo do qubit_a, eixo do qubit_b)
+    """
+    high, low = max(qubit_a, qubit_b), min(qubit_a, qubit_b)
+    view = state.reshape(state.shape[:-1] + (-1, 2, 1 << (high - low - 1), 2, 1 << low))
+    high_axis, low_axis = view.ndim - 4, view.ndim - 2
+
+    if qubit_a == high:
+        return view, high_axis, low_axis
+    return view, low_axis, high_axis
+
+
+def _pair_blocks(state: np.ndarray, target: int,
+                 block_size: Optional[int] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Percorre os pares de amplitudes do qubit alvo em blocos.
+
+    Yields:
+        Visões (amplitudes com o alvo em |0⟩, amplitudes com o alvo em |1⟩),
+        cada uma com no máximo ``block_size // 2`` elementos
+    """
+    block_size = max(block_size or BLOCK_SIZE, 4)
+    view = _pair_view(state, target)
+    if state.ndim > 1 or state.size <= block_size:
+        yield view[..., 0, :], view[..., 1, :]
+        return
+
+    half = block_size // 2
+    stride = 1 << target
+    if stride <= half:
+        rows = half // stride
+        for start in range(0, view.shape[0], rows):
+            block = view[start:start + rows]
+            yield block[:, 0, :], block[:, 1, :]
+    else:
+        for row in range(view.shape[0]):
+            for start in range(0, stride, half):
+                yield view[row, 0, start:start + half], view[row, 1, start:start + half]
+
+
+def _two_qubit_blocks(state: np.ndarray, qubit_a: int, qubit_b: int,
+                      block_size: Optional[int] = None) -> Iterator[Tuple[np.ndarray, int, int]]:
+    """
+    Percorre as quádruplas de amplitudes de dois qubits em blocos.
+
+    Cada bloco é uma fatia da visão de ``_two_qubit_view`` que preserva os
+    eixos dos dois qubits e tem no máximo ``block_size`` elementos.
+
+    Yields:
+        Tuplas (visão do bloco, eixo do qubit_a, eixo do qubit_b)
+    """
+    block_size = max(block_size or BLOCK_SIZE, 4)
+    view, axis_a, axis_b = _two_qubit_view(state, qubit_a, qubit_b)
+    if state.ndim > 1 or state.size <= block_size:
+        yield view, axis_a, axis_b
+        return
+
+    quarter = block_size // 4
+    outer, _, middle, _, inner = view.shape
+    if inner >= quarter:
+        for row in range(outer):
+            for mid in range(middle):
+                for start in range(0, inner, quarter):
+                    yield view[row:row + 1, :, mid:mid + 1, :, start:start + quarter], axis_a, axis_b
+    elif middle * inner >= quarter:
+        rows = quarter // inner
+        for row in range(outer):
+            for start in range(0, middle, rows):
+                yield view[row:row + 1, :, start:start + rows], axis_a, axis_b
+    else:
+        rows = quarter // (middle * inner)
+        for start in range(0, outer, rows):
+            yield view[start:start + rows], axis_a, axis_b
+
+
+def _index(ndim: int, fixed: Dict[int, int]) -> tuple:
+    """Constrói um índice que fixa os eixos informados e mantém os demais."""
+    index = [slice(None)] * ndim
+    for axis, bit in fixed.items():
+        index[axis] = bit
+    return tuple(index)
+
+
+def _coefficient(gate_matrix: np.ndarray, row: int, col: int, ndim: int) -> np.ndarray:
+    """
+    Extrai um elemento da matriz da porta pronto para broadcasting.
+
+    Matrizes com dimensões de lote (``(lote, 2, 2)``) geram um coeficiente
+    por item do lote.
+    """
+    if gate_matrix.ndim == 2:
+        return gate_matrix[row, col]
+    element = gate_matrix[..., row, col]
+    return np.reshape(element, np.shape(element) + (1,) * ndim)
+
+
+def apply_single_qubit_gate(state: np.ndarray, target: int, gate_matrix: np.ndarray,
+                            block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Aplica uma porta de um qubit ao estado, no próprio lugar.
+
+    Args:
+        state: Vetor de estado (ou lote de vetores) a ser modificado
+        target: Qubit alvo
+        gate_matrix: Matriz 2x2 da porta (ou lote de matrizes 2x2)
+        block_size: Amplitudes por bloco (padrão: ``BLOCK_SIZE``)
+
+    Returns:
+        O próprio vetor de estado
+    """
+    gate_matrix = np.asarray(gate_matrix, dtype=state.dtype)
+    m00, m01, m10, m11 = (
+        _coefficient(gate_matrix, row, col, 2) for row, col in ((0, 0), (0, 1), (1, 0), (1, 1))
+    )
+
+    for amp0, amp1 in _pair_blocks(state, target, block_size):
+        new_amp0 = m00 * amp0 + m01 * amp1
+        amp1 *= m11
+        amp1 += m10 * amp0
+        amp0[...] = new_amp0
+    return state
+
+
+def apply_diagonal_gate(state: np.ndarray, target: int, phase0: complex, phase1: complex) -> np.ndarray:
+    """
+    Aplica uma porta diagonal diag(phase0, phase1) ao estado, no próprio lugar.
+
+    Args:
+        state: Vetor de estado a ser modificado
+        target: Qubit alvo
+        phase0: Fase aplicada às amplitudes com o qubit alvo em |0⟩
+        phase1: Fase aplicada às amplitudes com o qubit alvo em |1⟩
+
+    Returns:
+        O próprio vetor de estado
+    """
+    view = _pair_view(state, target)
+    view[..., 0, :] *= np.asarray(phase0, dtype=state.dtype)
+    view[..., 1, :] *= np.asarray(phase1, dtype=state.dtype)
+    return state
+
+
+def _phase_table(factors: Sequence[Tuple[Tuple[int, ...], np.ndarray]], first: int, count: int,
+                 dtype: np.dtype) -> np.ndarray:
+    """
+    Multiplica, por broadcasting, fatores diagonais sobre os qubits
+    ``first`` a ``first + count - 1`` em um vetor de ``2**count`` fases.
+    """
+    table = np.ones((2,) * count, dtype=dtype)
+    for qubits, phases in factors:
+        # O eixo 0 da tabela corresponde ao qubit mais alto
+        axes = [first + count - 1 - q for q in qubits]
+        shape = [1] * count
+        for axis in axes:
+            shape[axis] = 2
+        values = np.asarray(phases, dtype=dtype).reshape((2,) * len(qubits))
+        table *= values.transpose(np.argsort(axes)).reshape(shape)
+    return table.reshape(-1)
+
+
+def apply_diagonal_run(state: np.ndarray, factors: Sequence[Tuple[Tuple[int, ...], np.ndarray]],
+                       block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Aplica uma sequência de portas diagonais com uma única passada pelo estado.
+
+    Cada fator é um par (qubits, fases), com ``2**len(qubits)`` fases
+    indexadas como na matriz da porta (o primeiro qubit é o bit mais
+    significativo). O estado é visto como uma matriz de 2**(n-m) linhas por
+    2**m colunas (m ≈ n/2): os fatores contidos nos qubits das colunas ou das
+    linhas formam tabelas de fases com 2**m e 2**(n-m) entradas, e cada bloco
+    de linhas é multiplicado pelo produto externo das duas, acrescido dos
+    fatores de dois qubits que cruzam a divisão.
+
+    Args:
+        state: Vetor de estado (ou lote de vetores) a ser modificado
+        factors: Fatores diagonais de um ou dois qubits, em qualquer ordem
+        block_size: Amplitudes por bloco de linhas (padrão: ``BLOCK_SIZE``)
+
+    Returns:
+        O próprio vetor de estado
+    """
+    size = state.shape[-1]
+    num_qubits = size.bit_length() - 1
+    column_qubits = (num_qubits + 1) // 2
+    block_size = block_size or BLOCK_SIZE
+
+    low, high, crossing = [], [], []
+    for qubits, phases in factors:
+        if all(q < column_qubits for q in qubits):
+            low.append((qubits, phases))
+        elif all(q >= column_qubits for q in qubits):
+            high.append((qubits, phases))
+        else:
+            crossing.append((qubits, np.asarray(phases, dtype=state.dtype)))
+    column_phases = _phase_table(low, 0, column_qubits, state.dtype)
+    row_phases = _phase_table(high, column_qubits, num_qubits - column_qubits, state.dtype)
+
+    view = state.reshape(state.shape[:-1] + (size >> column_qubits, 1 << column_qubits))
+    columns = np.arange(1 << column_qubits)
+    step = max(1, block_size >> column_qubits)
+    for start in range(0, view.shape[-2], step):
+        phases = row_phases[start:start + step, None] * column_phases
+        if crossing:
+            rows = np.arange(start, start + phases.shape[0])[:, None]
+            for qubits, values in crossing:
+                index = 0
+                for q in qubits:
+                    bits = (columns >> q) & 1 if q < column_qubits else (rows >> (q - column_qubits)) & 1
+                    index = 2 * index + bits
+                phases *= values[index]
+        view[..., start:start + step, :] *= phases
+    return state
+
+
+def apply_pauli_x(state: np.ndarray, target: int, block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Aplica a porta Pauli-X trocando as amplitudes dos pares, no próprio lugar.
+
+    Args:
+        state: Vetor de estado a ser modificado
+        target: Qubit alvo
+        block_size: Amplitudes por bloco (padrão: ``BLOCK_SIZE``)
+
+    Returns:
+        O próprio vetor de estado
+    """
+    for amp0, amp1 in _pair_blocks(state, target, block_size):
+        saved = amp0.copy()
+        amp0[...] = amp1
+        amp1[...] = saved
+    return state
+
+
+def apply_pauli_y(state: np.ndarray, target: int, block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Aplica a porta Pauli-Y (troca dos pares com fases ∓i), no próprio lugar.
+
+    Args:
+        state: Vetor de estado a ser modificado
+        target: Qubit alvo
+        block_size: Amplitudes por bloco (padrão: ``BLOCK_SIZE``)
+
+    Returns:
+        O próprio vetor de estado
+    """
+    for amp0, amp1 in _pair_blocks(state, target, block_size):
+        saved = amp0.copy()
+        amp0[...] = amp1
+        amp0 *= -1j
+        amp1[...] = saved
+        amp1 *= 1j
+    return state
+
+
+def apply_pauli_z(state: np.ndarray, target: int) -> np.ndarray:
+    """
+    Aplica a porta Pauli-Z invertendo o sinal das amplitudes com o alvo em |1⟩.
+
+    Args:
+        state: Vetor de estado a ser modificado
+        target: Qubit alvo
+
+    Returns:
+        O próprio vetor de estado
+    """
+    view = _pair_view(state, target)
+    view[..., 1, :] *= -1
+    return state
+
+
+def apply_projector(state: np.ndarray, target: int, outcome: int, scale: float = 1.0,
+                    block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Projeta o qubit alvo em um resultado de medição, no próprio lugar.
+
+    As amplitudes incompatíveis com o resultado são zeradas e as demais são
+    multiplicadas por ``scale`` (tipicamente 1/√p, para renormalizar).
+
+    Args:
+        state: Vetor de estado a ser modificado
+        target: Qubit medido
+        outcome: Resultado da medição (0 ou 1)
+        scale: Fator aplicado às amplitudes mantidas
+        block_size: Amplitudes por bloco (padrão: ``BLOCK_SIZE``)
+
+    Returns:
+        O próprio vetor de estado
+    """
+    scale = np.asarray(scale, dtype=state.real.dtype)
+    for amp0, amp1 in _pair_blocks(state, target, block_size):
+        kept, dropped = (amp1, amp0) if outcome else (amp0, amp1)
+        dropped[...] = 0
+        kept *= scale
+    return state
+
+
+def apply_cnot(state: np.ndarray, control: int, target: int,
+               block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Aplica a porta CNOT como uma permutação de amplitudes, no próprio lugar.
+
+    Args:
+        state: Vetor de estado a ser modificado
+        control: Qubit de controle
+        target: Qubit alvo
+        block_size: Amplitudes por bloco (padrão: ``BLOCK_SIZE``)
+
+    Returns:
+        O próprio vetor de estado
+    """
+    for view, control_axis, target_axis in _two_qubit_blocks(state, control, target, block_size):
+        flipped0 = view[_index(view.ndim, {control_axis: 1, target_axis: 0})]
+        flipped1 = view[_index(view.ndim, {control_axis: 1, target_axis: 1})]
+
+        amp0 = flipped0.copy()
+        flipped0[...] = flipped1
+        flipped1[...] = amp0
+    return state
+
+
+def apply_swap(state: np.ndarray, qubit_a: int, qubit_b: int,
+               block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Troca os bits de dois qubits no índice das amplitudes, no próprio lugar.
+
+    Equivale à porta SWAP: apenas as amplitudes com os dois bits diferentes
+    mudam de posição.
+
+    Args:
+        state: Vetor de estado a ser modificado
+        qubit_a: Primeiro qubit
+        qubit_b: Segundo qubit
+        block_size: Amplitudes por bloco (padrão: ``BLOCK_SIZE``)
+
+    Returns:
+        O próprio vetor de estado
+    """
+    for view, axis_a, axis_b in _two_qubit_blocks(state, qubit_a, qubit_b, block_size):
+        amp01 = view[_index(view.ndim, {axis_a: 0, axis_b: 1})]
+        amp10 = view[_index(view.ndim, {axis_a: 1, axis_b: 0})]
+
+        saved = amp01.copy()
+        amp01[...] = amp10
+        amp10[...] = saved
+    return state
+
+
+def apply_two_qubit_gate(state: np.ndarray, qubit_a: int, qubit_b: int, gate_matrix: np.ndarray,
+                         block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Aplica uma porta genérica de dois qubits ao estado, no próprio lugar.
+
+    A matriz 4x4 segue a convenção da matriz CNOT do compilador: o índice da
+    base é ``2 * bit(qubit_a) + bit(qubit_b)``.
+
+    Args:
+        state: Vetor de estado (ou lote de vetores) a ser modificado
+        qubit_a: Qubit mais significativo da matriz (ex: controle da CNOT)
+        qubit_b: Qubit menos significativo da matriz (ex: alvo da CNOT)
+        gate_matrix: Matriz 4x4 da porta (ou lote de matrizes 4x4)
+        block_size: Amplitudes por bloco (padrão: ``BLOCK_SIZE``)
+
+    Returns:
+        O próprio vetor de estado
+    """
+    gate_matrix = np.asarray(gate_matrix, dtype=state.dtype)
+    coefficients = [
+        [_coefficient(gate_matrix, row, col, 3) for col in range(4)]
+        for row in range(4)
+    ]
+
+    for view, axis_a, axis_b in _two_qubit_blocks(state, qubit_a, qubit_b, block_size):
+        blocks = [
+            view[_index(view.ndim, {axis_a: k >> 1, axis_b: k & 1})]
+            for k in range(4)
+        ]
+
+        new_blocks = []
+        for row in range(4):
+            acc = coefficients[row][0] * blocks[0]
+            for col in range(1, 4):
+                acc += coefficients[row][col] * blocks[col]
+            new_blocks.append(acc)
+
+        for block, new_block in zip(blocks, new_blocks):
+            block[...] = new_block
+    return state
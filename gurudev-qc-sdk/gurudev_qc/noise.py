@@ -0,0 +1,351 @@
+"""
+Modelos de Ruído Gurudev-QC
+
+Este módulo define ``NoiseModel``, que associa canais de erro aos tipos de
+porta (pelos nomes Gurudev de ``GurudevQCCompiler.gurudev_mappings``, como
+'harmony' ou 'entangle', ou diretamente pelo tipo, como 'H' ou 'CNOT') e erros
+de leitura às medições, e as funções que aplicam esses canais.
+
+Os canais suportados são canais de Pauli aplicados logo após a porta:
+
+    depolarizing: com probabilidade p aplica um Pauli não trivial uniforme
+        (X, Y ou Z com p/3 cada; nas portas de dois qubits, um dos 15 pares
+        de Paulis diferentes de I⊗I com p/15 cada)
+    bit_flip: com probabilidade p aplica X, independentemente em cada qubit
+        da porta
+
+Os canais são associados às portas do circuito compilado. A otimização de
+nível 1 cancela e funde portas (cada porta resultante recebe os canais do seu
+tipo), e as de nível 2 e 3 substituem sequências de portas por unitárias
+fundidas U e U2; como os canais das portas originais deixariam de ser
+aplicados, o simulador rejeita circuitos com portas fundidas a menos que o
+modelo defina erros para 'U' e 'U2' (ver ``NoiseModel.check_circuit``).
+
+O simulador executa o modelo por trajetórias de Monte Carlo, com um lote de
+trajetórias evoluído como uma matriz (lote × 2**n) e os Paulis sorteados
+aplicados apenas às linhas em que ocorreram, ou, para poucos qubits, pela
+matriz densidade, guardada como um vetor de 2n qubits (bits de linha nos
+qubits n..2n-1 e de coluna nos qubits 0..n-1) e evoluída pelos mesmos kernels.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from . import kernels
+from .compiler import GurudevQCCompiler
+from .ir import GATE_NAMES
+from .optimizer import gate_qubits
+
+
+# Canais de erro de porta disponíveis
+CHANNELS = ('depolarizing', 'bit_flip')
+
+# Número máximo de qubits do método da matriz densidade (4**n amplitudes)
+DENSITY_MATRIX_MAX_QUBITS = 12
+
+# Matrizes de Pauli I, X, Y, Z e os 16 produtos tensoriais de dois qubits
+PAULIS = np.array([
+    [[1, 0], [0, 1]],
+    [[0, 1], [1, 0]],
+    [[0, -1j], [1j, 0]],
+    [[1, 0], [0, -1]],
+], dtype=complex)
+PAULI_PAIRS = np.array([np.kron(first, second) for first in PAULIS for second in PAULIS])
+
+
+def pauli_superoperator(probabilities: Sequence[float]) -> np.ndarray:
+    """
+    Retorna a matriz 4x4 de um canal de Pauli de um qubit sobre a matriz densidade.
+
+    A matriz atua sobre os pares (bit de linha, bit de coluna) do qubit, no
+    índice 2·linha + coluna, e corresponde a ρ → Σ p_P · P ρ P.
+
+    Args:
+        probabilities: Probabilidades (pI, pX, pY, pZ)
+
+    Returns:
+        Matriz 4x4 do canal
+    """
+    p_i, p_x, p_y, p_z = probabilities
+    keep, swap = p_i + p_z, p_x + p_y
+    coherent, crossed = p_i - p_z, p_x - p_y
+    return np.array([
+        [keep, 0, 0, swap],
+        [0, coherent, crossed, 0],
+        [0, crossed, coherent, 0],
+        [swap, 0, 0, keep],
+    ])
+
+
+# Canal totalmente despolarizante de um qubit (ρ → I/2 · Tr ρ)
+_TWIRL = pauli_superoperator((0.25, 0.25, 0.25, 0.25))
+
+
+def _single_qubit_probabilities(channel: str, probability: float) -> np.ndarray:
+    """Probabilidades (pI, pX, pY, pZ) do canal em um único qubit."""
+    if channel == 'depolarizing':
+        return np.array([1 - probability, probability / 3, probability / 3, probability / 3])
+    return np.array([1 - probability, probability, 0.0, 0.0])
+
+
+class NoiseModel:
+    """
+    Modelo de ruído com canais de erro por tipo de porta e erros de leitura.
+    """
+
+    def __init__(self, compiler: Optional[GurudevQCCompiler] = None):
+        """
+        Inicializa um modelo sem ruído.
+
+        Args:
+            compiler: Compilador cujos ``gurudev_mappings`` resolvem os nomes
+                Gurudev das portas (padrão: um ``GurudevQCCompiler`` novo)
+        """
+        compiler = compiler if compiler is not None else GurudevQCCompiler()
+        self.mappings = dict(compiler.gurudev_mappings)
+        self.gate_errors: Dict[str, List[Tuple[str, float]]] = {}
+        self.readout_errors: Dict[Optional[int], Tuple[float, float]] = {}
+
+    def add_depolarizing(self, gate: str, probability: float) -> 'NoiseModel':
+        """
+        Adiciona um canal despolarizante após cada porta do tipo informado.
+
+        Args:
+            gate: Nome Gurudev ('harmony', 'entangle', ...) ou tipo da porta
+            probability: Probabilidade de um erro de Pauli não trivial
+
+        Returns:
+            O próprio modelo, para encadear chamadas
+        """
+        return self._add_error(gate, 'depolarizing', probability)
+
+    def add_bit_flip(self, gate: str, probability: float) -> 'NoiseModel':
+        """
+        Adiciona um canal de inversão de bit após cada porta do tipo informado.
+
+        Args:
+            gate: Nome Gurudev ('harmony', 'entangle', ...) ou tipo da porta
+            probability: Probabilidade de aplicar X em cada qubit da porta
+
+        Returns:
+            O próprio modelo, para encadear chamadas
+        """
+        return self._add_error(gate, 'bit_flip', probability)
+
+    def set_readout_error(self, p0_to_1: float, p1_to_0: Optional[float] = None,
+                          qubits: Optional[Sequence[int]] = None) -> 'NoiseModel':
+        """
+        Define a probabilidade de ler o valor errado de um qubit medido.
+
+        Args:
+            p0_to_1: Probabilidade de ler 1 quando o resultado é 0
+            p1_to_0: Probabilidade de ler 0 quando o resultado é 1 (padrão:
+                igual a ``p0_to_1``)
+            qubits: Qubits afetados (padrão: todos os que não têm um valor
+                próprio)
+
+        Returns:
+            O próprio modelo, para encadear chamadas
+        """
+        p1_to_0 = p0_to_1 if p1_to_0 is None else p1_to_0
+        for probability in (p0_to_1, p1_to_0):
+            _check_probability(probability)
+        for qubit in (None,) if qubits is None else qubits:
+            self.readout_errors[qubit] = (p0_to_1, p1_to_0)
+        return self
+
+    def errors_for(self, gate: Dict[str, Any]) -> List[Tuple[str, float]]:
+        """
+        Retorna os canais aplicados após uma porta compilada.
+
+        Args:
+            gate: Informações da porta
+
+        Returns:
+            Lista de pares (canal, probabilidade)
+        """
+        return self.gate_errors.get(gate['gate'], [])
+
+    def check_circuit(self, circuit: Dict[str, Any]) -> None:
+        """
+        Verifica se os canais de erro do modelo se aplicam às portas do circuito.
+
+        Portas fundidas pela otimização (U e U2) substituem as portas
+        originais, cujos canais não seriam aplicados; elas só são aceitas se
+        o modelo define erros para o seu tipo.
+
+        Args:
+            circuit: Circuito compilado
+
+        Raises:
+            ValueError: Se o circuito tem portas fundidas sem erros definidos
+        """
+        if not self.gate_errors:
+            return
+        for gate in circuit['gates']:
+            if gate['gate'] in ('U', 'U2') and gate['gate'] not in self.gate_errors:
+                raise ValueError(
+                    f"O circuito tem portas fundidas pela otimização ({gate['gate']}), que não "
+                    f"recebem os erros das portas originais; compile com optimize=1 ou menos "
+                    f"ou defina erros para '{gate['gate']}' no modelo de ruído"
+                )
+
+    def readout_probabilities(self, measurement_qubits: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna as probabilidades de erro de leitura de cada medição.
+
+        Args:
+            measurement_qubits: Qubits medidos, na ordem das medições
+
+        Returns:
+            Tupla (p0→1, p1→0) de vetores com um valor por medição
+        """
+        default = self.readout_errors.get(None, (0.0, 0.0))
+        pairs = [self.readout_errors.get(qubit, default) for qubit in measurement_qubits]
+        pairs = np.array(pairs, dtype=np.float64).reshape(-1, 2)
+        return pairs[:, 0], pairs[:, 1]
+
+    def has_readout_error(self) -> bool:
+        """Indica se alguma medição tem probabilidade de erro de leitura não nula."""
+        return any(any(pair) for pair in self.readout_errors.values())
+
+    def _add_error(self, gate: str, channel: str, probability: float) -> 'NoiseModel':
+        """Registra um canal de erro para o tipo de porta resolvido."""
+        _check_probability(probability)
+        gate_type = self.mappings.get(gate, gate)
+        if gate_type not in GATE_NAMES:
+            raise ValueError(
+                f"Porta desconhecida no modelo de ruído: '{gate}' "
+                f"(use {', '.join(self.mappings)} ou {', '.join(GATE_NAMES)})"
+            )
+        self.gate_errors.setdefault(gate_type, []).append((channel, probability))
+        return self
+
+    def __repr__(self) -> str:
+        return f"NoiseModel(gate_errors={self.gate_errors}, readout_errors={self.readout_errors})"
+
+
+def _check_probability(probability: float) -> None:
+    """Valida uma probabilidade de erro."""
+    if not 0.0 <= probability <= 1.0:
+        raise ValueError(f"Probabilidade de erro fora de [0, 1]: {probability}")
+
+
+def apply_trajectory_errors(states: np.ndarray, gate: Dict[str, Any], channel: str,
+                            probability: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    Sorteia e aplica um canal de erro a um lote de trajetórias.
+
+    Apenas as linhas em que um Pauli não trivial foi sorteado são copiadas e
+    atualizadas, com uma única chamada de kernel para todas elas.
+
+    Args:
+        states: Matriz de estados (trajetórias × 2**n), atualizada no lugar
+        gate: Porta após a qual o canal atua
+        channel: 'depolarizing' ou 'bit_flip'
+        probability: Probabilidade do canal
+        rng: Gerador de números aleatórios
+
+    Returns:
+        Matriz de estados atualizada
+    """
+    num_trajectories = states.shape[0]
+    qubits = gate_qubits(gate)
+
+    if channel == 'depolarizing' and len(qubits) == 2:
+        weights = np.full(16, probability / 15)
+        weights[0] = 1 - probability
+        choices = rng.choice(16, size=num_trajectories, p=weights)
+        rows = np.flatnonzero(choices)
+        if rows.size:
+            selected = states[rows]
+            kernels.apply_two_qubit_gate(selected, qubits[0], qubits[1], PAULI_PAIRS[choices[rows]])
+            states[rows] = selected
+        return states
+
+    weights = _single_qubit_probabilities(channel, probability)
+    for qubit in qubits:
+        choices = rng.choice(4, size=num_trajectories, p=weights)
+        rows = np.flatnonzero(choices)
+        if rows.size:
+            selected = states[rows]
+            kernels.apply_single_qubit_gate(selected, qubit, PAULIS[choices[rows]])
+            states[rows] = selected
+    return states
+
+
+def apply_density_errors(rho: np.ndarray, gate: Dict[str, Any], channel: str,
+                         probability: float, num_qubits: int) -> np.ndarray:
+    """
+    Aplica um canal de erro à matriz densidade.
+
+    Args:
+        rho: Matriz densidade como vetor de 2n qubits, atualizada no lugar
+        gate: Porta após a qual o canal atua
+        channel: 'depolarizing' ou 'bit_flip'
+        probability: Probabilidade do canal
+        num_qubits: Número de qubits do circuito
+
+    Returns:
+        Matriz densidade atualizada
+    """
+    qubits = gate_qubits(gate)
+
+    if channel == 'depolarizing' and len(qubits) == 2:
+        # Σ_{P≠I⊗I} PρP / 15 = (16·D(ρ) - ρ) / 15, com D o canal totalmente
+        # despolarizante nos dois qubits
+        twirled = rho.copy()
+        for qubit in qubits:
+            kernels.apply_two_qubit_gate(twirled, qubit + num_qubits, qubit, _TWIRL)
+        weight = 16 * probability / 15
+        rho *= 1 - weight
+        rho += weight * twirled
+        return rho
+
+    superoperator = pauli_superoperator(_single_qubit_probabilities(channel, probability))
+    for qubit in qubits:
+        kernels.apply_two_qubit_gate(rho, qubit + num_qubits, qubit, superoperator)
+    return rho
+
+
+def apply_readout_flips(outcomes: np.ndarray, num_measured: int, p0_to_1: np.ndarray,
+                        p1_to_0: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Inverte aleatoriamente os bits lidos de resultados amostrados.
+
+    Args:
+        outcomes: Resultados codificados como inteiros (primeira medição no
+            bit mais significativo)
+        num_measured: Número de medições
+        p0_to_1: Probabilidade de ler 1 no lugar de 0, por medição
+        p1_to_0: Probabilidade de ler 0 no lugar de 1, por medição
+
+    Returns:
+        Resultados lidos
+    """
+    shifts = np.arange(num_measured - 1, -1, -1, dtype=np.int64)
+    bits = (outcomes[:, None] >> shifts) & 1
+    flips = rng.random(bits.shape) < np.where(bits == 1, p1_to_0, p0_to_1)
+    return outcomes ^ (flips.astype(np.int64) << shifts).sum(axis=1)
+
+
+def apply_readout_confusion(probabilities: np.ndarray, p0_to_1: np.ndarray,
+                            p1_to_0: np.ndarray) -> np.ndarray:
+    """
+    Aplica os erros de leitura a uma distribuição exata de resultados.
+
+    Args:
+        probabilities: Distribuição indexada pelo resultado (2**m valores)
+        p0_to_1: Probabilidade de ler 1 no lugar de 0, por medição
+        p1_to_0: Probabilidade de ler 0 no lugar de 1, por medição
+
+    Returns:
+        Distribuição dos resultados lidos
+    """
+    num_measured = len(p0_to_1)
+    # O eixo k do tensor corresponde à k-ésima medição
+    tensor = probabilities.reshape((2,) * num_measured)
+    for axis in range(num_measured):
+        confusion = np.array([[1 - p0_to_1[axis], p1_to_0[axis]],
+                              [p0_to_1[axis], 1 - p1_to_0[axis]]])
+        tensor = np.moveaxis(np.tensordot(confusion, tensor, axes=([1], [axis])), 0, axis)
+    return tensor.reshape(-1)
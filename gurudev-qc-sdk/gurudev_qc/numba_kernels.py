@@ -0,0 +1,204 @@
+"""
+Kernels Compilados Multithread Gurudev-QC
+
+Versões compiladas com Numba dos kernels de ``gurudev_qc.kernels`` para as
+portas H, X, Y, Z, RZ, CNOT e as unitárias fundidas 2x2 (U) e 4x4 (U2). Cada
+porta percorre o espaço de índices dos pares (ou quádruplas) de amplitudes
+com ``numba.prange``, dividido entre as threads do Numba, com o GIL liberado
+durante todo o laço; cada amplitude é lida e escrita uma única vez, sem os
+temporários dos kernels NumPy. Em estados de 26 qubits ou mais, o trabalho
+de cada porta passa a usar a banda de memória de todos os núcleos.
+
+O Numba é opcional: sem ele (``NUMBA_AVAILABLE`` é False) os métodos de
+``NumbaKernels`` usam os kernels NumPy. Os kernels compilados também não se
+aplicam, e os NumPy são usados, a lotes de estados (``(lote, 2**n)``),
+lotes de matrizes, vetores não contíguos e estados menores que
+``MIN_NATIVE_SIZE`` amplitudes, em que o custo de iniciar as threads supera
+o da porta. A compilação ocorre no primeiro uso de cada kernel e dtype e é
+guardada em cache no disco.
+
+O Numba só é importado quando um kernel compilado é usado pela primeira vez
+(os kernels ficam em ``gurudev_qc._numba_jit``); importar ``gurudev_qc`` não
+carrega o Numba nem altera a sua configuração. Nesse primeiro uso, se nem
+``NUMBA_THREADING_LAYER`` nem ``NUMBA_THREADING_LAYER_PRIORITY`` estão
+definidas, a camada de threads OpenMP passa a ser preferida à TBB, que pode
+travar no encerramento do processo quando os kernels são chamados de outras
+threads Python (por exemplo, pelos workers de ``gurudev_qc.service``).
+
+Cada instância de ``NumbaKernels`` (uma por simulador) serializa as próprias
+chamadas, pois cada porta já ocupa todas as suas threads; simuladores
+diferentes executam portas em paralelo. A exceção é a camada 'workqueue' do
+Numba, que não admite chamadas simultâneas: com ela (e antes de a camada ser
+escolhida, na primeira chamada) as chamadas de todas as instâncias passam por
+um lock compartilhado.
+"""
+
+import importlib.util
+import os
+import threading
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import kernels
+
+# O Numba está instalado (verificado sem importá-lo)
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# Tamanho mínimo do estado (em amplitudes) para usar os kernels compilados
+MIN_NATIVE_SIZE = 1 << 14
+
+# Serializa as chamadas de todas as instâncias quando a camada de threads não
+# admite chamadas simultâneas
+_SHARED_LOCK = threading.Lock()
+
+# Módulos numba e _numba_jit, carregados por _load
+_loaded = None
+_load_lock = threading.Lock()
+
+
+def _load():
+    """
+    Importa o Numba e os kernels compilados no primeiro uso.
+
+    Returns:
+        Par (módulo ``numba``, módulo ``gurudev_qc._numba_jit``)
+    """
+    global _loaded
+    with _load_lock:
+        if _loaded is None:
+            import numba
+            if 'NUMBA_THREADING_LAYER' not in os.environ \
+                    and 'NUMBA_THREADING_LAYER_PRIORITY' not in os.environ:
+                numba.config.THREADING_LAYER_PRIORITY = ['omp', 'tbb', 'workqueue']
+            from . import _numba_jit
+            _loaded = numba, _numba_jit
+    return _loaded
+
+
+def _concurrent_calls_safe(numba) -> bool:
+    """Indica se a camada de threads ativa admite chamadas simultâneas."""
+    try:
+        return numba.threading_layer() != 'workqueue'
+    except ValueError:
+        # Camada ainda não escolhida (nenhum kernel paralelo executado)
+        return False
+
+
+class NumbaKernels:
+    """
+    Kernels de portas com a mesma interface de ``gurudev_qc.kernels``,
+    executados pelos kernels compilados quando possível.
+    """
+
+    def __init__(self, threads: Optional[int] = None, min_size: int = MIN_NATIVE_SIZE):
+        """
+        Inicializa os kernels.
+
+        Args:
+            threads: Número de threads por porta (padrão: o do Numba,
+                normalmente o número de núcleos; valores acima dele levantam
+                ValueError no primeiro kernel compilado)
+            min_size: Tamanho mínimo do estado para usar os kernels compilados
+        """
+        if threads is not None and threads < 1:
+            raise ValueError(f"Número de threads inválido: {threads}")
+        self.threads = threads
+        self.min_size = min_size
+        self._lock = threading.Lock()
+
+    def _native(self, state: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Retorna o estado como ``numpy.ndarray`` se os kernels compilados se
+        aplicam a ele, ou None para usar os kernels NumPy.
+        """
+        if (not NUMBA_AVAILABLE or state.ndim != 1 or state.size < self.min_size
+                or not state.flags.c_contiguous or state.dtype not in (np.complex64, np.complex128)):
+            return None
+        # Visão sem a subclasse (ex: numpy.memmap), que o Numba não tipa
+        return state.view(np.ndarray)
+
+    def _launch(self, name: str, *args) -> None:
+        """Executa o kernel compilado ``name`` com o número de threads configurado."""
+        numba, jit = _load()
+        available = numba.config.NUMBA_NUM_THREADS
+        if self.threads is not None and self.threads > available:
+            raise ValueError(f"Número de threads inválido: {self.threads} (use 1 a {available})")
+        lock = self._lock if _concurrent_calls_safe(numba) else _SHARED_LOCK
+        with lock:
+            numba.set_num_threads(self.threads or available)
+            getattr(jit, name)(*args)
+
+    def apply_single_qubit_gate(self, state: np.ndarray, target: int, gate_matrix: np.ndarray,
+                                block_size: Optional[int] = None) -> np.ndarray:
+        """Aplica uma porta de um qubit (ver ``kernels.apply_single_qubit_gate``)."""
+        native = self._native(state)
+        gate_matrix = np.asarray(gate_matrix, dtype=state.dtype)
+        if native is None or gate_matrix.ndim != 2:
+            return kernels.apply_single_qubit_gate(state, target, gate_matrix, block_size)
+        self._launch('single_qubit', native, target, gate_matrix[0, 0], gate_matrix[0, 1],
+                     gate_matrix[1, 0], gate_matrix[1, 1])
+        return state
+
+    def apply_diagonal_gate(self, state: np.ndarray, target: int, phase0: complex, phase1: complex) -> np.ndarray:
+        """Aplica uma porta diagonal (ver ``kernels.apply_diagonal_gate``)."""
+        native = self._native(state)
+        if native is None or np.ndim(phase0) or np.ndim(phase1):
+            return kernels.apply_diagonal_gate(state, target, phase0, phase1)
+        self._launch('diagonal', native, target, state.dtype.type(phase0), state.dtype.type(phase1))
+        return state
+
+    def apply_pauli_x(self, state: np.ndarray, target: int, block_size: Optional[int] = None) -> np.ndarray:
+        """Aplica a porta Pauli-X (ver ``kernels.apply_pauli_x``)."""
+        native = self._native(state)
+        if native is None:
+            return kernels.apply_pauli_x(state, target, block_size)
+        self._launch('pauli_x', native, target)
+        return state
+
+    def apply_pauli_y(self, state: np.ndarray, target: int, block_size: Optional[int] = None) -> np.ndarray:
+        """Aplica a porta Pauli-Y (ver ``kernels.apply_pauli_y``)."""
+        native = self._native(state)
+        if native is None:
+            return kernels.apply_pauli_y(state, target, block_size)
+        self._launch('pauli_y', native, target)
+        return state
+
+    def apply_pauli_z(self, state: np.ndarray, target: int) -> np.ndarray:
+        """Aplica a porta Pauli-Z (ver ``kernels.apply_pauli_z``)."""
+        native = self._native(state)
+        if native is None:
+            return kernels.apply_pauli_z(state, target)
+        self._launch('pauli_z', native, target)
+        return state
+
+    def apply_cnot(self, state: np.ndarray, control: int, target: int,
+                   block_size: Optional[int] = None) -> np.ndarray:
+        """Aplica a porta CNOT (ver ``kernels.apply_cnot``)."""
+        native = self._native(state)
+        if native is None:
+            return kernels.apply_cnot(state, control, target, block_size)
+        self._launch('cnot', native, control, target)
+        return state
+
+    def apply_two_qubit_gate(self, state: np.ndarray, qubit_a: int, qubit_b: int, gate_matrix: np.ndarray,
+                             block_size: Optional[int] = None) -> np.ndarray:
+        """Aplica uma porta genérica de dois qubits (ver ``kernels.apply_two_qubit_gate``)."""
+        native = self._native(state)
+        gate_matrix = np.asarray(gate_matrix, dtype=state.dtype)
+        if native is None or gate_matrix.ndim != 2:
+            return kernels.apply_two_qubit_gate(state, qubit_a, qubit_b, gate_matrix, block_size)
+        self._launch('two_qubit', native, qubit_a, qubit_b, np.ascontiguousarray(gate_matrix))
+        return state
+
+    def apply_diagonal_run(self, state: np.ndarray, factors: Sequence[Tuple[Tuple[int, ...], np.ndarray]],
+                           block_size: Optional[int] = None) -> np.ndarray:
+        """
+        Aplica uma sequência de portas diagonais (ver ``kernels.apply_diagonal_run``).
+
+        Usa o kernel NumPy, que já percorre o estado uma única vez.
+        """
+        return kernels.apply_diagonal_run(state, factors, block_size)
+
+    def __repr__(self) -> str:
+        return f"NumbaKernels(threads={self.threads}, native={NUMBA_AVAILABLE})"
@@ -0,0 +1,238 @@
+"""
+Observáveis Gurudev-QC
+
+Este módulo define ``Observable``, uma soma de strings de Pauli com
+coeficientes reais, e as funções usadas para calcular valores esperados e
+gradientes diretamente do vetor de estado.
+
+Um observável pode ser escrito como texto, com os termos separados por
+``+`` ou ``-`` entre espaços, um sinal opcional no início e o coeficiente
+opcional antes de ``*``::
+
+    Observable("Z0 Z1 + 0.5*X2 - Y0")
+    Observable("-Z0 + 0.2")
+
+ou como dicionário {string de Pauli: coeficiente}::
+
+    Observable({"Z0 Z1": 1.0, "X2": 0.5})
+
+Cada fator é uma letra X, Y ou Z seguida do índice do qubit; "I" (ou a
+string vazia) representa a identidade, e um termo formado apenas por um
+número é um múltiplo da identidade (``"Z0 + 0.2"`` equivale a
+``"Z0 + 0.2*I"``).
+"""
+
+import re
+import numpy as np
+from typing import Dict, List, Tuple, Union
+from . import kernels
+from . import sampling
+
+
+# Kernels que aplicam cada Pauli no próprio lugar
+_PAULI_KERNELS = {
+    'X': kernels.apply_pauli_x,
+    'Y': kernels.apply_pauli_y,
+    'Z': kernels.apply_pauli_z,
+}
+
+# Fator de um termo: letra de Pauli seguida do índice do qubit
+_FACTOR = re.compile(r'([XYZ])(\d+)$')
+
+
+class Observable:
+    """
+    Observável hermitiano escrito como soma de strings de Pauli.
+    """
+
+    def __init__(self, terms: Union[str, Dict[str, float], 'Observable']):
+        """
+        Inicializa o observável.
+
+        Args:
+            terms: Texto (ex: "Z0 Z1 + 0.5*X2"), dicionário {string de Pauli:
+                coeficiente} ou outro ``Observable``
+        """
+        # Lista de (coeficiente, ((qubit, Pauli), ...)) com os fatores ordenados por qubit
+        if isinstance(terms, Observable):
+            self.terms = list(terms.terms)
+        elif isinstance(terms, str):
+            self.terms = [_parse_term(text, coefficient) for text, coefficient in _split_terms(terms)]
+        else:
+            self.terms = [_parse_term(text, coefficient) for text, coefficient in terms.items()]
+
+    @property
+    def num_qubits(self) -> int:
+        """Número mínimo de qubits em que o observável atua."""
+        return max((qubit + 1 for _, factors in self.terms for qubit, _ in factors), default=0)
+
+    def apply(self, state: np.ndarray) -> np.ndarray:
+        """
+        Calcula O|ψ⟩ em um novo vetor.
+
+        Args:
+            state: Vetor de estado |ψ⟩
+
+        Returns:
+            Vetor O|ψ⟩
+        """
+        self._check_qubits(state)
+        result = np.zeros(state.shape, dtype=state.dtype)
+        for coefficient, factors in self.terms:
+            term = np.array(state, copy=True)
+            for qubit, pauli in factors:
+                _PAULI_KERNELS[pauli](term, qubit)
+            term *= coefficient
+            result += term
+        return result
+
+    def expectation(self, state: np.ndarray) -> float:
+        """
+        Calcula ⟨ψ|O|ψ⟩.
+
+        Os termos com apenas Z (e a identidade) são calculados a partir das
+        probabilidades do estado, sem copiá-lo; os demais aplicam a string de
+        Pauli a uma cópia do estado.
+
+        Args:
+            state: Vetor de estado |ψ⟩
+
+        Returns:
+            Valor esperado (real)
+        """
+        self._check_qubits(state)
+        num_qubits = state.size.bit_length() - 1
+        probabilities = None
+        value = 0.0
+
+        for coefficient, factors in self.terms:
+            if all(pauli == 'Z' for _, pauli in factors):
+                if probabilities is None:
+                    probabilities = np.abs(state)**2
+                qubits = [qubit for qubit, _ in factors]
+                marginal = sampling.marginalize(probabilities, qubits, num_qubits)
+                value += coefficient * float(np.dot(marginal, _parity_signs(len(qubits))))
+            else:
+                term = np.array(state, copy=True)
+                for qubit, pauli in factors:
+                    _PAULI_KERNELS[pauli](term, qubit)
+                value += coefficient * inner_product(state, term).real
+        return value
+
+    def _check_qubits(self, state: np.ndarray) -> None:
+        """Garante que o observável cabe no número de qubits do estado."""
+        num_qubits = state.size.bit_length() - 1
+        if self.num_qubits > num_qubits:
+            raise ValueError(
+                f"Observável atua em {self.num_qubits} qubits, mas o estado tem {num_qubits}"
+            )
+
+    def __repr__(self) -> str:
+        terms = [f"{coefficient:g}*" + (' '.join(f"{pauli}{qubit}" for qubit, pauli in factors) or 'I')
+                 for coefficient, factors in self.terms]
+        return f"Observable('{' + '.join(terms)}')"
+
+
+def _split_terms(text: str) -> List[Tuple[str, float]]:
+    """
+    Separa o texto de um observável em pares (string de Pauli, coeficiente).
+
+    Um ``+`` ou ``-`` no início do texto, com ou sem espaço depois dele, é o
+    sinal do primeiro termo.
+    """
+    body = text.strip()
+    if not body:
+        raise ValueError("Observável vazio")
+    first_sign = 1.0
+    if body[0] in '+-':
+        first_sign = -1.0 if body[0] == '-' else 1.0
+        body = body[1:].lstrip()
+    pieces = re.split(r'\s+([+-])\s+', body)
+    signs = [first_sign] + [-1.0 if sign == '-' else 1.0 for sign in pieces[1::2]]
+    terms = []
+    for sign, piece in zip(signs, pieces[0::2]):
+        piece = piece.strip()
+        if not piece:
+            raise ValueError(f"Termo vazio no observável: '{text}'")
+        coefficient, _, paulis = piece.rpartition('*')
+        if not coefficient:
+            # Termo constante: múltiplo da identidade
+            try:
+                float(paulis)
+                coefficient, paulis = paulis, ''
+            except ValueError:
+                pass
+        try:
+            value = float(coefficient) if coefficient else 1.0
+        except ValueError:
+            raise ValueError(f"Coeficiente inválido no observável: '{coefficient}'")
+        terms.append((paulis, sign * value))
+    return terms
+
+
+def _parse_term(text: str, coefficient: float) -> Tuple[float, Tuple[Tuple[int, str], ...]]:
+    """Converte uma string de Pauli (ex: "Z0 X2") em fatores ordenados por qubit."""
+    factors = {}
+    for token in text.split():
+        if token == 'I':
+            continue
+        match = _FACTOR.match(token)
+        if match is None:
+            raise ValueError(f"Fator de Pauli inválido: '{token}' (use X, Y ou Z seguido do qubit)")
+        qubit = int(match.group(2))
+        if qubit in factors:
+            raise ValueError(f"Qubit {qubit} repetido no termo '{text}'")
+        factors[qubit] = match.group(1)
+    return float(coefficient), tuple(sorted(factors.items()))
+
+
+def _parity_signs(num_bits: int) -> np.ndarray:
+    """Retorna (-1)**(número de bits 1) para cada inteiro de num_bits bits."""
+    signs = np.ones(1)
+    for _ in range(num_bits):
+        signs = np.concatenate([signs, -signs])
+    return signs
+
+
+def inner_product(bra: np.ndarray, ket: np.ndarray) -> complex:
+    """
+    Calcula ⟨bra|ket⟩ em blocos, acumulando em precisão dupla.
+
+    Args:
+        bra: Vetor conjugado
+        ket: Vetor
+
+    Returns:
+        Produto interno
+    """
+    total = 0j
+    for start in range(0, bra.size, kernels.BLOCK_SIZE):
+        stop = start + kernels.BLOCK_SIZE
+        total += complex(np.vdot(bra[start:stop].astype(np.complex128, copy=False),
+                                 ket[start:stop].astype(np.complex128, copy=False)))
+    return total
+
+
+def z_inner_product(bra: np.ndarray, ket: np.ndarray, target: int) -> complex:
+    """
+    Calcula ⟨bra|Z_target|ket⟩ sem aplicar Z a uma cópia do vetor.
+
+    Args:
+        bra: Vetor conjugado
+        ket: Vetor
+        target: Qubit em que Z atua
+
+    Returns:
+        Produto interno com o sinal de Z em cada amplitude
+    """
+    stride = 1 << target
+    bra_pairs = bra.reshape(-1, 2, stride)
+    ket_pairs = ket.reshape(-1, 2, stride)
+    rows = max(1, kernels.BLOCK_SIZE // (2 * stride))
+
+    total = 0j
+    for start in range(0, bra_pairs.shape[0], rows):
+        bra_block = bra_pairs[start:start + rows].astype(np.complex128, copy=False)
+        ket_block = ket_pairs[start:start + rows].astype(np.complex128, copy=False)
+        total += complex(np.vdot(bra_block[:, 0], ket_block[:, 0]) - np.vdot(bra_block[:, 1], ket_block[:, 1]))
+    return total
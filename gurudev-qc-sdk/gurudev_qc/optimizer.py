@@ -0,0 +1,304 @@
+"""
+Otimizador Gurudev-QC
+
+Este módulo contém os passes de otimização aplicados pelo compilador
+Gurudev-QC sobre a lista de portas de um circuito compilado.
+
+Níveis de otimização:
+    0: nenhuma otimização (lista de portas literal)
+    1: cancela pares inversos adjacentes e funde rotações RZ consecutivas
+    2: nível 1 + funde sequências de portas de um qubit em uma matriz 2x2 ('U')
+    3: nível 2 + absorve portas de um qubit nas portas de dois qubits vizinhas,
+       formando blocos 4x4 ('U2')
+
+Rotações com parâmetros simbólicos são preservadas e interrompem a fusão no
+seu fio, para que possam ser vinculadas depois sem recompilar. Medições no
+meio do circuito e portas condicionais são barreiras: os passes atuam
+separadamente sobre os trechos entre elas.
+"""
+
+import math
+import numpy as np
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+
+# Portas que são a sua própria inversa
+SELF_INVERSE_GATES = {'H', 'X', 'Y', 'Z', 'CNOT'}
+
+# Troca a ordem dos qubits de uma matriz 4x4
+_SWAP = np.array([[1, 0, 0, 0],
+                  [0, 0, 1, 0],
+                  [0, 1, 0, 0],
+                  [0, 0, 0, 1]])
+
+
+def gate_qubits(gate: Dict[str, Any]) -> Tuple[int, ...]:
+    """
+    Retorna os qubits em que uma porta atua.
+
+    Para portas de dois qubits, a ordem corresponde à ordem da matriz 4x4
+    (controle antes do alvo na CNOT).
+    """
+    if gate['gate'] == 'CNOT':
+        return (gate['control'], gate['target'])
+    if gate['gate'] in ('U2', 'DIAG'):
+        return tuple(gate['qubits'])
+    return (gate['target'],)
+
+
+class GurudevQCOptimizer:
+    """
+    Pipeline de passes de otimização para circuitos Gurudev-QC.
+    """
+
+    def __init__(self, compiler):
+        """
+        Inicializa o otimizador.
+
+        Args:
+            compiler: Compilador usado para obter as matrizes das portas
+        """
+        self.compiler = compiler
+
+    def optimize(self, circuit: Dict[str, Any], level: int = 1) -> Dict[str, Any]:
+        """
+        Aplica os passes de otimização do nível escolhido.
+
+        Args:
+            circuit: Circuito quântico compilado
+            level: Nível de otimização (0 a 3)
+
+        Returns:
+            Novo circuito otimizado, com estatísticas em ``optimization``
+        """
+        if level not in (0, 1, 2, 3):
+            raise ValueError(f"Nível de otimização inválido: {level} (use 0 a 3)")
+
+        gates = []
+        for segment, barrier in self._segments(circuit['gates']):
+            if level >= 1:
+                segment = self._cancel_and_merge(segment)
+            if level >= 2:
+                segment = self._fuse_single_qubit_runs(segment)
+            if level >= 3:
+                segment = self._fuse_two_qubit_blocks(segment)
+            gates.extend(segment)
+            if barrier is not None:
+                gates.append(barrier)
+
+        optimized = dict(circuit)
+        optimized['gates'] = gates
+        optimized['optimization'] = {
+            'level': level,
+            'original_gates': len(circuit['gates']),
+            'optimized_gates': len(gates),
+            'gates_removed': len(circuit['gates']) - len(gates),
+        }
+        return optimized
+
+    def _segments(self, gates: List[Dict[str, Any]]) -> Iterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        """
+        Divide as portas nos trechos entre operações clássicas.
+
+        Yields:
+            Tuplas (portas do trecho, medição ou porta condicional que encerra
+            o trecho, ou None no último trecho)
+        """
+        segment = []
+        for gate in gates:
+            if gate['gate'] == 'MEASURE' or 'condition' in gate:
+                yield segment, gate
+                segment = []
+            else:
+                segment.append(gate)
+        yield segment, None
+
+    def _cancel_and_merge(self, gates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Cancela pares de portas auto-inversas e funde rotações RZ adjacentes.
+
+        Duas portas são adjacentes quando nenhuma outra porta atua em seus
+        qubits entre elas. Cancelamentos em cascata (ex: H X X H) são tratados
+        com uma pilha de portas por qubit.
+        """
+        output = []
+        stacks = {}
+
+        for gate in gates:
+            qubits = gate_qubits(gate)
+            previous = [stacks[q][-1] if stacks.get(q) else None for q in qubits]
+
+            if previous[0] is not None and all(index == previous[0] for index in previous):
+                index = previous[0]
+                last_gate = output[index]
+
+                if self._is_inverse_pair(last_gate, gate):
+                    output[index] = None
+                    for qubit in qubits:
+                        stacks[qubit].pop()
+                    continue
+
+                if self._is_mergeable_rotation(last_gate, gate):
+                    angle = last_gate['angle'] + gate['angle']
+                    if math.isclose(math.remainder(angle, 4 * math.pi), 0.0, abs_tol=1e-12):
+                        output[index] = None
+                        stacks[gate['target']].pop()
+                    else:
+                        output[index] = dict(last_gate, angle=angle)
+                    continue
+
+            output.append(gate)
+            for qubit in qubits:
+                stacks.setdefault(qubit, []).append(len(output) - 1)
+
+        return [gate for gate in output if gate is not None]
+
+    def _is_inverse_pair(self, first: Dict[str, Any], second: Dict[str, Any]) -> bool:
+        """Verifica se duas portas adjacentes se cancelam."""
+        return (
+            first['gate'] == second['gate']
+            and first['gate'] in SELF_INVERSE_GATES
+            and gate_qubits(first) == gate_qubits(second)
+        )
+
+    def _is_mergeable_rotation(self, first: Dict[str, Any], second: Dict[str, Any]) -> bool:
+        """Verifica se duas rotações RZ adjacentes podem ser somadas."""
+        return (
+            first['gate'] == 'RZ' and second['gate'] == 'RZ'
+            and first['target'] == second['target']
+            and 'angle' in first and 'angle' in second
+        )
+
+    def _fuse_single_qubit_runs(self, gates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Funde cada sequência de portas de um qubit no mesmo fio em uma porta 'U'.
+
+        As portas de um qubit ficam pendentes por fio e são emitidas, já
+        fundidas, antes da próxima porta de dois qubits que atua no fio.
+        """
+        output = []
+        pending = {}
+
+        for gate in gates:
+            qubits = gate_qubits(gate)
+            if len(qubits) == 1 and 'param' not in gate:
+                pending.setdefault(qubits[0], []).append(gate)
+                continue
+
+            for qubit in qubits:
+                output.extend(self._fuse_run(pending.pop(qubit, [])))
+            output.append(gate)
+
+        for qubit in sorted(pending):
+            output.extend(self._fuse_run(pending[qubit]))
+
+        return output
+
+    def _fuse_run(self, run: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Funde uma sequência de portas de um qubit em uma única porta 'U'."""
+        if len(run) <= 1:
+            return run
+
+        matrix = self._run_matrix(run)
+        if np.allclose(matrix, np.eye(2)):
+            return []
+
+        return [{
+            'gate': 'U',
+            'target': run[0]['target'],
+            'matrix': matrix,
+            'gurudev_concept': '+'.join(gate['gurudev_concept'] for gate in run),
+        }]
+
+    def _run_matrix(self, run: List[Dict[str, Any]]) -> np.ndarray:
+        """Multiplica as matrizes de uma sequência de portas de um qubit."""
+        matrix = np.eye(2, dtype=complex)
+        for gate in run:
+            matrix = self.compiler.gate_matrix(gate) @ matrix
+        return matrix
+
+    def _fuse_two_qubit_blocks(self, gates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Absorve portas de um qubit nas portas de dois qubits vizinhas.
+
+        Portas de um qubit pendentes antes de uma porta de dois qubits são
+        multiplicadas à sua direita; portas de dois qubits consecutivas no mesmo
+        par de qubits são combinadas em um único bloco; portas de um qubit no fim
+        de um fio são absorvidas pelo último bloco do fio.
+        """
+        output = []
+        pending = {}
+        last_block = {}
+
+        for gate in gates:
+            qubits = gate_qubits(gate)
+            if len(qubits) == 1:
+                if 'param' not in gate:
+                    pending.setdefault(qubits[0], []).append(gate)
+                    continue
+                # Portas com parâmetros simbólicos não têm matriz conhecida e
+                # interrompem a fusão no seu fio
+                output.extend(pending.pop(qubits[0], []))
+                output.append(gate)
+                last_block[qubits[0]] = len(output) - 1
+                continue
+
+            qubit_a, qubit_b = qubits
+            run_a = pending.pop(qubit_a, [])
+            run_b = pending.pop(qubit_b, [])
+            previous = last_block.get(qubit_a)
+            merge = previous is not None and last_block.get(qubit_b) == previous
+
+            if not run_a and not run_b and not merge:
+                output.append(gate)
+                last_block[qubit_a] = last_block[qubit_b] = len(output) - 1
+                continue
+
+            matrix = self.compiler.gate_matrix(gate) @ np.kron(
+                self._run_matrix(run_a), self._run_matrix(run_b)
+            )
+            concepts = [g['gurudev_concept'] for g in run_a + run_b + [gate]]
+
+            if merge:
+                block = output[previous]
+                if gate_qubits(block) != qubits:
+                    matrix = _SWAP @ matrix @ _SWAP
+                    qubit_a, qubit_b = qubit_b, qubit_a
+                matrix = matrix @ self.compiler.gate_matrix(block)
+                concepts = [block['gurudev_concept']] + concepts
+                output[previous] = self._block(qubit_a, qubit_b, matrix, concepts)
+            else:
+                output.append(self._block(qubit_a, qubit_b, matrix, concepts))
+                last_block[qubit_a] = last_block[qubit_b] = len(output) - 1
+
+        for qubit in sorted(pending):
+            run = pending[qubit]
+            if qubit not in last_block or len(gate_qubits(output[last_block[qubit]])) == 1:
+                output.extend(run)
+                continue
+
+            index = last_block[qubit]
+            block = output[index]
+            qubit_a, qubit_b = gate_qubits(block)
+            run_matrix = self._run_matrix(run)
+            if qubit == qubit_a:
+                post = np.kron(run_matrix, np.eye(2))
+            else:
+                post = np.kron(np.eye(2), run_matrix)
+            output[index] = self._block(
+                qubit_a, qubit_b,
+                post @ self.compiler.gate_matrix(block),
+                [block['gurudev_concept']] + [g['gurudev_concept'] for g in run],
+            )
+
+        return output
+
+    def _block(self, qubit_a: int, qubit_b: int, matrix: np.ndarray, concepts: List[str]) -> Dict[str, Any]:
+        """Cria uma porta 'U2' com a matriz 4x4 informada."""
+        return {
+            'gate': 'U2',
+            'target': qubit_b,
+            'qubits': [qubit_a, qubit_b],
+            'matrix': matrix,
+            'gurudev_concept': '+'.join(concepts),
+        }
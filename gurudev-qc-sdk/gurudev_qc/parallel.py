@@ -0,0 +1,253 @@
+"""
+Execução Paralela Gurudev-QC
+
+Este módulo contém o ``ParallelSimulator``, que distribui circuitos
+independentes e blocos de shots entre um pool de processos.
+
+A reprodutibilidade não depende do número de processos: cada circuito e cada
+bloco de shots recebe um fluxo aleatório próprio derivado da semente por
+``numpy.random.SeedSequence.spawn``, e a divisão em blocos depende apenas do
+número de shots e de ``chunk_shots``.
+
+Vetores grandes trafegam entre processos por memória compartilhada
+(``multiprocessing.shared_memory``) em vez de serem serializados com pickle.
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Dict, Any, Optional, Tuple
+from . import sampling
+from .results import SimulationResult
+from .simulator import GurudevQCSimulator
+
+
+def _to_shared(array: np.ndarray) -> Tuple[str, Tuple[int, ...], str]:
+    """
+    Copia um vetor para um novo bloco de memória compartilhada.
+
+    Returns:
+        Descritor (nome do bloco, formato, dtype) do vetor compartilhado
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    shm.close()
+    return shm.name, array.shape, array.dtype.str
+
+
+def _from_shared(descriptor: Tuple[str, Tuple[int, ...], str], unlink: bool = False) -> np.ndarray:
+    """
+    Copia um vetor de um bloco de memória compartilhada.
+
+    Args:
+        descriptor: Descritor retornado por ``_to_shared``
+        unlink: Se True, libera o bloco após a cópia
+
+    Returns:
+        Cópia local do vetor
+    """
+    name, shape, dtype = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        array = np.ndarray(shape, dtype=dtype, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    return array
+
+
+def _release_shared(descriptor: Tuple[str, Tuple[int, ...], str]) -> None:
+    """Libera um bloco de memória compartilhada sem copiar o vetor."""
+    shm = shared_memory.SharedMemory(name=descriptor[0])
+    shm.close()
+    shm.unlink()
+
+
+def _run_circuit_task(circuit: Dict[str, Any], shots: int, seed: np.random.SeedSequence,
+                      shared_state_bytes: int) -> SimulationResult:
+    """Executa um circuito completo em um processo do pool."""
+    # Os circuitos já são divididos entre processos: uma thread por porta
+    simulator = GurudevQCSimulator(shots=shots, seed=np.random.default_rng(seed), threads=1)
+    results = simulator.run(circuit)
+
+    state_vector = results['final_state']
+    if isinstance(state_vector, np.ndarray) and state_vector.nbytes >= shared_state_bytes:
+        results['final_state'] = _to_shared(results['final_state'])
+        results['shared_state'] = True
+    return results
+
+
+def _sample_chunk_task(descriptor: Tuple[str, Tuple[int, ...], str], shots: int,
+                       seed: np.random.SeedSequence) -> np.ndarray:
+    """
+    Sorteia um bloco de shots a partir da distribuição em memória compartilhada.
+
+    Returns:
+        Contagens por resultado do bloco
+    """
+    name, shape, dtype = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        probabilities = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        counts = sampling.sample_counts(probabilities, shots, np.random.default_rng(seed))
+        del probabilities
+    finally:
+        shm.close()
+    return counts
+
+
+class ParallelSimulator:
+    """
+    Executor paralelo para circuitos independentes e grandes contagens de shots.
+    """
+
+    def __init__(self, workers: Optional[int] = None, shots: int = 1024,
+                 seed: Optional[int] = None, chunk_shots: int = 1 << 20,
+                 shared_state_bytes: int = 1 << 20):
+        """
+        Inicializa o executor paralelo.
+
+        Args:
+            workers: Número de processos (padrão: número de CPUs)
+            shots: Número de execuções para estatísticas de medição
+            seed: Semente raiz dos fluxos aleatórios
+            chunk_shots: Número de shots por bloco ao dividir uma medição
+            shared_state_bytes: Tamanho a partir do qual vetores de estado são
+                devolvidos pelos processos via memória compartilhada
+        """
+        self.workers = workers
+        self.shots = shots
+        self.chunk_shots = chunk_shots
+        self.shared_state_bytes = shared_state_bytes
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.simulator = GurudevQCSimulator(shots=shots)
+        self._executor = None
+
+    def __enter__(self) -> 'ParallelSimulator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Pool de processos, criado na primeira utilização."""
+        if self._executor is None:
+            # Os processos herdam o resource_tracker do processo principal, de
+            # modo que blocos compartilhados não sejam liberados quando um
+            # processo do pool termina
+            resource_tracker.ensure_running()
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Encerra o pool de processos."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def run_many(self, circuits: List[Dict[str, Any]]) -> List[SimulationResult]:
+        """
+        Executa circuitos independentes em paralelo.
+
+        Args:
+            circuits: Lista de circuitos compilados
+
+        Returns:
+            Lista de resultados no formato de ``GurudevQCSimulator.run``, na
+            ordem de entrada
+        """
+        seeds = self.seed_sequence.spawn(len(circuits))
+        futures = [
+            self.executor.submit(_run_circuit_task, circuit, self.shots, seed,
+                                 self.shared_state_bytes)
+            for circuit, seed in zip(circuits, seeds)
+        ]
+
+        # Todos os futuros são aguardados mesmo após uma falha, para que os
+        # blocos compartilhados devolvidos pelos demais processos sejam
+        # liberados antes de a exceção ser propagada
+        results = []
+        error = None
+        for future in futures:
+            try:
+                item_results = future.result()
+            except Exception as exc:
+                error = error or exc
+                continue
+            if item_results.pop('shared_state', False):
+                descriptor = item_results['final_state']
+                if error is not None:
+                    _release_shared(descriptor)
+                    continue
+                try:
+                    item_results['final_state'] = _from_shared(descriptor, unlink=True)
+                except Exception as exc:
+                    error = exc
+                    continue
+            results.append(item_results)
+        if error is not None:
+            raise error
+        return results
+
+    def run(self, circuit: Dict[str, Any], shots: Optional[int] = None) -> SimulationResult:
+        """
+        Executa um circuito dividindo os shots em blocos entre os processos.
+
+        O estado é simulado uma única vez e reduzido à distribuição marginal
+        sobre os qubits medidos; essa distribuição (do tamanho do vetor de
+        estado quando todos os qubits são medidos) é colocada em memória
+        compartilhada e cada bloco de shots é sorteado por um processo com o
+        seu próprio fluxo aleatório.
+
+        Args:
+            circuit: Circuito compilado
+            shots: Número de shots (padrão: ``self.shots``)
+
+        Returns:
+            Resultados no formato de ``GurudevQCSimulator.run``
+        """
+        if circuit.get('classical_bits'):
+            raise ValueError("Medições no meio do circuito não são suportadas por run; use run_many")
+
+        self.simulator._check_sampling(shots)
+        shots = self.shots if shots is None else shots
+        state_vector = self.simulator._simulate(circuit)
+        norm_drift = self.simulator._check_norm(state_vector)
+        probabilities = sampling.marginal_probabilities(
+            state_vector, circuit['measurements'], circuit['qubits']
+        )
+        counts = self._sample_parallel(probabilities, shots)
+
+        return SimulationResult({
+            'measurement_counts': sampling.counts_to_dict(counts, len(circuit['measurements'])),
+            'shots': shots,
+            'circuit_info': circuit,
+            'norm_drift': norm_drift,
+            'backend': self.simulator._state_backend(state_vector)
+        }, state_vector)
+
+    def _chunks(self, shots: int) -> List[int]:
+        """Divide os shots em blocos de tamanho fixo."""
+        full, remainder = divmod(shots, self.chunk_shots)
+        return [self.chunk_shots] * full + ([remainder] if remainder else [])
+
+    def _sample_parallel(self, probabilities: np.ndarray, shots: int) -> np.ndarray:
+        """Sorteia os blocos de shots em paralelo e soma as contagens."""
+        chunks = self._chunks(shots)
+        seeds = self.seed_sequence.spawn(len(chunks))
+        descriptor = _to_shared(probabilities)
+
+        try:
+            futures = [
+                self.executor.submit(_sample_chunk_task, descriptor, chunk, seed)
+                for chunk, seed in zip(chunks, seeds)
+            ]
+            counts = np.zeros(len(probabilities), dtype=np.int64)
+            for future in futures:
+                counts += future.result()
+        finally:
+            _release_shared(descriptor)
+
+        return counts
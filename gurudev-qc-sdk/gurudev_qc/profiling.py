@@ -0,0 +1,247 @@
+"""
+Instrumentação do Simulador Gurudev-QC
+
+Este módulo define ``Profiler``, que registra o tempo de parede (e,
+opcionalmente, os bytes alocados) de cada fase de uma execução do simulador
+(compilação, simulação, medição) e de cada porta aplicada::
+
+    simulator = GurudevQCSimulator()
+    with simulator.profile(track_memory=True) as profiler:
+        simulator.run_gurudev_code(code)
+    print(profiler.summary())
+    profiler.save_chrome_trace('trace.json')   # abrir em chrome://tracing
+
+Os eventos de porta registram as operações que o simulador de fato executa
+no caminho normal: sequências de portas diagonais reunidas aparecem como uma
+porta 'DIAG' e, com ``tile_qubits``, cada passo do escalonamento é um evento
+('TILE' para um ladrilho, com o número de portas em ``args``, 'SWAP' para
+uma troca de qubits ou o tipo da porta aplicada ao estado inteiro). Sem um
+profiler ativo, as portas não passam por nenhuma verificação; o custo fica em
+uma verificação de atributo por fase.
+
+Os bytes são medidos com ``tracemalloc`` (que o NumPy alimenta com as suas
+alocações) como o pico de memória alocada acima do início do evento; o
+rastreamento deixa cada alocação mais lenta e por isso fica desligado por
+padrão.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class Profiler:
+    """
+    Registro de eventos cronometrados de execuções do simulador.
+    """
+
+    def __init__(self, track_memory: bool = False,
+                 callback: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Inicializa o profiler.
+
+        Args:
+            track_memory: Se True, registra os bytes alocados em cada evento
+                (ativa o ``tracemalloc`` enquanto o profiler estiver ativo)
+            callback: Função chamada com cada evento assim que ele termina
+        """
+        self.track_memory = track_memory
+        self.callback = callback
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._frames: List[Dict[str, int]] = []
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Ativa o rastreamento de memória, se solicitado."""
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """Desativa o rastreamento de memória iniciado por ``start``."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> 'Profiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @contextmanager
+    def phase(self, name: str, **args) -> Iterator[None]:
+        """
+        Cronometra uma fase da execução.
+
+        Args:
+            name: Nome da fase ('compile', 'simulate', 'measure', ...)
+            **args: Informações adicionais gravadas no evento
+        """
+        start = self._begin()
+        try:
+            yield
+        finally:
+            self._end(name, 'phase', start, args)
+
+    def gate(self, index: int, gate: Dict[str, Any]):
+        """
+        Cronometra a aplicação de uma porta.
+
+        Args:
+            index: Posição da porta na sequência executada
+            gate: Informações da porta
+        """
+        return self.step(gate['gate'], index)
+
+    @contextmanager
+    def step(self, name: str, index: int, **args) -> Iterator[None]:
+        """
+        Cronometra um passo da simulação (uma porta, um ladrilho ou uma troca).
+
+        Args:
+            name: Nome do passo ('H', 'DIAG', 'TILE', 'SWAP', ...)
+            index: Posição do passo na sequência executada
+            **args: Informações adicionais gravadas no evento
+        """
+        start = self._begin()
+        try:
+            yield
+        finally:
+            self._end(name, 'gate', start, {'index': index, **args})
+
+    def _begin(self) -> float:
+        """Abre um evento e retorna o instante inicial."""
+        if self.track_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            # O pico é reiniciado para o novo evento; os eventos abertos
+            # guardam o pico observado até aqui
+            for frame in self._frames:
+                frame['peak'] = max(frame['peak'], peak)
+            tracemalloc.reset_peak()
+            self._frames.append({'base': current, 'peak': current})
+        return time.perf_counter()
+
+    def _end(self, name: str, category: str, start: float, args: Dict[str, Any]) -> None:
+        """Fecha o evento aberto por ``_begin`` e o registra."""
+        duration = time.perf_counter() - start
+        event = {
+            'name': name,
+            'category': category,
+            'start': start - self._origin,
+            'seconds': duration,
+            'args': args,
+        }
+        if self._frames:
+            _, peak = tracemalloc.get_traced_memory()
+            frame = self._frames.pop()
+            frame_peak = max(frame['peak'], peak)
+            for outer in self._frames:
+                outer['peak'] = max(outer['peak'], frame_peak)
+            event['bytes'] = frame_peak - frame['base']
+
+        self.events.append(event)
+        if self.callback is not None:
+            self.callback(event)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Agrega os eventos registrados.
+
+        Returns:
+            Dicionário com ``phases`` e ``gate_types`` ({nome: {'calls',
+            'seconds', 'bytes'}}, com o maior valor de bytes entre as
+            chamadas) e ``gates`` (lista com índice, tipo, segundos e bytes de
+            cada porta aplicada, na ordem de execução)
+        """
+        report = {'phases': {}, 'gate_types': {}, 'gates': []}
+        for event in self.events:
+            group = report['phases'] if event['category'] == 'phase' else report['gate_types']
+            entry = group.setdefault(event['name'], {'calls': 0, 'seconds': 0.0, 'bytes': 0})
+            entry['calls'] += 1
+            entry['seconds'] += event['seconds']
+            entry['bytes'] = max(entry['bytes'], event.get('bytes', 0))
+            if event['category'] == 'gate':
+                report['gates'].append({
+                    'index': event['args']['index'],
+                    'gate': event['name'],
+                    'seconds': event['seconds'],
+                    'bytes': event.get('bytes', 0),
+                })
+        return report
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """
+        Serializa o relatório agregado em JSON.
+
+        Args:
+            path: Se informado, grava o JSON nesse arquivo
+
+        Returns:
+            Texto JSON de ``report()``
+        """
+        text = json.dumps(self.report(), indent=2)
+        if path is not None:
+            with open(path, 'w') as file:
+                file.write(text)
+        return text
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Converte os eventos para o formato Trace Event do Chrome.
+
+        Returns:
+            Dicionário com ``traceEvents`` (eventos completos 'X', em
+            microssegundos), aceito por chrome://tracing e pelo Perfetto
+        """
+        trace_events = []
+        for event in self.events:
+            args = dict(event['args'])
+            if 'bytes' in event:
+                args['bytes'] = event['bytes']
+            trace_events.append({
+                'name': event['name'],
+                'cat': event['category'],
+                'ph': 'X',
+                'ts': event['start'] * 1e6,
+                'dur': event['seconds'] * 1e6,
+                'pid': 0,
+                'tid': 0,
+                'args': args,
+            })
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def save_chrome_trace(self, path: str) -> None:
+        """
+        Grava os eventos em um arquivo Trace Event do Chrome.
+
+        Args:
+            path: Caminho do arquivo JSON
+        """
+        with open(path, 'w') as file:
+            json.dump(self.chrome_trace(), file)
+
+    def summary(self) -> str:
+        """
+        Cria uma tabela textual com o tempo de cada fase e de cada tipo de porta.
+
+        Returns:
+            String com a tabela
+        """
+        report = self.report()
+        output = f"{'evento':<20} {'chamadas':>9} {'tempo (s)':>10} {'pico (bytes)':>13}\n"
+        for title, group in (('Fases', report['phases']), ('Portas', report['gate_types'])):
+            if not group:
+                continue
+            output += f"{title}:\n"
+            for name, entry in sorted(group.items(), key=lambda item: -item[1]['seconds']):
+                output += (f"  {name:<18} {entry['calls']:>9} {entry['seconds']:>10.4f} "
+                           f"{entry['bytes']:>13}\n")
+        return output
+
+    def __repr__(self) -> str:
+        return f"Profiler(events={len(self.events)}, track_memory={self.track_memory})"
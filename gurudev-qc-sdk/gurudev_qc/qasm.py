@@ -0,0 +1,416 @@
+"""
+Leitura de OpenQASM 2.0 Gurudev-QC
+
+Este módulo contém o leitor usado por ``GurudevQCCompiler.import_qasm`` e
+``GurudevQCCompiler.stream_qasm`` para converter programas OpenQASM 2.0 na
+mesma estrutura de circuito produzida pelo compilador. O arquivo é lido
+linha a linha, sem ser carregado inteiro na memória.
+
+Portas aceitas: ``h``, ``x``, ``y``, ``z``, ``cx`` (ou ``CX``), ``rz`` e
+``measure``, com argumentos indexados (``q[3]``) ou registradores inteiros
+(aplicados a cada qubit). Vários ``qreg`` são concatenados na ordem de
+declaração; ``barrier`` é ignorado e ``include`` também (as portas de
+``qelib1.inc`` usadas acima são reconhecidas diretamente). Ângulos de ``rz``
+aceitam números e expressões aritméticas com ``pi``.
+
+Medições:
+    - medições no primeiro registrador clássico declarado são as medições
+      finais do circuito (``measurements``), na ordem dos índices dos bits;
+      nenhuma porta pode atuar depois no qubit medido
+    - medições em outros registradores são medições no meio do circuito
+      (portas ``'MEASURE'``); o bit clássico tem o nome do registrador (ou
+      ``<registrador>_<índice>`` em registradores com mais de um bit)
+    - ``if(<registrador>==1) <porta>`` condiciona a porta a um registrador
+      de um bit medido no meio do circuito
+
+É o formato produzido por ``GurudevQCCompiler.export_qasm``, de modo que a
+exportação seguida da leitura reproduz o circuito.
+"""
+
+import ast
+import math
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Porta QASM -> porta do circuito compilado
+QASM_GATES = {
+    'h': 'H',
+    'x': 'X',
+    'y': 'Y',
+    'z': 'Z',
+    'cx': 'CNOT',
+    'CX': 'CNOT',
+    'rz': 'RZ',
+}
+
+_STATEMENT = re.compile(r'([A-Za-z_]\w*)\s*(?:\((.*)\))?\s*(.*)$', re.S)
+_ARGUMENT = re.compile(r'\s*([A-Za-z_]\w*)\s*(?:\[\s*(\d+)\s*\])?\s*$')
+_REGISTER = re.compile(r'\s*([A-Za-z_]\w*)\s*\[\s*(\d+)\s*\]\s*$')
+# Forma mais comum de uma porta, com um ou dois argumentos indexados
+_INDEXED_GATE = re.compile(
+    r'([A-Za-z]+)\s*(?:\(([^()]*)\))?\s+([A-Za-z_]\w*)\s*\[(\d+)\]'
+    r'(?:\s*,\s*([A-Za-z_]\w*)\s*\[(\d+)\])?\s*$'
+)
+_CONDITION = re.compile(r'\s*if\s*\(\s*([A-Za-z_]\w*)\s*==\s*(\d+)\s*\)\s*(.*)$', re.S)
+
+_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+def _evaluate(node: ast.AST) -> float:
+    """Avalia uma expressão aritmética com números e ``pi``."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return float(node.value)
+    if isinstance(node, ast.Name) and node.id == 'pi':
+        return math.pi
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        return _OPERATORS[type(node.op)](_evaluate(node.left), _evaluate(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _OPERATORS:
+        return _OPERATORS[type(node.op)](_evaluate(node.operand))
+    raise ValueError
+
+
+@lru_cache(maxsize=4096)
+def parse_angle(text: str) -> float:
+    """
+    Converte o ângulo de uma porta QASM para número real.
+
+    Args:
+        text: Número ou expressão com ``pi`` (ex: ``'-pi/4'``, ``'0.5*pi'``)
+
+    Returns:
+        Ângulo em radianos
+    """
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        return _evaluate(ast.parse(text.strip(), mode='eval').body)
+    except (SyntaxError, ValueError, ZeroDivisionError):
+        raise ValueError(f"ângulo inválido: '{text.strip()}'") from None
+
+
+def split_statements(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """
+    Separa as instruções (terminadas em ``;``) de um programa QASM.
+
+    Args:
+        lines: Linhas do código fonte
+
+    Yields:
+        Tuplas (número da linha em que a instrução começa, instrução sem o
+        ``;`` e sem comentários)
+    """
+    pending = ''
+    start = 0
+    for lineno, line in enumerate(lines, 1):
+        if '//' in line:
+            line = line[:line.index('//')]
+        if ';' not in line:
+            if line.strip():
+                if not pending:
+                    start = lineno
+                pending += line
+            continue
+
+        *statements, rest = line.split(';')
+        for statement in statements:
+            if pending:
+                statement, pending = pending + statement, ''
+            else:
+                start = lineno
+            statement = statement.strip()
+            if statement:
+                yield start, statement
+        if rest.strip():
+            start, pending = lineno, rest
+
+    if pending.strip():
+        yield start, pending.strip()
+
+
+class QasmReader:
+    """
+    Converte instruções OpenQASM 2.0 em declarações do circuito compilado.
+
+    Cada instrução produz uma lista de tuplas (tipo, valor) no formato de
+    ``GurudevQCCompiler._statements``: 'qubits' (total de qubits declarados
+    até o momento), 'gate' (dicionário da porta) ou 'measure' (qubit com
+    medição final). As medições finais são produzidas por ``finish``, no fim
+    do programa, ordenadas pelo índice do bit clássico.
+    """
+
+    def __init__(self, concepts: Dict[str, str]):
+        """
+        Inicializa o leitor.
+
+        Args:
+            concepts: Conceito Gurudev de cada porta (ex: ``{'H': 'harmony'}``);
+                portas sem conceito usam o nome QASM
+        """
+        self.concepts = concepts
+        self.qubits = 0
+        self.qregs: Dict[str, Tuple[int, int]] = {}
+        self.cregs: Dict[str, int] = {}
+        self.output_register: Optional[str] = None
+        self.final: Dict[int, int] = {}
+        self.measured: Dict[int, int] = {}
+        self.started = False
+
+    def parse(self, statement: str) -> List[Tuple[str, Any]]:
+        """
+        Converte uma instrução.
+
+        Args:
+            statement: Instrução sem o ``;``
+
+        Returns:
+            Lista de tuplas (tipo, valor); erros levantam ValueError
+        """
+        match = _INDEXED_GATE.match(statement)
+        if match is not None and match.group(1) in QASM_GATES:
+            return [('gate', self._indexed_gate(*match.groups()))]
+
+        condition = None
+        if statement.startswith('if'):
+            match = _CONDITION.match(statement)
+            if match is None:
+                raise ValueError("condição deve ter a forma 'if(<registrador>==1) <porta>'")
+            condition = self._condition(match.group(1), int(match.group(2)))
+            statement = match.group(3)
+
+        match = _STATEMENT.match(statement)
+        if match is None:
+            raise ValueError("instrução inválida")
+        name, arguments, operands = match.groups()
+
+        if condition is None:
+            if name == 'OPENQASM':
+                if not operands.strip().startswith('2'):
+                    raise ValueError(f"versão OpenQASM não suportada: '{operands.strip()}'")
+                return []
+            if name in ('include', 'barrier'):
+                return []
+            if name == 'qreg':
+                return self._qreg(operands)
+            if name == 'creg':
+                self._creg(operands)
+                return []
+
+        if name == 'measure':
+            if condition is not None:
+                raise ValueError("medição condicional não suportada")
+            return self._measure(operands)
+
+        gate = QASM_GATES.get(name)
+        if gate is None:
+            raise ValueError(f"instrução '{name}' não suportada")
+        self.started = True
+
+        concept = self.concepts.get(gate, name)
+        angle = None
+        if gate == 'RZ':
+            if arguments is None:
+                raise ValueError("'rz' requer um ângulo")
+            angle = parse_angle(arguments)
+        elif arguments is not None:
+            raise ValueError(f"'{name}' não recebe parâmetros")
+
+        targets = [self._qubits(operand) for operand in operands.split(',')]
+        statements = []
+        if gate == 'CNOT':
+            if len(targets) != 2:
+                raise ValueError("'cx' requer qubits de controle e alvo")
+            for control, target in self._broadcast(targets):
+                if control == target:
+                    raise ValueError("controle e alvo da 'cx' devem ser qubits diferentes")
+                statements.append(('gate', self._gate(
+                    {'gate': gate, 'target': target, 'gurudev_concept': concept, 'control': control},
+                    condition
+                )))
+            return statements
+
+        if len(targets) != 1:
+            raise ValueError(f"'{name}' requer um qubit")
+        for (target,) in self._broadcast(targets):
+            gate_info = {'gate': gate, 'target': target, 'gurudev_concept': concept}
+            if angle is not None:
+                gate_info['angle'] = angle
+            statements.append(('gate', self._gate(gate_info, condition)))
+        return statements
+
+    def _indexed_gate(self, name: str, arguments: Optional[str], register: str, index: str,
+                      second_register: Optional[str], second_index: Optional[str]) -> Dict[str, Any]:
+        """Converte uma porta sem condição com argumentos indexados (ex: ``cx q[0],q[1]``)."""
+        gate = QASM_GATES[name]
+        qubit = self._indexed_qubit(register, index)
+        gate_info = {'gate': gate, 'target': qubit, 'gurudev_concept': self.concepts.get(gate, name)}
+        if gate == 'CNOT':
+            if second_register is None:
+                raise ValueError("'cx' requer qubits de controle e alvo")
+            target = self._indexed_qubit(second_register, second_index)
+            if target == qubit:
+                raise ValueError("controle e alvo da 'cx' devem ser qubits diferentes")
+            gate_info['target'] = target
+            gate_info['control'] = qubit
+        elif second_register is not None:
+            raise ValueError(f"'{name}' requer um qubit")
+
+        if gate == 'RZ':
+            if arguments is None:
+                raise ValueError("'rz' requer um ângulo")
+            gate_info['angle'] = parse_angle(arguments)
+        elif arguments is not None:
+            raise ValueError(f"'{name}' não recebe parâmetros")
+
+        self.started = True
+        return self._gate(gate_info, None)
+
+    def _indexed_qubit(self, register: str, index: str) -> int:
+        """Resolve um argumento ``registrador[índice]`` para o qubit global."""
+        if register not in self.qregs:
+            raise ValueError(f"registrador quântico '{register}' não declarado")
+        offset, size = self.qregs[register]
+        if int(index) >= size:
+            raise ValueError(f"índice {index} fora do registrador '{register}[{size}]'")
+        return offset + int(index)
+
+    def finish(self) -> List[Tuple[str, Any]]:
+        """
+        Encerra a leitura.
+
+        Returns:
+            Medições finais ('measure', qubit), na ordem dos bits clássicos
+        """
+        return [('measure', self.final[bit]) for bit in sorted(self.final)]
+
+    def _qreg(self, operands: str) -> List[Tuple[str, Any]]:
+        """Declara um registrador quântico, concatenado aos anteriores."""
+        match = _REGISTER.match(operands)
+        if match is None:
+            raise ValueError("declaração deve ter a forma 'qreg <nome>[<tamanho>]'")
+        name, size = match.group(1), int(match.group(2))
+        if name in self.qregs or name in self.cregs:
+            raise ValueError(f"registrador '{name}' redeclarado")
+        if self.started:
+            raise ValueError("'qreg' declarado após as portas")
+        self.qregs[name] = (self.qubits, size)
+        self.qubits += size
+        return [('qubits', self.qubits)]
+
+    def _creg(self, operands: str) -> None:
+        """Declara um registrador clássico; o primeiro recebe as medições finais."""
+        match = _REGISTER.match(operands)
+        if match is None:
+            raise ValueError("declaração deve ter a forma 'creg <nome>[<tamanho>]'")
+        name, size = match.group(1), int(match.group(2))
+        if name in self.qregs or name in self.cregs:
+            raise ValueError(f"registrador '{name}' redeclarado")
+        self.cregs[name] = size
+        if self.output_register is None:
+            self.output_register = name
+
+    def _qubits(self, operand: str) -> List[int]:
+        """Resolve um argumento quântico para a lista de qubits (um por índice)."""
+        match = _ARGUMENT.match(operand)
+        if match is None:
+            raise ValueError(f"argumento inválido: '{operand.strip()}'")
+        name, index = match.groups()
+        if name not in self.qregs:
+            raise ValueError(f"registrador quântico '{name}' não declarado")
+        offset, size = self.qregs[name]
+        if index is None:
+            return list(range(offset, offset + size))
+        if int(index) >= size:
+            raise ValueError(f"índice {index} fora do registrador '{name}[{size}]'")
+        return [offset + int(index)]
+
+    def _bits(self, operand: str) -> List[Tuple[str, int]]:
+        """Resolve um argumento clássico para a lista de (registrador, índice)."""
+        match = _ARGUMENT.match(operand)
+        if match is None:
+            raise ValueError(f"argumento inválido: '{operand.strip()}'")
+        name, index = match.groups()
+        if name not in self.cregs:
+            raise ValueError(f"registrador clássico '{name}' não declarado")
+        size = self.cregs[name]
+        if index is None:
+            return [(name, bit) for bit in range(size)]
+        if int(index) >= size:
+            raise ValueError(f"índice {index} fora do registrador '{name}[{size}]'")
+        return [(name, int(index))]
+
+    @staticmethod
+    def _broadcast(targets: List[List[int]]) -> Iterator[Tuple[int, ...]]:
+        """Combina argumentos indexados e registradores inteiros, como no QASM."""
+        sizes = {len(qubits) for qubits in targets if len(qubits) != 1}
+        if len(sizes) > 1:
+            raise ValueError("registradores com tamanhos diferentes na mesma instrução")
+        count = sizes.pop() if sizes else 1
+        for position in range(count):
+            yield tuple(qubits[0] if len(qubits) == 1 else qubits[position] for qubits in targets)
+
+    def _gate(self, gate_info: Dict[str, Any], condition: Optional[str]) -> Dict[str, Any]:
+        """Valida que a porta não atua em um qubit com medição final e aplica a condição."""
+        for key in ('control', 'target') if self.measured else ():
+            qubit = gate_info.get(key)
+            if qubit in self.measured:
+                raise ValueError(
+                    f"porta no qubit {qubit} após a sua medição final em "
+                    f"{self.output_register}[{self.measured[qubit]}]; meça em outro "
+                    "registrador para uma medição no meio do circuito"
+                )
+        if condition is not None:
+            gate_info['condition'] = condition
+        return gate_info
+
+    def _condition(self, register: str, value: int) -> str:
+        """Retorna o bit clássico de uma condição ``if(<registrador>==1)``."""
+        if register not in self.cregs:
+            raise ValueError(f"registrador clássico '{register}' não declarado")
+        if register == self.output_register or self.cregs[register] != 1 or value != 1:
+            raise ValueError(
+                "apenas condições 'if(<registrador>==1)' sobre registradores de um bit "
+                "medidos no meio do circuito são suportadas"
+            )
+        return register
+
+    def _measure(self, operands: str) -> List[Tuple[str, Any]]:
+        """Converte uma medição final ou no meio do circuito."""
+        source, arrow, destination = operands.partition('->')
+        if not arrow:
+            raise ValueError("medição deve ter a forma 'measure <qubit> -> <bit>'")
+        qubits = self._qubits(source)
+        bits = self._bits(destination)
+        if len(qubits) != len(bits):
+            raise ValueError("registradores de tamanhos diferentes na medição")
+
+        statements = []
+        for qubit, (register, index) in zip(qubits, bits):
+            if register == self.output_register:
+                if index in self.final:
+                    raise ValueError(f"bit {register}[{index}] medido mais de uma vez")
+                self.final[index] = qubit
+                self.measured[qubit] = index
+                continue
+            self._gate({'target': qubit}, None)
+            self.started = True
+            bit = register if self.cregs[register] == 1 else f"{register}_{index}"
+            statements.append(('gate', {
+                'gate': 'MEASURE',
+                'target': qubit,
+                'bit': bit,
+                'gurudev_concept': 'measure',
+            }))
+        return statements
@@ -0,0 +1,370 @@
+"""
+Resultados de Simulação Gurudev-QC
+
+Este módulo contém o ``SimulationResult``, retornado por
+``GurudevQCSimulator.run``. Ele se comporta como o dicionário de resultados
+(``resultado['measurement_counts']``, ``resultado['final_state']``...), mas
+o estado final fica guardado sem cópias e é acessado por métodos sob demanda:
+amplitude de uma string de bits, as k maiores amplitudes, iteração em blocos e
+exportação como ``memoryview``, sem calcular probabilidades sobre todo o
+vetor.
+
+Os resultados podem ser gravados em ``.npz`` (com compressão opcional) e
+recarregados; o estado de um arquivo carregado só é lido do disco no primeiro
+acesso e, em arquivos sem compressão, pode ser mapeado em memória sem cópia.
+"""
+
+import json
+import os
+import zipfile
+from collections.abc import MutableMapping
+import numpy as np
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+from . import kernels
+from . import sampling
+from .sparse import SparseState
+
+
+# Campos gravados em JSON no arquivo .npz
+_JSON_FIELDS = ('measurement_counts', 'measurement_probabilities', 'shots',
+                'norm_drift', 'backend', 'classical_counts',
+                'classical_probabilities', 'branches')
+
+# Campos gravados como arrays no arquivo .npz
+_ARRAY_FIELDS = ('measurement_samples', 'parameters', 'density_matrix')
+
+
+def _npz_memmap(path: str, name: str) -> np.memmap:
+    """
+    Mapeia em memória um array gravado sem compressão em um arquivo .npz.
+
+    Args:
+        path: Caminho do arquivo .npz
+        name: Nome do array no arquivo
+
+    Returns:
+        Array somente leitura apoiado no próprio arquivo
+    """
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(f'{name}.npy')
+        if info.compress_type != zipfile.ZIP_STORED:
+            raise ValueError(f"O array '{name}' está comprimido e não pode ser mapeado em memória")
+
+    with open(path, 'rb') as handle:
+        # Cabeçalho local do zip: 30 bytes fixos + nome + campo extra
+        handle.seek(info.header_offset + 26)
+        name_length, extra_length = np.frombuffer(handle.read(4), dtype='<u2')
+        handle.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+        version = np.lib.format.read_magic(handle)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(handle)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(handle)
+        offset = handle.tell()
+
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                     order='F' if fortran_order else 'C')
+
+
+class SimulationResult(MutableMapping):
+    """
+    Resultados de uma simulação, com acesso sob demanda ao estado final.
+
+    O acesso por chave reproduz o dicionário de resultados do simulador;
+    ``final_state`` é o vetor de estado (``numpy.ndarray`` ou
+    ``numpy.memmap``), um ``SparseState`` ou None (backend de
+    estabilizadores).
+    """
+
+    def __init__(self, fields: Dict[str, Any], final_state: Any = None,
+                 state_loader: Optional[Callable[[], Any]] = None):
+        """
+        Inicializa os resultados.
+
+        Args:
+            fields: Demais chaves do resultado (measurement_counts, shots...)
+            final_state: Estado final da simulação
+            state_loader: Função que carrega o estado no primeiro acesso, no
+                lugar de ``final_state``
+        """
+        self._fields = dict(fields)
+        self._state = final_state
+        self._state_loader = state_loader
+
+    @property
+    def final_state(self) -> Any:
+        """Estado final, carregado no primeiro acesso se necessário."""
+        if self._state_loader is not None:
+            self._state = self._state_loader()
+            self._state_loader = None
+        return self._state
+
+    @property
+    def has_state(self) -> bool:
+        """True se o resultado guarda (ou pode carregar) o estado final."""
+        return self._state_loader is not None or self._state is not None
+
+    @property
+    def num_qubits(self) -> int:
+        """Número de qubits do circuito executado."""
+        return self._fields['circuit_info']['qubits']
+
+    # Visão de compatibilidade com o dicionário de resultados
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'final_state':
+            return self.final_state
+        return self._fields[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == 'final_state':
+            self._state = value
+            self._state_loader = None
+        else:
+            self._fields[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key == 'final_state':
+            self._state = None
+            self._state_loader = None
+        else:
+            del self._fields[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield 'final_state'
+        yield from self._fields
+
+    def __len__(self) -> int:
+        return len(self._fields) + 1
+
+    def __contains__(self, key: object) -> bool:
+        return key == 'final_state' or key in self._fields
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'_fields': self._fields, '_state': self.final_state, '_state_loader': None}
+
+    def to_dict(self, include_state: bool = True) -> Dict[str, Any]:
+        """
+        Converte para um dicionário simples.
+
+        Args:
+            include_state: Se False, omite ``final_state`` (útil para enviar
+                ou guardar apenas as medições)
+
+        Returns:
+            Dicionário de resultados
+        """
+        results = {'final_state': self.final_state} if include_state else {}
+        results.update(self._fields)
+        return results
+
+    # Acesso ao estado
+
+    def _require_state(self) -> Union[np.ndarray, SparseState]:
+        """Retorna o estado final ou levanta ValueError se não houver."""
+        state = self.final_state
+        if state is None:
+            raise ValueError(
+                f"O resultado não tem estado final (backend '{self._fields.get('backend')}')"
+            )
+        return state
+
+    def amplitude(self, bitstring: str) -> complex:
+        """
+        Retorna a amplitude de um estado da base computacional.
+
+        Args:
+            bitstring: Estado no formato de ``get_state_probabilities`` (o
+                caractere mais à esquerda é o qubit de maior índice)
+
+        Returns:
+            Amplitude do estado
+        """
+        state = self._require_state()
+        if len(bitstring) != self.num_qubits:
+            raise ValueError(f"A string de bits deve ter {self.num_qubits} caracteres")
+        index = int(bitstring, 2)
+
+        if isinstance(state, SparseState):
+            position = np.flatnonzero(state.indices == index)
+            return complex(state.amplitudes[position[0]]) if position.size else 0j
+        return complex(state[index])
+
+    def top_amplitudes(self, k: int) -> Dict[str, complex]:
+        """
+        Retorna as k amplitudes de maior módulo.
+
+        O estado é percorrido em blocos e apenas os k candidatos de cada bloco
+        são mantidos.
+
+        Args:
+            k: Número de amplitudes
+
+        Returns:
+            Dicionário {string de bits: amplitude}, em ordem decrescente de
+            módulo
+        """
+        state = self._require_state()
+        if isinstance(state, SparseState):
+            indices, amplitudes = state.indices, state.amplitudes
+        else:
+            indices, amplitudes = [], []
+            for start, block in self.iter_chunks():
+                chosen = np.arange(block.size)
+                if k < block.size:
+                    chosen = np.argpartition(np.abs(block), block.size - k)[block.size - k:]
+                indices.append(chosen + start)
+                amplitudes.append(block[chosen])
+            indices, amplitudes = np.concatenate(indices), np.concatenate(amplitudes)
+
+        magnitudes = np.abs(amplitudes)
+        if k < magnitudes.size:
+            chosen = np.argpartition(magnitudes, magnitudes.size - k)[magnitudes.size - k:]
+            indices, amplitudes, magnitudes = indices[chosen], amplitudes[chosen], magnitudes[chosen]
+        order = np.argsort(-magnitudes, kind='stable')
+
+        keys = sampling.outcomes_to_bitstrings(indices[order], self.num_qubits)
+        return dict(zip(keys, amplitudes[order].tolist()))
+
+    def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Percorre o vetor de estado em blocos de amplitudes consecutivas.
+
+        Para estados densos os blocos são visões, sem cópia; estados esparsos
+        são expandidos bloco a bloco.
+
+        Args:
+            chunk_size: Amplitudes por bloco (padrão: ``kernels.BLOCK_SIZE``)
+
+        Yields:
+            Tuplas (índice da primeira amplitude, bloco de amplitudes)
+        """
+        state = self._require_state()
+        chunk_size = chunk_size or kernels.BLOCK_SIZE
+        size = 1 << self.num_qubits
+
+        if not isinstance(state, SparseState):
+            for start in range(0, size, chunk_size):
+                yield start, state[start:start + chunk_size]
+            return
+
+        order = np.argsort(state.indices)
+        indices, amplitudes = state.indices[order], state.amplitudes[order]
+        for start in range(0, size, chunk_size):
+            stop = min(start + chunk_size, size)
+            low, high = np.searchsorted(indices, (start, stop))
+            block = np.zeros(stop - start, dtype=state.dtype)
+            block[indices[low:high] - start] = amplitudes[low:high]
+            yield start, block
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Exporta o vetor de estado denso como ``memoryview``, sem cópia.
+
+        Returns:
+            memoryview sobre o buffer do vetor de estado
+        """
+        state = self._require_state()
+        if isinstance(state, SparseState):
+            raise TypeError("Estados esparsos não têm buffer denso; use iter_chunks")
+        return memoryview(state)
+
+    # Serialização
+
+    def save(self, path: Union[str, os.PathLike], compress: bool = False,
+             include_state: bool = True) -> None:
+        """
+        Grava os resultados em um arquivo .npz.
+
+        As medições (incluindo os bits clássicos e o número de ramos de
+        medições no meio do circuito) e o resumo do circuito (qubits,
+        medições, parâmetros, bits clássicos e número de portas) são
+        gravados em JSON; o estado e os arrays (``measurement_samples``,
+        ``parameters``, ``density_matrix``) são gravados em formato ``.npy``
+        dentro do arquivo.
+
+        Args:
+            path: Caminho do arquivo
+            compress: Se True, comprime os arrays (o estado deixa de poder ser
+                mapeado em memória na leitura)
+            include_state: Se False, omite o estado final
+        """
+        circuit = self._fields['circuit_info']
+        gate_count = circuit['gate_count'] if 'gate_count' in circuit else len(circuit['gates'])
+        metadata = {key: self._fields[key] for key in _JSON_FIELDS if key in self._fields}
+        metadata['circuit_info'] = {
+            'qubits': circuit['qubits'],
+            'measurements': list(circuit['measurements']),
+            'parameters': list(circuit.get('parameters', [])),
+            'classical_bits': list(circuit.get('classical_bits', [])),
+            'gate_count': gate_count,
+        }
+
+        arrays = {key: np.asarray(self._fields[key]) for key in _ARRAY_FIELDS if key in self._fields}
+        state = self.final_state if include_state else None
+        if isinstance(state, SparseState):
+            arrays['sparse_indices'] = state.indices
+            arrays['sparse_amplitudes'] = state.amplitudes
+        elif state is not None:
+            arrays['state'] = state
+        arrays['metadata'] = np.array(json.dumps(metadata))
+
+        writer = np.savez_compressed if compress else np.savez
+        writer(path, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], mmap: bool = False) -> 'SimulationResult':
+        """
+        Carrega resultados gravados por ``save``.
+
+        Sem ``mmap``, o estado só é lido do arquivo no primeiro acesso a
+        ``final_state``.
+
+        Args:
+            path: Caminho do arquivo .npz
+            mmap: Se True, o estado denso é mapeado em memória (somente
+                leitura) em vez de copiado; exige um arquivo sem compressão
+
+        Returns:
+            Resultados carregados; ``circuit_info`` traz o número de portas em
+            ``gate_count`` no lugar da lista de portas
+        """
+        path = os.fspath(path)
+        with np.load(path) as archive:
+            fields = json.loads(archive['metadata'].item())
+            for key in _ARRAY_FIELDS:
+                if key in archive.files:
+                    fields[key] = archive[key]
+            files = set(archive.files)
+
+        if 'state' in files:
+            if mmap:
+                return cls(fields, _npz_memmap(path, 'state'))
+            return cls(fields, state_loader=lambda: cls._read_array(path, 'state'))
+
+        if 'sparse_indices' in files:
+            def load_sparse() -> SparseState:
+                amplitudes = cls._read_array(path, 'sparse_amplitudes')
+                state = SparseState(fields['circuit_info']['qubits'], amplitudes.dtype)
+                state.indices = cls._read_array(path, 'sparse_indices')
+                state.amplitudes = amplitudes
+                return state
+            return cls(fields, state_loader=load_sparse)
+
+        return cls(fields)
+
+    @staticmethod
+    def _read_array(path: str, name: str) -> np.ndarray:
+        """Lê um único array de um arquivo .npz."""
+        with np.load(path) as archive:
+            return archive[name]
+
+    def __repr__(self) -> str:
+        if self._state_loader is not None:
+            state = 'não carregado'
+        elif isinstance(self._state, np.ndarray):
+            state = f"{self._state.size} amplitudes {self._state.dtype}"
+        else:
+            state = repr(self._state)
+        return (f"SimulationResult(backend={self._fields.get('backend')!r}, "
+                f"shots={self._fields.get('shots')}, final_state={state})")
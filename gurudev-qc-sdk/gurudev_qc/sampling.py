@@ -0,0 +1,286 @@
+"""
+Amostragem de Medições Gurudev-QC
+
+Este módulo contém as rotinas de amostragem em lote usadas pelo simulador:
+a distribuição do estado é marginalizada uma única vez sobre os qubits
+medidos e todos os shots são sorteados em uma só chamada.
+
+Os resultados são codificados como inteiros cuja representação binária (com
+um bit por medição, na ordem das medições) é a string de resultado usada em
+``measurement_counts``.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+
+
+# Probabilidades abaixo deste valor são omitidas dos dicionários de resultados
+PROBABILITY_TOLERANCE = 1e-10
+
+
+def marginal_probabilities(state: np.ndarray, measurement_qubits: List[int], num_qubits: int,
+                           block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Calcula a distribuição marginal sobre os qubits medidos.
+
+    Args:
+        state: Vetor de estado
+        measurement_qubits: Lista de qubits medidos (na ordem das medições)
+        num_qubits: Número total de qubits
+        block_size: Se informado, percorre o estado em blocos desse número de
+            amplitudes, sem criar temporários do tamanho do estado
+
+    Returns:
+        Vetor de probabilidades indexado pelo resultado codificado como inteiro
+    """
+    if block_size is not None and state.size > block_size:
+        return _blocked_marginal(state, measurement_qubits, block_size)
+
+    return marginalize(np.abs(state)**2, measurement_qubits, num_qubits)
+
+
+def marginalize(probabilities: np.ndarray, measurement_qubits: List[int], num_qubits: int) -> np.ndarray:
+    """
+    Soma uma distribuição sobre os 2**n estados nos qubits não medidos.
+
+    Aceita dimensões iniciais extras (por exemplo ``(lote, 2**n)``), que são
+    preservadas.
+
+    Args:
+        probabilities: Probabilidades indexadas pelo estado da base computacional
+        measurement_qubits: Lista de qubits medidos (na ordem das medições)
+        num_qubits: Número total de qubits
+
+    Returns:
+        Probabilidades indexadas pelo resultado codificado como inteiro
+    """
+    unique_qubits = list(dict.fromkeys(measurement_qubits))
+    batch_shape = probabilities.shape[:-1]
+    offset = len(batch_shape)
+
+    # O eixo k do tensor (2,)*n corresponde ao qubit n-1-k
+    tensor = probabilities.reshape(batch_shape + (2,) * num_qubits)
+    measured_axes = [num_qubits - 1 - qubit for qubit in unique_qubits]
+    summed_axes = tuple(offset + axis for axis in range(num_qubits) if axis not in measured_axes)
+    marginal = tensor.sum(axis=summed_axes, dtype=np.float64)
+
+    # Após a soma, os eixos restantes ficam em ordem crescente de eixo
+    remaining = sorted(measured_axes)
+    order = list(range(offset)) + [offset + remaining.index(axis) for axis in measured_axes]
+    marginal = np.ascontiguousarray(np.transpose(marginal, order)).reshape(batch_shape + (-1,))
+
+    return _expand_repeated(marginal, measurement_qubits, unique_qubits)
+
+
+def _blocked_marginal(state: np.ndarray, measurement_qubits: List[int], block_size: int) -> np.ndarray:
+    """
+    Acumula a distribuição marginal bloco a bloco com ``np.bincount``.
+
+    O resultado de cada amplitude é montado a partir dos bits do seu índice,
+    o que também trata qubits medidos mais de uma vez.
+    """
+    num_measured = len(measurement_qubits)
+    marginal = np.zeros(2**num_measured)
+
+    for start in range(0, state.size, block_size):
+        block = state[start:start + block_size]
+        indices = np.arange(start, start + block.size)
+        outcomes = np.zeros(block.size, dtype=np.int64)
+        for position, qubit in enumerate(measurement_qubits):
+            outcomes |= ((indices >> qubit) & 1) << (num_measured - 1 - position)
+        marginal += np.bincount(outcomes, weights=block.real**2 + block.imag**2,
+                                minlength=marginal.size)
+
+    return marginal
+
+
+def _expand_repeated(marginal: np.ndarray, measurement_qubits: List[int], unique_qubits: List[int]) -> np.ndarray:
+    """
+    Reindexa a marginal quando um mesmo qubit é medido mais de uma vez.
+
+    Cada medição repetida copia o bit da primeira medição do mesmo qubit.
+    """
+    if len(unique_qubits) == len(measurement_qubits):
+        return marginal
+
+    num_unique = len(unique_qubits)
+    num_measured = len(measurement_qubits)
+    outcomes = np.arange(2**num_unique)
+    expanded_outcomes = np.zeros_like(outcomes)
+    for position, qubit in enumerate(measurement_qubits):
+        bit = (outcomes >> (num_unique - 1 - unique_qubits.index(qubit))) & 1
+        expanded_outcomes |= bit << (num_measured - 1 - position)
+
+    expanded = np.zeros(marginal.shape[:-1] + (2**num_measured,), dtype=marginal.dtype)
+    expanded[..., expanded_outcomes] = marginal
+    return expanded
+
+
+def _normalized(probabilities: np.ndarray) -> np.ndarray:
+    """Renormaliza as probabilidades para absorver erros de arredondamento."""
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    return probabilities / probabilities.sum()
+
+
+def sample_counts(probabilities: np.ndarray, shots: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Sorteia todos os shots de uma vez com uma distribuição multinomial.
+
+    Args:
+        probabilities: Distribuição marginal sobre os resultados
+        shots: Número de shots
+        rng: Gerador de números aleatórios
+
+    Returns:
+        Vetor com a contagem de cada resultado
+    """
+    return rng.multinomial(shots, _normalized(probabilities))
+
+
+def sample_rows(probabilities: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Sorteia um resultado para cada linha de uma matriz de distribuições.
+
+    Args:
+        probabilities: Matriz (lote × resultados), uma distribuição por linha
+        rng: Gerador de números aleatórios
+
+    Returns:
+        Vetor com o resultado sorteado de cada linha
+    """
+    cumulative = np.cumsum(probabilities, axis=-1, dtype=np.float64)
+    thresholds = rng.random(cumulative.shape[0]) * cumulative[:, -1]
+    outcomes = (cumulative < thresholds[:, None]).sum(axis=-1)
+    return np.minimum(outcomes, cumulative.shape[1] - 1)
+
+
+def sample_outcomes(probabilities: np.ndarray, shots: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Sorteia o resultado de cada shot por busca binária na distribuição acumulada.
+
+    Args:
+        probabilities: Distribuição marginal sobre os resultados
+        shots: Número de shots
+        rng: Gerador de números aleatórios
+
+    Returns:
+        Vetor de inteiros com o resultado de cada shot
+    """
+    cumulative = np.cumsum(_normalized(probabilities))
+    outcomes = np.searchsorted(cumulative, rng.random(shots), side='right')
+    return np.minimum(outcomes, len(probabilities) - 1)
+
+
+def bits_to_outcomes(bits: np.ndarray) -> np.ndarray:
+    """
+    Codifica linhas de bits (uma por shot) como resultados inteiros.
+
+    Args:
+        bits: Matriz de bits (shots × medições), primeira medição à esquerda
+
+    Returns:
+        Vetor de resultados; com mais de 62 medições os inteiros não cabem em
+        int64 e o vetor tem dtype object, com inteiros Python
+    """
+    num_measured = bits.shape[1]
+    if num_measured <= 62:
+        weights = np.left_shift(1, np.arange(num_measured - 1, -1, -1, dtype=np.int64))
+        return bits.astype(np.int64) @ weights
+
+    characters = bits.astype(np.uint8) + ord('0')
+    return np.fromiter((int(row.tobytes(), 2) for row in characters),
+                       dtype=object, count=len(bits))
+
+
+def outcome_to_bitstring(outcome: int, num_measured: int) -> str:
+    """Converte um resultado inteiro na string de bits correspondente."""
+    if num_measured == 0:
+        return ''
+    return format(outcome, f'0{num_measured}b')
+
+
+def outcomes_to_bitstrings(outcomes: np.ndarray, num_measured: int) -> List[str]:
+    """
+    Converte resultados inteiros em strings de bits de uma só vez.
+
+    Os caracteres são montados em uma matriz de bytes com uma operação
+    vetorizada, sem formatar cada resultado separadamente.
+
+    Args:
+        outcomes: Resultados codificados como inteiros
+        num_measured: Número de medições (largura das strings)
+
+    Returns:
+        Lista de strings de bits, na ordem de ``outcomes``
+    """
+    outcomes = np.asarray(outcomes)
+    if num_measured == 0:
+        return [''] * len(outcomes)
+    if outcomes.dtype == object or num_measured > 62:
+        return [outcome_to_bitstring(int(outcome), num_measured) for outcome in outcomes.tolist()]
+
+    shifts = np.arange(num_measured - 1, -1, -1, dtype=np.int64)
+    characters = ((outcomes.astype(np.int64)[:, None] >> shifts) & 1).astype(np.uint8) + ord('0')
+    return characters.view(f'S{num_measured}').ravel().astype(str).tolist()
+
+
+def probabilities_to_dict(probabilities: np.ndarray, num_measured: int,
+                          top_k: Optional[int] = None,
+                          outcomes: Optional[np.ndarray] = None) -> Dict[str, float]:
+    """
+    Converte uma distribuição em um dicionário de strings de bits.
+
+    Apenas os resultados com probabilidade acima de ``PROBABILITY_TOLERANCE``
+    são convertidos em strings.
+
+    Args:
+        probabilities: Probabilidades (indexadas pelo resultado ou alinhadas
+            com ``outcomes``)
+        num_measured: Número de bits das strings
+        top_k: Se informado, mantém apenas os k resultados mais prováveis,
+            em ordem decrescente de probabilidade
+        outcomes: Resultados correspondentes a ``probabilities``, se não
+            forem índices
+
+    Returns:
+        Dicionário {string de bits: probabilidade}, em ordem crescente de
+        resultado (ou decrescente de probabilidade com ``top_k``)
+    """
+    if top_k is not None and top_k < 1:
+        raise ValueError(f"top_k inválido: {top_k} (use 1 ou mais)")
+    significant = np.flatnonzero(probabilities > PROBABILITY_TOLERANCE)
+    outcomes = significant if outcomes is None else np.asarray(outcomes)[significant]
+    probabilities = probabilities[significant]
+
+    if top_k is not None:
+        if top_k < len(probabilities):
+            cut = len(probabilities) - top_k
+            chosen = np.argpartition(probabilities, cut)[cut:]
+            outcomes, probabilities = outcomes[chosen], probabilities[chosen]
+        order = np.argsort(-probabilities, kind='stable')
+    else:
+        order = np.argsort(outcomes, kind='stable')
+
+    outcomes, probabilities = outcomes[order], probabilities[order]
+    return dict(zip(outcomes_to_bitstrings(outcomes, num_measured), probabilities.tolist()))
+
+
+def counts_to_dict(counts: np.ndarray, num_measured: int, outcomes: Optional[np.ndarray] = None) -> Dict[str, int]:
+    """
+    Converte contagens por resultado em um dicionário de strings de bits.
+
+    Apenas os resultados efetivamente observados são convertidos em strings.
+
+    Args:
+        counts: Contagens (indexadas pelo resultado ou alinhadas com ``outcomes``)
+        num_measured: Número de medições (largura das strings)
+        outcomes: Resultados correspondentes a ``counts``, se não forem índices
+
+    Returns:
+        Dicionário {string de bits: contagem}
+    """
+    if outcomes is None:
+        outcomes = np.flatnonzero(counts)
+        counts = counts[outcomes]
+
+    return dict(zip(outcomes_to_bitstrings(outcomes, num_measured), counts.tolist()))
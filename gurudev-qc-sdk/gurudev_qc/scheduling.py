@@ -0,0 +1,259 @@
+"""
+Escalonamento por Localidade de Qubits Gurudev-QC
+
+Cada porta aplicada pelos kernels percorre o vetor de estado inteiro, e em
+qubits altos os pares de amplitudes ficam a ``2**alvo`` posições de
+distância. Em estados maiores que a cache, um circuito com g portas lê e
+escreve o estado da memória g vezes.
+
+Este módulo agrupa portas consecutivas que atuam apenas nos ``tile_qubits``
+qubits mais baixos em ladrilhos: como essas portas só misturam amplitudes
+dentro de blocos contíguos de ``2**tile_qubits`` amplitudes, cada bloco é
+carregado uma vez e recebe todas as portas do ladrilho antes do próximo, e o
+ladrilho inteiro custa uma única passada pelo estado. Portas em qubits altos
+continuam sendo aplicadas ao estado inteiro, uma passada cada.
+
+Quando isso reduz o número de passadas, o escalonador troca um qubit alto
+por um qubit baixo pouco usado (o de uso mais distante, como na política de
+Belady): a troca é uma passada (``kernels.apply_swap``), as portas seguintes
+são renomeadas para as novas posições e, no fim, as trocas pendentes são
+desfeitas para que o estado volte à ordem original dos qubits. A decisão
+compara as passadas das próximas ``lookahead`` portas com e sem a troca,
+contando também a passada necessária para desfazê-la.
+
+A ordem das portas é preservada e cada amplitude recebe as mesmas operações
+que no laço porta a porta, de modo que o estado final é idêntico. A exceção
+são as portas 'DIAG' do simulador (sequências de portas diagonais), cujas
+fases são multiplicadas em uma ordem que depende das posições dos qubits e
+do tamanho do bloco: o resultado difere apenas no arredondamento.
+"""
+
+from bisect import bisect_right
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from . import kernels
+from .optimizer import gate_qubits
+
+
+# Qubits cobertos por um ladrilho (2**16 amplitudes: 1 MB em complex128)
+TILE_QUBITS = 16
+
+# Número de portas consideradas ao decidir uma troca de qubits
+LOOKAHEAD = 64
+
+
+class Schedule:
+    """
+    Sequência de passos que aplica um circuito com ladrilhos e trocas.
+
+    Cada passo é uma tupla:
+        ('tile', portas): portas nos qubits baixos, aplicadas bloco a bloco
+        ('gate', porta): porta aplicada ao estado inteiro
+        ('swap', qubit_a, qubit_b): troca de dois qubits (posições físicas)
+
+    As portas dos passos já estão renomeadas para as posições físicas.
+    """
+
+    def __init__(self, num_qubits: int, tile_qubits: int, num_gates: int):
+        """
+        Inicializa um escalonamento vazio.
+
+        Args:
+            num_qubits: Número de qubits do circuito
+            tile_qubits: Qubits cobertos por um ladrilho
+            num_gates: Número de portas do circuito original
+        """
+        self.num_qubits = num_qubits
+        self.tile_qubits = tile_qubits
+        self.num_gates = num_gates
+        self.steps: List[tuple] = []
+
+    @property
+    def sweeps(self) -> int:
+        """Número de passadas pelo estado: um por passo."""
+        return len(self.steps)
+
+    @property
+    def swaps(self) -> int:
+        """Número de trocas de qubits, incluindo as que restauram a ordem."""
+        return sum(1 for step in self.steps if step[0] == 'swap')
+
+    @property
+    def tiles(self) -> int:
+        """Número de ladrilhos."""
+        return sum(1 for step in self.steps if step[0] == 'tile')
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Resume o escalonamento.
+
+        Returns:
+            Dicionário com ``gates`` (passadas do laço porta a porta),
+            ``sweeps``, ``tiles`` e ``swaps``
+        """
+        return {
+            'gates': self.num_gates,
+            'sweeps': self.sweeps,
+            'tiles': self.tiles,
+            'swaps': self.swaps,
+        }
+
+    def __repr__(self) -> str:
+        return (f"Schedule(qubits={self.num_qubits}, gates={self.num_gates}, "
+                f"sweeps={self.sweeps}, swaps={self.swaps})")
+
+
+def _relabel(gate: Dict[str, Any], layout: Sequence[int]) -> Dict[str, Any]:
+    """Retorna uma cópia da porta com os qubits nas posições físicas do layout."""
+    moved = dict(gate)
+    if 'target' in gate:
+        moved['target'] = layout[gate['target']]
+    if 'control' in gate:
+        moved['control'] = layout[gate['control']]
+    if 'qubits' in gate:
+        moved['qubits'] = [layout[q] for q in gate['qubits']]
+    if 'factors' in gate:
+        moved['factors'] = [(tuple(layout[q] for q in qubits), phases) for qubits, phases in gate['factors']]
+    return moved
+
+
+def _window_sweeps(window: Sequence[Tuple[int, ...]], layout: Sequence[int], tile_qubits: int) -> int:
+    """Conta as passadas de uma sequência de portas (pelos seus qubits) sem trocas."""
+    sweeps = 0
+    in_tile = False
+    for qubits in window:
+        if all(layout[q] < tile_qubits for q in qubits):
+            if not in_tile:
+                sweeps += 1
+                in_tile = True
+        else:
+            sweeps += 1
+            in_tile = False
+    return sweeps
+
+
+def schedule_gates(gates: Sequence[Dict[str, Any]], num_qubits: int,
+                   tile_qubits: int = TILE_QUBITS, lookahead: int = LOOKAHEAD,
+                   relabel: bool = True) -> Schedule:
+    """
+    Agrupa as portas em ladrilhos e decide as trocas de qubits.
+
+    Args:
+        gates: Portas unitárias do circuito, na ordem de aplicação
+        num_qubits: Número de qubits
+        tile_qubits: Qubits cobertos por um ladrilho
+        lookahead: Portas consideradas ao decidir uma troca
+        relabel: Se False, não troca qubits (apenas forma os ladrilhos)
+
+    Returns:
+        ``Schedule`` equivalente à aplicação das portas em ordem
+    """
+    gates = list(gates)
+    schedule = Schedule(num_qubits, tile_qubits, len(gates))
+    qubits_of = [gate_qubits(gate) for gate in gates]
+
+    # Posição física de cada qubit lógico e vice-versa
+    layout = list(range(num_qubits))
+    position = list(range(num_qubits))
+
+    uses: List[List[int]] = [[] for _ in range(num_qubits)]
+    for index, qubits in enumerate(qubits_of):
+        for q in qubits:
+            uses[q].append(index)
+
+    def next_use(qubit: int, index: int) -> float:
+        found = bisect_right(uses[qubit], index)
+        return uses[qubit][found] if found < len(uses[qubit]) else float('inf')
+
+    def swap(physical_a: int, physical_b: int) -> None:
+        logical_a, logical_b = position[physical_a], position[physical_b]
+        layout[logical_a], layout[logical_b] = physical_b, physical_a
+        position[physical_a], position[physical_b] = logical_b, logical_a
+        schedule.steps.append(('swap', physical_a, physical_b))
+
+    relabel = relabel and num_qubits > tile_qubits
+    tile = None
+    for index, gate in enumerate(gates):
+        qubits = qubits_of[index]
+        if relabel:
+            for qubit in qubits:
+                if layout[qubit] < tile_qubits:
+                    continue
+                # Qubit baixo cujo próximo uso é o mais distante
+                victim = max(
+                    (p for p in range(tile_qubits) if position[p] not in qubits),
+                    key=lambda p: (next_use(position[p], index), p),
+                    default=None,
+                )
+                if victim is None:
+                    continue
+                window = qubits_of[index:index + lookahead]
+                trial = list(layout)
+                trial[qubit], trial[position[victim]] = victim, layout[qubit]
+                # A troca e a sua restauração custam uma passada cada
+                if 2 + _window_sweeps(window, trial, tile_qubits) < _window_sweeps(window, layout, tile_qubits):
+                    swap(victim, layout[qubit])
+                    tile = None
+
+        physical = _relabel(gate, layout)
+        if all(layout[q] < tile_qubits for q in qubits):
+            if tile is None:
+                tile = []
+                schedule.steps.append(('tile', tile))
+            tile.append(physical)
+        else:
+            tile = None
+            schedule.steps.append(('gate', physical))
+
+    # Devolve cada qubit lógico à sua posição original
+    for qubit in range(num_qubits):
+        if layout[qubit] != qubit:
+            swap(layout[qubit], qubit)
+    return schedule
+
+
+def run_schedule(state: np.ndarray, schedule: Schedule,
+                 apply_gate: Callable[[np.ndarray, Dict[str, Any]], np.ndarray],
+                 profiler=None) -> np.ndarray:
+    """
+    Aplica um escalonamento ao vetor de estado, no próprio lugar.
+
+    Args:
+        state: Vetor de estado (em memória ou ``numpy.memmap``)
+        schedule: Escalonamento de ``schedule_gates``
+        apply_gate: Função que aplica uma porta a um vetor (ou bloco) e o
+            retorna, modificado no próprio lugar
+        profiler: ``gurudev_qc.profiling.Profiler`` que cronometra cada passo
+            ('TILE', 'SWAP' ou o tipo da porta), ou None
+
+    Returns:
+        O próprio vetor de estado
+    """
+    tile_size = 1 << schedule.tile_qubits
+    for index, step in enumerate(schedule.steps):
+        kind = step[0]
+        with _step_timer(profiler, index, step):
+            if kind == 'tile':
+                for start in range(0, state.size, tile_size):
+                    block = state[start:start + tile_size]
+                    for gate in step[1]:
+                        apply_gate(block, gate)
+            elif kind == 'gate':
+                apply_gate(state, step[1])
+            else:
+                kernels.apply_swap(state, step[1], step[2])
+    return state
+
+
+def _step_timer(profiler, index: int, step: tuple):
+    """Contexto que cronometra um passo do escalonamento se houver um profiler."""
+    if profiler is None:
+        return nullcontext()
+    if step[0] == 'tile':
+        return profiler.step('TILE', index, gates=len(step[1]))
+    if step[0] == 'gate':
+        return profiler.gate(index, step[1])
+    return profiler.step('SWAP', index, qubits=[step[1], step[2]])
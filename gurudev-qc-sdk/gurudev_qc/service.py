@@ -0,0 +1,567 @@
+"""
+Serviço de Simulação Gurudev-QC
+
+Este módulo contém o ``SimulationService``, uma fila de trabalhos asyncio que
+executa o simulador em um executor sem bloquear o laço de eventos, com uma
+interface em processo (``submit``/``status``/``result``) e uma interface HTTP
+mínima (``serve_http``)::
+
+    async with SimulationService(max_workers=4) as service:
+        job_id = await service.submit(code, shots=1000, seed=7)
+        results = await service.result(job_id)
+
+Pedidos idênticos em andamento (mesmo circuito compilado, shots, parâmetros
+e semente) são agrupados em uma única execução; pedidos sem semente só são
+agrupados no modo exato (``shots=0``), em que o resultado não depende do
+gerador aleatório. Circuitos pequenos que estão na fila ao mesmo tempo são
+enviados juntos ao executor, em uma única chamada. A fila é limitada
+(``max_queue``): ``submit`` espera por espaço ou, com ``block=False``, levanta
+``ServiceBusyError``. Cada trabalho tem um prazo (``timeout``) contado a
+partir do envio; trabalhos vencidos terminam com ``TimeoutError`` e não são
+executados se ainda estiverem na fila.
+
+O executor padrão é um ``ThreadPoolExecutor``: os kernels liberam o GIL nas
+portas de estados grandes, e os resultados não precisam ser serializados.
+Quando predominam circuitos pequenos, em que o tempo é gasto em Python, um
+``ProcessPoolExecutor`` pode ser passado em ``executor`` (ou ``--processes``
+na linha de comando).
+
+Interface HTTP (JSON)::
+
+    POST /jobs              {"code": ..., "shots": ..., "seed": ..., "optimize": ...,
+                             "params": {...}, "timeout": ...}  -> 202 {"id": ...}
+    POST /run               mesmo corpo; responde com o resultado
+    GET  /jobs/<id>         estado do trabalho
+    GET  /jobs/<id>/result  resultado (espera a conclusão; ?wait=0 responde 202)
+    GET  /stats             contadores do serviço
+
+Uso:
+    python -m gurudev_qc.service --port 8080 --workers 4
+    python -m gurudev_qc.service --port 8080 --workers 4 --processes
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import pickle
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+import numpy as np
+from .cache import CircuitCache
+from .compiler import GurudevQCCompiler
+from .simulator import GurudevQCSimulator
+
+
+# Mensagens das respostas HTTP usadas pelo serviço
+_HTTP_REASONS = {
+    200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found',
+    405: 'Method Not Allowed', 500: 'Internal Server Error',
+    503: 'Service Unavailable', 504: 'Gateway Timeout',
+}
+
+
+class ServiceBusyError(RuntimeError):
+    """
+    A fila do serviço está cheia e o envio não pode esperar.
+    """
+
+
+def _run_tasks(payloads: List[Tuple[Dict[str, Any], int, Optional[int], Optional[Dict[str, float]]]],
+               simulator_options: Dict[str, Any], include_state: bool) -> List[Any]:
+    """
+    Executa um grupo de circuitos no executor.
+
+    Returns:
+        Lista com o dicionário de resultados de cada circuito ou a exceção
+        levantada por ele
+    """
+    outputs = []
+    for circuit, shots, seed, params in payloads:
+        try:
+            simulator = GurudevQCSimulator(shots=shots, seed=seed, **simulator_options)
+            outputs.append(simulator.run(circuit, params=params).to_dict(include_state))
+        except Exception as error:
+            outputs.append(error)
+    return outputs
+
+
+def _circuit_fingerprint(circuit: Dict[str, Any]) -> str:
+    """Hash de um circuito já compilado (qubits, medições e portas)."""
+    payload = pickle.dumps((circuit['qubits'], list(circuit['measurements']), list(circuit['gates'])))
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """Converte valores NumPy e complexos para JSON."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, complex):
+        return [value.real, value.imag]
+    if isinstance(value, (int, float, str)):
+        return value
+    raise TypeError(f"Valor não serializável: {type(value).__name__}")
+
+
+class _Task:
+    """Uma execução do simulador, compartilhada pelos trabalhos agrupados nela."""
+
+    def __init__(self, key: Optional[tuple], circuit: Dict[str, Any], shots: int,
+                 seed: Optional[int], params: Optional[Dict[str, float]]):
+        self.key = key
+        self.circuit = circuit
+        self.shots = shots
+        self.seed = seed
+        self.params = params
+        self.jobs: List['_Job'] = []
+
+
+class _Job:
+    """Um pedido enviado ao serviço."""
+
+    def __init__(self, job_id: str, task: _Task, future: asyncio.Future, coalesced: bool):
+        self.id = job_id
+        self.task = task
+        self.future = future
+        self.coalesced = coalesced
+        self.status = 'queued'
+        self.submitted = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.error: Optional[str] = None
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class SimulationService:
+    """
+    Fila de trabalhos asyncio que executa circuitos Gurudev-QC em um executor.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 256,
+                 timeout: Optional[float] = 60.0, shots: int = 1024,
+                 small_qubits: int = 12, max_batch: int = 32,
+                 executor: Optional[Executor] = None,
+                 simulator_options: Optional[Dict[str, Any]] = None,
+                 include_state: bool = False, max_finished: int = 4096):
+        """
+        Inicializa o serviço (os trabalhadores começam em ``start``).
+
+        Args:
+            max_workers: Número de execuções simultâneas no executor
+            max_queue: Capacidade da fila de execuções pendentes
+            timeout: Prazo padrão de cada trabalho em segundos (None: sem prazo)
+            shots: Número padrão de shots
+            small_qubits: Circuitos com até esse número de qubits são
+                agrupados em uma única chamada ao executor
+            max_batch: Máximo de circuitos pequenos por chamada ao executor
+            executor: Executor das simulações (padrão: ``ThreadPoolExecutor``
+                com ``max_workers`` threads); com um pool de processos, os
+                resultados são serializados com pickle
+            simulator_options: Argumentos adicionais de ``GurudevQCSimulator``
+            include_state: Se True, os resultados incluem ``final_state``
+            max_finished: Número de trabalhos concluídos mantidos para consulta
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.shots = shots
+        self.small_qubits = small_qubits
+        self.max_batch = max_batch
+        self.simulator_options = dict(simulator_options or {})
+        self.include_state = include_state
+        self.max_finished = max_finished
+        self.compiler = GurudevQCCompiler(cache=CircuitCache())
+        self.stats = {
+            'submitted': 0, 'coalesced': 0, 'rejected': 0, 'completed': 0,
+            'failed': 0, 'timed_out': 0, 'executions': 0, 'executor_calls': 0,
+        }
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._jobs: 'OrderedDict[str, _Job]' = OrderedDict()
+        self._inflight: Dict[tuple, _Task] = {}
+
+    async def __aenter__(self) -> 'SimulationService':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Cria a fila e os trabalhadores no laço de eventos atual."""
+        if self._queue is not None:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix='gurudev-sim')
+        self._queue = asyncio.Queue(self.max_queue)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_workers)]
+
+    async def stop(self) -> None:
+        """Encerra os trabalhadores; trabalhos pendentes terminam com CancelledError."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for job in self._jobs.values():
+            if not job.future.done():
+                job.future.cancel()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._queue = None
+
+    async def submit(self, program: Union[str, Dict[str, Any]], shots: Optional[int] = None,
+                     seed: Optional[int] = None, params: Optional[Dict[str, float]] = None,
+                     optimize: int = 0, timeout: Optional[float] = None,
+                     block: bool = True) -> str:
+        """
+        Envia um trabalho.
+
+        Args:
+            program: Código Gurudev-QC ou circuito já compilado
+            shots: Número de shots (padrão: ``self.shots``; 0 para o modo exato)
+            seed: Semente do simulador, para resultados reprodutíveis
+            params: Valores dos parâmetros simbólicos do circuito
+            optimize: Nível de otimização do compilador (código fonte)
+            timeout: Prazo do trabalho em segundos (padrão: ``self.timeout``)
+            block: Se False, levanta ``ServiceBusyError`` em vez de esperar
+                por espaço na fila
+
+        Returns:
+            Identificador do trabalho
+
+        Raises:
+            GurudevQCSyntaxError: Se o código não compila
+        """
+        if self._queue is None:
+            raise RuntimeError("Serviço não iniciado; use start() ou 'async with'")
+        loop = asyncio.get_running_loop()
+        shots = self.shots if shots is None else shots
+        timeout = self.timeout if timeout is None else timeout
+
+        if isinstance(program, str):
+            source_key = CircuitCache.make_key(program, optimize=optimize)
+        else:
+            source_key = _circuit_fingerprint(program)
+        key = None
+        if seed is not None or shots == 0:
+            key = (source_key, shots, seed, tuple(sorted((params or {}).items())))
+
+        task = self._inflight.get(key) if key is not None else None
+        coalesced = task is not None
+        if task is None:
+            if self._queue.full() and not block:
+                self.stats['rejected'] += 1
+                raise ServiceBusyError(f"Fila cheia ({self.max_queue} execuções pendentes)")
+            # A execução é registrada antes da compilação, para que pedidos
+            # idênticos que chegam durante a compilação sejam agrupados nela
+            task = _Task(key, None if isinstance(program, str) else program, shots, seed, params)
+            if key is not None:
+                self._inflight[key] = task
+
+        job = _Job(uuid.uuid4().hex, task, loop.create_future(), coalesced)
+        task.jobs.append(job)
+        self._remember(job)
+        self.stats['submitted'] += 1
+        self.stats['coalesced'] += coalesced
+        if timeout is not None:
+            job.timer = loop.call_later(timeout, self._expire, job)
+        if coalesced:
+            return job.id
+
+        try:
+            if task.circuit is None:
+                # A compilação usa o pool de threads padrão do laço, mesmo
+                # quando as simulações vão para um pool de processos
+                task.circuit = await loop.run_in_executor(None, self.compiler.compile, program, optimize)
+            await self._queue.put(task)
+        except BaseException as error:
+            self._finish_task(task, error=error if isinstance(error, Exception) else RuntimeError("Envio cancelado"))
+            raise
+        return job.id
+
+    async def result(self, job_id: str) -> Dict[str, Any]:
+        """
+        Espera a conclusão de um trabalho.
+
+        Args:
+            job_id: Identificador retornado por ``submit``
+
+        Returns:
+            Dicionário de resultados (sem ``final_state``, salvo com
+            ``include_state=True``)
+
+        Raises:
+            KeyError: Se o trabalho não existe (ou já foi descartado)
+            TimeoutError: Se o prazo do trabalho venceu
+        """
+        return await asyncio.shield(self._job(job_id).future)
+
+    async def run(self, program: Union[str, Dict[str, Any]], **options: Any) -> Dict[str, Any]:
+        """Envia um trabalho e espera o seu resultado (opções de ``submit``)."""
+        return await self.result(await self.submit(program, **options))
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Retorna o estado de um trabalho.
+
+        Args:
+            job_id: Identificador retornado por ``submit``
+
+        Returns:
+            Dicionário com ``id``, ``status`` ('queued', 'running', 'done',
+            'failed', 'timeout' ou 'cancelled'), ``coalesced``, os instantes
+            de envio, início e fim e a mensagem de erro
+        """
+        job = self._job(job_id)
+        return {
+            'id': job.id,
+            'status': job.status,
+            'coalesced': job.coalesced,
+            'submitted': job.submitted,
+            'started': job.started,
+            'finished': job.finished,
+            'error': job.error,
+        }
+
+    def queue_size(self) -> int:
+        """Número de execuções esperando na fila."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _job(self, job_id: str) -> _Job:
+        """Busca um trabalho pelo identificador."""
+        if job_id not in self._jobs:
+            raise KeyError(f"Trabalho desconhecido: '{job_id}'")
+        return self._jobs[job_id]
+
+    def _remember(self, job: _Job) -> None:
+        """Registra o trabalho, descartando os concluídos mais antigos."""
+        self._jobs[job.id] = job
+        while len(self._jobs) > self.max_finished:
+            oldest = next(iter(self._jobs.values()))
+            if not oldest.future.done():
+                break
+            self._jobs.popitem(last=False)
+
+    def _expire(self, job: _Job) -> None:
+        """Encerra um trabalho cujo prazo venceu."""
+        if job.future.done():
+            return
+        job.status = 'timeout'
+        job.finished = time.time()
+        job.error = "prazo do trabalho esgotado"
+        job.future.set_exception(TimeoutError(job.error))
+        job.future.exception()  # evita o aviso de exceção não consultada
+        self.stats['timed_out'] += 1
+
+    def _finish_task(self, task: _Task, output: Any = None, error: Optional[BaseException] = None) -> None:
+        """Entrega o resultado (ou o erro) de uma execução aos seus trabalhos."""
+        if task.key is not None and self._inflight.get(task.key) is task:
+            del self._inflight[task.key]
+        now = time.time()
+        for job in task.jobs:
+            if job.timer is not None:
+                job.timer.cancel()
+            if job.future.done():
+                continue
+            job.finished = now
+            if error is None:
+                job.status = 'done'
+                job.future.set_result(output)
+                self.stats['completed'] += 1
+            else:
+                job.status = 'failed'
+                job.error = str(error)
+                job.future.set_exception(error)
+                job.future.exception()
+                self.stats['failed'] += 1
+
+    def _pending(self, task: _Task) -> bool:
+        """Indica se algum trabalho da execução ainda espera o resultado."""
+        return any(not job.future.done() for job in task.jobs)
+
+    async def _worker(self) -> None:
+        """Consome a fila, agrupando circuitos pequenos em uma chamada ao executor."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deferred = None
+            if batch[0].circuit['qubits'] <= self.small_qubits:
+                while len(batch) < self.max_batch and not self._queue.empty():
+                    task = self._queue.get_nowait()
+                    if task.circuit['qubits'] > self.small_qubits:
+                        deferred = task
+                        break
+                    batch.append(task)
+
+            for group in (batch, [deferred] if deferred is not None else []):
+                runnable = []
+                for task in group:
+                    if self._pending(task):
+                        runnable.append(task)
+                    else:
+                        # Todos os trabalhos venceram na fila; libera o agrupamento
+                        self._finish_task(task)
+                if runnable:
+                    await self._execute(loop, runnable)
+
+    async def _execute(self, loop: asyncio.AbstractEventLoop, tasks: List[_Task]) -> None:
+        """Executa um grupo de execuções no executor e entrega os resultados."""
+        now = time.time()
+        for task in tasks:
+            for job in task.jobs:
+                if not job.future.done():
+                    job.status = 'running'
+                    job.started = now
+
+        payloads = [(task.circuit, task.shots, task.seed, task.params) for task in tasks]
+        self.stats['executor_calls'] += 1
+        self.stats['executions'] += len(tasks)
+        try:
+            outputs = await loop.run_in_executor(
+                self._executor, _run_tasks, payloads, self.simulator_options, self.include_state
+            )
+        except Exception as error:
+            outputs = [error] * len(tasks)
+
+        for task, output in zip(tasks, outputs):
+            if isinstance(output, Exception):
+                self._finish_task(task, error=output)
+            else:
+                self._finish_task(task, output)
+
+    # Interface HTTP
+
+    async def serve_http(self, host: str = '127.0.0.1', port: int = 8080) -> asyncio.AbstractServer:
+        """
+        Inicia o servidor HTTP do serviço.
+
+        Args:
+            host: Endereço de escuta
+            port: Porta (0 escolhe uma porta livre)
+
+        Returns:
+            Servidor asyncio (``server.sockets[0].getsockname()`` traz a porta)
+        """
+        await self.start()
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Atende os pedidos HTTP/1.1 de uma conexão (com keep-alive)."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0))
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self._dispatch(method, target, body)
+                data = json.dumps(payload, default=_json_default).encode('utf-8')
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                writer.write(
+                    f"HTTP/1.1 {status} {_HTTP_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Any]:
+        """Roteia um pedido HTTP e retorna (código, corpo JSON)."""
+        url = urlsplit(target)
+        parts = [part for part in url.path.split('/') if part]
+        query = parse_qs(url.query)
+
+        try:
+            if parts == ['stats'] and method == 'GET':
+                return 200, dict(self.stats, queued=self.queue_size())
+            if parts in (['jobs'], ['run']) and method == 'POST':
+                request = json.loads(body or b'{}')
+                if 'code' not in request:
+                    return 400, {'error': "Campo 'code' obrigatório"}
+                job_id = await self.submit(
+                    request['code'], shots=request.get('shots'), seed=request.get('seed'),
+                    params=request.get('params'), optimize=request.get('optimize', 0),
+                    timeout=request.get('timeout'), block=False,
+                )
+                if parts == ['jobs']:
+                    return 202, {'id': job_id, 'status': self.status(job_id)['status']}
+                return await self._http_result(job_id, wait=True)
+            if len(parts) in (2, 3) and parts[0] == 'jobs' and method == 'GET':
+                if len(parts) == 2:
+                    return 200, self.status(parts[1])
+                if parts[2] == 'result':
+                    return await self._http_result(parts[1], wait=query.get('wait', ['1'])[0] != '0')
+            if parts and parts[0] in ('jobs', 'run', 'stats'):
+                return 405, {'error': f"Método {method} não suportado em {url.path}"}
+            return 404, {'error': f"Caminho desconhecido: {url.path}"}
+        except KeyError as error:
+            return (404 if parts[:1] == ['jobs'] and method == 'GET' else 400), {'error': str(error.args[0])}
+        except ServiceBusyError as error:
+            return 503, {'error': str(error)}
+        except (ValueError, TypeError) as error:
+            return 400, {'error': str(error)}
+
+    async def _http_result(self, job_id: str, wait: bool) -> Tuple[int, Any]:
+        """Resposta HTTP com o resultado de um trabalho."""
+        job = self._job(job_id)
+        if not wait and not job.future.done():
+            return 202, self.status(job_id)
+        try:
+            return 200, {'id': job_id, 'results': await self.result(job_id)}
+        except TimeoutError as error:
+            return 504, {'id': job_id, 'error': str(error)}
+        except Exception as error:
+            return 500, {'id': job_id, 'error': str(error)}
+
+
+def main() -> None:
+    """Inicia o serviço HTTP pela linha de comando."""
+    parser = argparse.ArgumentParser(description="Serviço HTTP de simulação Gurudev-QC")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--max-queue', type=int, default=256)
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--processes', action='store_true',
+                        help="executa as simulações em um pool de processos em vez de threads")
+    args = parser.parse_args()
+
+    async def serve():
+        executor = ProcessPoolExecutor(max_workers=args.workers) if args.processes else None
+        service = SimulationService(max_workers=args.workers, max_queue=args.max_queue,
+                                    timeout=args.timeout, executor=executor)
+        server = await service.serve_http(args.host, args.port)
+        print(f"Serviço Gurudev-QC em http://{args.host}:{server.sockets[0].getsockname()[1]}")
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,136 @@
 Simulador Gurudev-QC
 
 Este módulo contém o simulador quântico para executar circuitos Gurudev-QC.
+
+Com ``backend='memmap'`` o vetor de estado fica em um arquivo temporário
+mapeado em memória (``numpy.memmap``) e cada porta percorre o estado em blocos
+de ``kernels.BLOCK_SIZE`` amplitudes, assim como o cálculo da distribuição
+marginal. A memória anônima do processo fica limitada, além do circuito, a
+alguns blocos e à distribuição marginal (2**m probabilidades para m medições);
+as páginas do estado pertencem ao arquivo e podem ser devolvidas ao disco pelo
+sistema operacional, de modo que o RSS pode crescer até o tamanho do estado
+apenas com páginas recuperáveis, sem exigir essa memória livre.
+
+Circuitos de Clifford (sem rotações RZ fora dos múltiplos de π/2) com pelo
+menos ``stabilizer_min_qubits`` qubits são simulados automaticamente pelo
+tableau de estabilizadores de ``gurudev_qc.stabilizer``, em tempo e memória
+polinomiais; nesse caso ``final_state`` é None.
+
+Com ``backend='sparse'`` o estado guarda apenas as amplitudes não nulas
+(``gurudev_qc.sparse.SparseState``) e passa para o vetor denso quando o
+suporte ultrapassa ``sparse_max_fraction`` das 2**n amplitudes.
+
+Com ``shots=0`` (ou ``exact=True`` em ``run``) a amostragem é omitida e os
+resultados trazem em ``measurement_probabilities`` a distribuição marginal
+exata sobre os qubits medidos; ``top_k`` limita o dicionário aos k resultados
+mais prováveis, sem criar uma string de bits para cada um dos 2**m resultados.
+
+Circuitos com medições no meio do circuito (``measure q -> bit``) são
+executados como uma árvore de ramos: em cada medição os shots do ramo são
+divididos entre os dois resultados por uma amostra binomial, o estado é
+copiado apenas quando os dois resultados ocorrem e o prefixo comum é simulado
+uma única vez. O custo cresce com o número de ramos distintos, e não com
+shots × portas; os ramos são percorridos em profundidade, de modo que ficam em
+memória no máximo um estado por nível de medição.
+
+Com um ``noise_model`` (``gurudev_qc.noise.NoiseModel``), ``run`` simula o
+circuito com ruído por trajetórias de Monte Carlo (uma trajetória por shot,
+evoluídas em lotes como uma matriz trajetórias × 2**n) ou, com
+``noise_method='density_matrix'``, pela matriz densidade exata, que também
+permite o modo exato; ``final_state`` é None nos dois casos.
+
+``expectation`` calcula valores esperados exatos de observáveis de Pauli
+(``gurudev_qc.observables.Observable``) a partir do vetor de estado, e
+``gradient`` calcula também a derivada em relação a cada ângulo de ``rotate``
+pelo método adjunto: após a simulação direta, o estado e O|ψ⟩ são
+desfeitos porta a porta, com o custo de cerca de uma passada direta e uma
+reversa, independentemente do número de parâmetros.
+
+``profile`` ativa um ``gurudev_qc.profiling.Profiler`` que registra o tempo
+(e opcionalmente a memória) das fases compile/simulate/measure e de cada
+porta ou passo que ``_simulate`` de fato executa (sequências 'DIAG',
+ladrilhos e trocas do escalonamento); sem profiler, o laço de portas não tem
+nenhuma instrumentação.
+
+Em circuitos com mais de ``tile_qubits`` qubits, ``_simulate`` aplica as
+portas pelo escalonamento de ``gurudev_qc.scheduling``: portas consecutivas
+nos qubits baixos são aplicadas bloco a bloco, com uma única passada pelo
+estado por ladrilho, e qubits altos muito usados são trocados para posições
+baixas quando isso reduz o número de passadas.
+
+Com ``kernel='numba'`` (ou ``'auto'``, quando o Numba está instalado) as
+portas H, X, Y, Z, RZ, CNOT, U e U2 do vetor de estado usam os kernels
+compilados de ``gurudev_qc.numba_kernels``, que dividem cada porta entre
+``threads`` threads com o GIL liberado; lotes, ruído, matriz densidade e
+estados pequenos continuam nos kernels NumPy. O padrão é ``'numpy'``: os
+kernels compilados arredondam alguns produtos de forma diferente, e o
+resultado não deve depender de o Numba estar instalado.
+
+Sequências consecutivas de portas diagonais (Z, RZ e portas U e U2 fundidas
+com matriz diagonal, como as camadas de custo do QAOA) são reunidas por
+``_merge_diagonal_runs`` e aplicadas por ``kernels.apply_diagonal_run``, com
+uma única passada pelo estado para a sequência inteira.
 """
 
+import itertools
+import tempfile
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import List, Dict, Any, Tuple, Optional, Union, Iterable, Iterator, Sequence, Callable
 import random
-from .compiler import GurudevQCCompiler
+from . import kernels
+from . import numba_kernels
+from . import sampling
+from .cache import CircuitCache
+from .compiler import GurudevQCCompiler, CircuitStream
+from .ir import CompactCircuit, GATE_NAMES
+from . import noise
+from .noise import NoiseModel
+from . import observables
+from .observables import Observable
+from .optimizer import gate_qubits
+from .profiling import Profiler
+from . import scheduling
+from .results import SimulationResult
+from .sparse import SparseState
+from .stabilizer import StabilizerTableau, is_clifford
+
+
+# Número de portas convertidas para listas Python por vez no despacho do
+# circuito compacto
+_DISPATCH_CHUNK = 1 << 16
+
+# Tamanho mínimo de uma sequência de portas diagonais aplicada em uma passada
+_DIAGONAL_RUN_MIN = 2
+
+# dtype do vetor de estado para cada modo de precisão
+PRECISIONS = {
+    'single': np.complex64,
+    'double': np.complex128,
+}
+
+
+def _conjugate_by_cnot(factor: Tuple[Tuple[int, ...], np.ndarray], control: int,
+                       target: int) -> Tuple[Tuple[int, ...], np.ndarray]:
+    """
+    Retorna o fator diagonal de CNOT·D·CNOT para um fator (qubits, fases) de D.
+    
+    A fase de cada estado da base passa a ser a de D no estado com o bit do
+    alvo invertido quando o controle é 1; fatores que não envolvem o alvo
+    não mudam.
+    """
+    qubits, phases = factor
+    if target not in qubits:
+        return factor
+    conjugated = qubits if control in qubits else qubits + (control,)
+    indices = np.arange(1 << len(conjugated))
+    bits = {q: (indices >> (len(conjugated) - 1 - i)) & 1 for i, q in enumerate(conjugated)}
+    flipped = bits[target] ^ bits[control]
+    source = 0
+    for q in qubits:
+        source = 2 * source + (flipped if q == target else bits[q])
+    return conjugated, np.asarray(phases)[source]
 
 
 class GurudevQCSimulator:
@@ -19,64 +143,1335 @@ class GurudevQCSimulator:
     mecânica quântica.
     """
     
-    def __init__(self, shots: int = 1024):
+    def __init__(self, shots: int = 1024,
+                 seed: Optional[Union[int, np.random.Generator]] = None,
+                 cache: Optional[CircuitCache] = None,
+                 backend: str = 'memory', memmap_dir: Optional[str] = None,
+                 precision: str = 'double', renormalize: bool = False,
+                 stabilizer_min_qubits: Optional[int] = 20,
+                 sparse_max_fraction: float = 0.1,
+                 noise_model: Optional[NoiseModel] = None,
+                 noise_method: str = 'trajectories',
+                 tile_qubits: Optional[int] = scheduling.TILE_QUBITS,
+                 kernel: str = 'numpy', threads: Optional[int] = None):
         """
         Inicializa o simulador.
         
         Args:
-            shots: Número de execuções para estatísticas de medição
+            shots: Número de execuções para estatísticas de medição (0 para
+                calcular as probabilidades exatas sem amostragem)
+            seed: Semente ou ``numpy.random.Generator`` usado na amostragem,
+                para execuções reprodutíveis
+            cache: Cache de circuitos compilados usado por ``run_gurudev_code``
+            backend: Armazenamento do vetor de estado: 'memory' (em RAM),
+                'memmap' (arquivo temporário mapeado em memória, para estados
+                maiores que a RAM; não se aplica a ``run_batch``),
+                'stabilizer' (tableau de estabilizadores para todos os
+                circuitos; portas fora de Clifford levantam ValueError) ou
+                'sparse' (apenas as amplitudes não nulas; até 62 qubits)
+            memmap_dir: Diretório dos arquivos de estado do backend 'memmap'
+                (padrão: diretório temporário do sistema)
+            precision: 'double' (complex128) ou 'single' (complex64, metade
+                da memória e da banda por porta)
+            renormalize: Se True, o estado final é renormalizado antes da
+                medição; o desvio da norma é sempre reportado em ``norm_drift``
+            stabilizer_min_qubits: Número de qubits a partir do qual circuitos
+                de Clifford usam o tableau de estabilizadores em ``run`` e
+                ``run_gurudev_code`` (None desativa a seleção automática)
+            sparse_max_fraction: Fração das 2**n amplitudes a partir da qual
+                o backend 'sparse' converte o estado para um vetor denso
+            noise_model: Modelo de ruído aplicado por ``run`` (None simula o
+                circuito ideal)
+            noise_method: 'trajectories' (trajetórias de Monte Carlo
+                vetorizadas) ou 'density_matrix' (exato, até
+                ``noise.DENSITY_MATRIX_MAX_QUBITS`` qubits)
+            tile_qubits: Qubits cobertos por um ladrilho do escalonamento por
+                localidade, usado em circuitos com mais qubits que isso (None
+                aplica as portas uma a uma)
+            kernel: Kernels das portas: 'numpy' (padrão), 'numba'
+                (compilados e multithread; exige o Numba) ou 'auto' ('numba'
+                se o Numba estiver instalado)
+            threads: Número de threads por porta dos kernels 'numba'
+                (padrão: todos os núcleos)
         """
+        if backend not in ('memory', 'memmap', 'stabilizer', 'sparse'):
+            raise ValueError(
+                f"Backend inválido: '{backend}' (use 'memory', 'memmap', 'stabilizer' ou 'sparse')"
+            )
+        if precision not in PRECISIONS:
+            raise ValueError(f"Precisão inválida: '{precision}' (use 'single' ou 'double')")
+        if noise_method not in ('trajectories', 'density_matrix'):
+            raise ValueError(
+                f"Método de ruído inválido: '{noise_method}' (use 'trajectories' ou 'density_matrix')"
+            )
+        self._check_sampling(shots)
+        if kernel not in ('auto', 'numpy', 'numba'):
+            raise ValueError(f"Kernel inválido: '{kernel}' (use 'auto', 'numpy' ou 'numba')")
+        if kernel == 'numba' and not numba_kernels.NUMBA_AVAILABLE:
+            raise ImportError("O kernel 'numba' requer o pacote numba (pip install numba)")
+        
         self.shots = shots
-        self.compiler = GurudevQCCompiler()
+        self.backend = backend
+        self.memmap_dir = memmap_dir
+        self.precision = precision
+        self.dtype = PRECISIONS[precision]
+        self.renormalize = renormalize
+        self.stabilizer_min_qubits = stabilizer_min_qubits
+        self.sparse_max_fraction = sparse_max_fraction
+        self.noise_model = noise_model
+        self.noise_method = noise_method
+        self.tile_qubits = tile_qubits
+        self.kernel = kernel
+        self.threads = threads
+        if kernel == 'numpy' or not numba_kernels.NUMBA_AVAILABLE:
+            self._kernels = kernels
+        else:
+            # O tamanho mínimo é decidido por circuito em _gate_kernels, e não
+            # por bloco, para que os ladrilhos usem os mesmos kernels do estado
+            self._kernels = numba_kernels.NumbaKernels(threads, min_size=1)
+        self.profiler: Optional[Profiler] = None
+        self.rng = np.random.default_rng(seed)
+        self.compiler = GurudevQCCompiler(cache=cache)
     
-    def run(self, circuit: Dict[str, Any]) -> Dict[str, Any]:
+    def run(self, circuit: Dict[str, Any], return_samples: bool = False,
+            params: Optional[Dict[str, float]] = None, shots: Optional[int] = None,
+            exact: bool = False, top_k: Optional[int] = None) -> SimulationResult:
         """
         Executa um circuito quântico compilado.
         
         Args:
             circuit: Circuito quântico compilado pelo GurudevQCCompiler
+            return_samples: Se True, inclui em ``measurement_samples`` o
+                resultado de cada shot como inteiro
+            params: Valores dos parâmetros simbólicos do circuito (ex:
+                ``{'theta': 0.5}``); apenas as portas parametrizadas têm a
+                sua matriz recalculada
+            shots: Número de shots desta execução (padrão: ``self.shots``);
+                0 calcula as probabilidades exatas sem amostragem
+            exact: Equivalente a ``shots=0``
+            top_k: No modo exato, mantém apenas os k resultados mais prováveis
+            
+        Returns:
+            ``SimulationResult`` (acessado como o dicionário de resultados)
+            incluindo contagens de medição e o backend usado em ``backend``;
+            o estado final é obtido sob demanda por ``final_state``,
+            ``amplitude``, ``top_amplitudes`` ou ``iter_chunks``. No modo exato, ``measurement_counts``
+            é vazio e ``measurement_probabilities`` traz a distribuição exata.
+            Com medições no meio do circuito, ver ``_run_branches``; com um
+            modelo de ruído, ver ``_run_noisy``
+        """
+        self._check_sampling(shots, top_k)
+        shots = 0 if exact else shots
+        if self.noise_model is not None:
+            with self._phase('noise', method=self.noise_method):
+                return self._run_noisy(circuit, params, return_samples, shots, top_k)
+        
+        if self._uses_stabilizer(circuit, params):
+            with self._phase('simulate', backend='stabilizer'):
+                tableau = StabilizerTableau(circuit['qubits'])
+                for gate in circuit['gates']:
+                    tableau.apply_gate(gate, params)
+            with self._phase('measure'):
+                return self._stabilizer_results(tableau, circuit, return_samples, shots, top_k)
+        
+        if circuit.get('classical_bits'):
+            with self._phase('branches'):
+                return self._run_branches(self._branch_root(circuit['qubits']), circuit['gates'],
+                                          circuit, params, return_samples, shots, top_k)
+        
+        with self._phase('simulate', backend=self.backend):
+            state_vector = self._simulate(circuit, params)
+        with self._phase('measure'):
+            return self._build_results(state_vector, circuit, return_samples, shots, top_k)
+    
+    @contextmanager
+    def profile(self, track_memory: bool = False,
+                callback: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Ativa a instrumentação das execuções dentro do bloco ``with``.
+        
+        Args:
+            track_memory: Se True, registra também os bytes alocados
+                (``tracemalloc``; deixa as alocações mais lentas)
+            callback: Função chamada com cada evento assim que ele termina
+            
+        Yields:
+            ``Profiler`` com os eventos registrados
+        """
+        previous = self.profiler
+        with Profiler(track_memory, callback) as profiler:
+            self.profiler = profiler
+            try:
+                yield profiler
+            finally:
+                self.profiler = previous
+    
+    def _phase(self, name: str, **args):
+        """Contexto que cronometra uma fase se houver um profiler ativo."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name, **args)
+    
+    def run_gurudev_code(self, gurudev_code: str, optimize: int = 0) -> SimulationResult:
+        """
+        Compila e executa código Gurudev-QC diretamente.
+        
+        Args:
+            gurudev_code: Código fonte em Gurudev-QC
+            optimize: Nível de otimização do compilador (0 a 3)
+            
+        Returns:
+            Resultados da simulação
+        """
+        with self._phase('compile', optimize=optimize):
+            circuit = self.compiler.compile(gurudev_code, optimize=optimize)
+        return self.run(circuit)
+    
+    def run_stream(self, source: Union[str, CircuitStream, Iterable[str]],
+                   return_samples: bool = False,
+                   params: Optional[Dict[str, float]] = None,
+                   shots: Optional[int] = None, exact: bool = False,
+                   top_k: Optional[int] = None) -> SimulationResult:
+        """
+        Compila e executa um programa Gurudev-QC em fluxo.
+        
+        Cada porta é aplicada assim que a sua linha é lida, de modo que a
+        memória usada não depende do tamanho do programa. A partir da primeira
+        medição no meio do circuito, o restante do programa é guardado para
+        ser executado em cada ramo.
+        
+        Args:
+            source: Caminho do arquivo fonte, iterador de linhas ou um
+                ``CircuitStream`` de ``GurudevQCCompiler.stream``
+            return_samples: Se True, inclui o resultado de cada shot
+            params: Valores dos parâmetros simbólicos do programa
+            shots: Número de shots desta execução (padrão: ``self.shots``)
+            exact: Equivalente a ``shots=0``
+            top_k: No modo exato, mantém apenas os k resultados mais prováveis
+            
+        Returns:
+            Resultados no formato de ``run``; ``circuit_info`` traz o número de
+            portas em ``gate_count`` no lugar da lista de portas
+        """
+        if self.noise_model is not None:
+            raise ValueError("run_stream não suporta modelos de ruído; use run")
+        self._check_sampling(shots, top_k)
+        
+        shots = 0 if exact else shots
+        stream = source if isinstance(source, CircuitStream) else self.compiler.stream(source)
+        num_qubits = stream.header()
+        
+        if self.backend == 'stabilizer':
+            with self._phase('stream', backend='stabilizer'):
+                tableau = StabilizerTableau(num_qubits)
+                for gate in stream:
+                    tableau.apply_gate(gate, params)
+            with self._phase('measure'):
+                return self._stabilizer_results(tableau, stream.circuit_info(), return_samples, shots, top_k)
+        
+        # A fase 'stream' inclui a leitura e a compilação de cada linha
+        state = self._branch_root(num_qubits)
+        gates = iter(stream)
+        with self._phase('stream', backend=self.backend):
+            for gate in gates:
+                if gate['gate'] == 'MEASURE':
+                    remaining = [gate, *gates]
+                    return self._run_branches(state, remaining, stream.circuit_info(), params,
+                                              return_samples, shots, top_k)
+                state = self._apply_state_gate(state, gate, num_qubits, params)
+        
+        with self._phase('measure'):
+            return self._build_results(state, stream.circuit_info(), return_samples, shots, top_k)
+    
+    def _run_branches(self, state: Union[np.ndarray, SparseState], gates: Sequence[Dict[str, Any]],
+                      circuit: Dict[str, Any], params: Optional[Dict[str, float]],
+                      return_samples: bool, shots: Optional[int] = None,
+                      top_k: Optional[int] = None) -> SimulationResult:
+        """
+        Executa um circuito com medições no meio do circuito como árvore de ramos.
+        
+        Cada ramo guarda o estado, a próxima porta, os seus shots (ou o seu
+        peso, no modo exato) e os valores dos bits clássicos. Em uma medição,
+        os shots são divididos por uma amostra binomial; se os dois resultados
+        ocorrem, o estado é copiado e o irmão fica em uma pilha até o ramo
+        atual terminar. Nas folhas, as medições finais são sorteadas com os
+        shots do ramo.
+        
+        Args:
+            state: Estado no início de ``gates`` (modificado no próprio lugar)
+            gates: Portas restantes do circuito
+            circuit: Circuito executado (ou resumo de um fluxo)
+            params: Valores dos parâmetros simbólicos do circuito
+            return_samples: Se True, inclui o resultado final de cada shot
+                (em ordem aleatória)
+            shots: Número de shots (padrão: ``self.shots``); 0 segue todos os
+                ramos com probabilidade não nula e combina as distribuições
+                exatas
+            top_k: No modo exato, mantém apenas os k resultados mais prováveis
             
         Returns:
-            Resultados da simulação incluindo contagens de medição
+            Resultados no formato de ``run``, com as contagens dos bits
+            clássicos (na ordem de ``classical_bits``) em ``classical_counts``
+            (ou ``classical_probabilities`` no modo exato) e o número de
+            folhas em ``branches``; ``final_state`` só é preenchido quando há
+            um único ramo
         """
+        shots = self.shots if shots is None else shots
+        exact = shots == 0
         num_qubits = circuit['qubits']
+        classical_bits = circuit['classical_bits']
         
-        # Inicializa o estado quântico |00...0⟩
-        state_vector = np.zeros(2**num_qubits, dtype=complex)
-        state_vector[0] = 1.0
+        measurement_totals = Counter()
+        classical_totals = Counter()
+        sample_parts = []
+        leaves = []
+        norm_drift = 0.0
         
-        # Aplica as portas quânticas
+        stack = [(state, 0, shots, 1.0, {})]
+        while stack:
+            state, position, branch_shots, weight, bits = stack.pop()
+            
+            while position < len(gates):
+                gate = gates[position]
+                position += 1
+                if 'condition' in gate and not bits[gate['condition']]:
+                    continue
+                if gate['gate'] != 'MEASURE':
+                    state = self._apply_state_gate(state, gate, num_qubits, params)
+                    continue
+                
+                target = gate['target']
+                probability_one = min(max(self._qubit_probability(state, target, num_qubits), 0.0), 1.0)
+                probabilities = (1.0 - probability_one, probability_one)
+                if exact:
+                    outcomes = [o for o in (0, 1) if probabilities[o] > sampling.PROBABILITY_TOLERANCE]
+                    split = (branch_shots, branch_shots)
+                else:
+                    ones = int(self.rng.binomial(branch_shots, probability_one))
+                    split = (branch_shots - ones, ones)
+                    outcomes = [o for o in (0, 1) if split[o] > 0]
+                
+                if len(outcomes) == 2:
+                    sibling = self._copy_state(state, num_qubits)
+                    self._project(sibling, target, 1, probabilities[1])
+                    stack.append((sibling, position, split[1], weight * probabilities[1],
+                                  {**bits, gate['bit']: 1}))
+                
+                outcome = outcomes[0]
+                self._project(state, target, outcome, probabilities[outcome])
+                branch_shots = split[outcome]
+                weight *= probabilities[outcome]
+                bits = {**bits, gate['bit']: outcome}
+            
+            drift = self._check_norm(state)
+            if abs(drift) > abs(norm_drift):
+                norm_drift = drift
+            
+            classical_key = ''.join(str(bits.get(bit, 0)) for bit in classical_bits)
+            if exact:
+                classical_totals[classical_key] += weight
+                leaf = self._exact_probabilities(state, circuit['measurements'], num_qubits)
+                for key, probability in leaf.items():
+                    measurement_totals[key] += weight * probability
+            else:
+                classical_totals[classical_key] += branch_shots
+                leaf = self._measure(state, circuit['measurements'], num_qubits,
+                                     return_samples, branch_shots)
+                if return_samples:
+                    leaf, samples = leaf
+                    sample_parts.append(samples)
+                measurement_totals.update(leaf)
+            
+            # Apenas o estado da primeira folha é mantido, para final_state
+            leaves.append(state if not leaves else None)
+        
+        results = {
+            'measurement_counts': {} if exact else dict(sorted(measurement_totals.items())),
+            'shots': shots,
+            'circuit_info': circuit,
+            'norm_drift': norm_drift,
+            'backend': self._state_backend(leaves[0]),
+            'branches': len(leaves),
+        }
+        if exact:
+            results['measurement_probabilities'] = self._merged_probabilities(measurement_totals, top_k)
+            results['classical_probabilities'] = self._merged_probabilities(classical_totals)
+        else:
+            results['classical_counts'] = dict(sorted(classical_totals.items()))
+        if return_samples:
+            samples = np.concatenate(sample_parts) if sample_parts else np.empty(0, dtype=np.int64)
+            results['measurement_samples'] = self.rng.permutation(samples)
+        
+        return SimulationResult(results, leaves[0] if len(leaves) == 1 else None)
+    
+    def _merged_probabilities(self, totals: Dict[str, float], top_k: Optional[int] = None) -> Dict[str, float]:
+        """Ordena as probabilidades acumuladas dos ramos, mantendo as k maiores."""
+        items = sorted((key, value) for key, value in totals.items()
+                       if value > sampling.PROBABILITY_TOLERANCE)
+        if top_k is not None:
+            items = sorted(items, key=lambda item: -item[1])[:top_k]
+        return dict(items)
+    
+    def _branch_root(self, num_qubits: int) -> Union[np.ndarray, SparseState]:
+        """Estado |00...0⟩ no armazenamento do backend (inclusive 'sparse')."""
+        if self.backend == 'sparse':
+            return SparseState(num_qubits, self.dtype)
+        return self._initial_state(num_qubits)
+    
+    def _apply_state_gate(self, state: Union[np.ndarray, SparseState], gate: Dict[str, Any],
+                          num_qubits: int, params: Optional[Dict[str, float]] = None) -> Union[np.ndarray, SparseState]:
+        """
+        Aplica uma porta a um estado denso ou esparso.
+        
+        Estados esparsos passam para o vetor denso quando o suporte ultrapassa
+        ``sparse_max_fraction`` das amplitudes.
+        
+        Returns:
+            Estado atualizado
+        """
+        if not isinstance(state, SparseState):
+            return self._apply_gate(state, gate, num_qubits, params)
+        
+        self._apply_sparse_gate(state, gate, params)
+        if state.size > self.sparse_max_fraction * 2**num_qubits:
+            return state.to_dense()
+        return state
+    
+    def _qubit_probability(self, state: Union[np.ndarray, SparseState], qubit: int, num_qubits: int) -> float:
+        """Probabilidade de medir 1 no qubit."""
+        if isinstance(state, SparseState):
+            return float(np.sum(state.probabilities()[state._bits(qubit) == 1], dtype=np.float64))
+        return float(sampling.marginal_probabilities(state, [qubit], num_qubits)[1])
+    
+    def _project(self, state: Union[np.ndarray, SparseState], qubit: int, outcome: int,
+                 probability: float) -> None:
+        """Projeta o qubit no resultado e renormaliza o estado, no próprio lugar."""
+        scale = 1.0 / np.sqrt(probability)
+        if isinstance(state, SparseState):
+            state.project(qubit, outcome, scale)
+        else:
+            kernels.apply_projector(state, qubit, outcome, scale)
+    
+    def _copy_state(self, state: Union[np.ndarray, SparseState],
+                    num_qubits: int) -> Union[np.ndarray, SparseState]:
+        """Copia o estado no mesmo armazenamento (memória, memmap ou esparso)."""
+        if isinstance(state, SparseState):
+            return state.copy()
+        if isinstance(state, np.memmap):
+            copy = self._initial_state(num_qubits)
+            for start in range(0, state.size, kernels.BLOCK_SIZE):
+                copy[start:start + kernels.BLOCK_SIZE] = state[start:start + kernels.BLOCK_SIZE]
+            return copy
+        return state.copy()
+    
+    def _state_backend(self, state: Union[np.ndarray, SparseState]) -> str:
+        """Nome do armazenamento do estado, reportado em ``backend``."""
+        if isinstance(state, SparseState):
+            return 'sparse'
+        if isinstance(state, np.memmap):
+            return 'memmap'
+        return 'memory'
+    
+    def _uses_stabilizer(self, circuit: Dict[str, Any], params: Optional[Dict[str, float]]) -> bool:
+        """Decide se o circuito é simulado pelo tableau de estabilizadores."""
+        if self.backend == 'stabilizer':
+            return True
+        return (
+            self.backend in ('memory', 'memmap')
+            and self.stabilizer_min_qubits is not None
+            and circuit['qubits'] >= self.stabilizer_min_qubits
+            and is_clifford(circuit, params)
+        )
+    
+    def _stabilizer_results(self, tableau: StabilizerTableau, circuit: Dict[str, Any],
+                            return_samples: bool, shots: Optional[int] = None,
+                            top_k: Optional[int] = None) -> SimulationResult:
+        """
+        Sorteia as medições do tableau e monta o dicionário de resultados.
+        
+        Args:
+            tableau: Tableau com o estado final
+            circuit: Circuito executado (ou resumo de um fluxo)
+            return_samples: Se True, inclui o resultado de cada shot
+            shots: Número de shots (padrão: ``self.shots``); 0 enumera os
+                resultados equiprováveis do subespaço de medição
+            top_k: No modo exato, número máximo de resultados enumerados
+            
+        Returns:
+            Resultados no formato de ``run``, com ``final_state`` None
+        """
+        shots = self.shots if shots is None else shots
+        num_measured = len(circuit['measurements'])
+        results = {
+            'measurement_counts': {},
+            'shots': shots,
+            'circuit_info': circuit,
+            'norm_drift': 0.0,
+            'backend': 'stabilizer'
+        }
+        
+        if shots == 0:
+            bits, probability = tableau.distribution(circuit['measurements'], top_k)
+            outcomes = np.sort(sampling.bits_to_outcomes(bits))
+            keys = sampling.outcomes_to_bitstrings(outcomes, num_measured)
+            results['measurement_probabilities'] = dict.fromkeys(keys, probability)
+            samples = np.empty(0, dtype=np.int64)
+        else:
+            bits = tableau.sample(circuit['measurements'], shots, self.rng)
+            samples = sampling.bits_to_outcomes(bits)
+            outcomes, counts = np.unique(samples, return_counts=True)
+            results['measurement_counts'] = sampling.counts_to_dict(counts, num_measured, outcomes)
+        
+        if return_samples:
+            results['measurement_samples'] = samples
+        
+        return SimulationResult(results)
+    
+    def _run_noisy(self, circuit: Dict[str, Any], params: Optional[Dict[str, float]],
+                   return_samples: bool, shots: Optional[int] = None,
+                   top_k: Optional[int] = None) -> SimulationResult:
+        """
+        Executa o circuito com o modelo de ruído do simulador.
+        
+        Com ``noise_method='trajectories'`` cada shot é uma trajetória: os
+        erros de cada canal são sorteados por trajetória e o resultado é
+        amostrado do estado final da trajetória. Com 'density_matrix' a
+        distribuição com ruído é calculada exatamente e os shots são
+        sorteados dela (ou, com ``shots=0``, a distribuição é retornada).
+        
+        Args:
+            circuit: Circuito compilado (sem medições no meio do circuito e,
+                a menos que o modelo defina erros para elas, sem as portas
+                fundidas U/U2 da otimização de nível 2 ou 3)
+            params: Valores dos parâmetros simbólicos do circuito
+            return_samples: Se True, inclui o resultado de cada shot
+            shots: Número de shots (padrão: ``self.shots``)
+            top_k: No modo exato, mantém apenas os k resultados mais prováveis
+            
+        Returns:
+            Resultados no formato de ``run``, com ``final_state`` None e o
+            método em ``backend``; com 'density_matrix', a matriz densidade
+            final (2**n × 2**n) em ``density_matrix``
+        """
+        if circuit.get('classical_bits'):
+            raise ValueError("Modelos de ruído não suportam medições no meio do circuito")
+        self.noise_model.check_circuit(circuit)
+        
+        shots = self.shots if shots is None else shots
+        num_measured = len(circuit['measurements'])
+        p0_to_1, p1_to_0 = self.noise_model.readout_probabilities(circuit['measurements'])
+        results = {
+            'measurement_counts': {},
+            'shots': shots,
+            'circuit_info': circuit,
+            'backend': self.noise_method
+        }
+        
+        if self.noise_method == 'density_matrix':
+            rho = self._density_matrix(circuit, params)
+            diagonal = np.diagonal(rho).real
+            results['norm_drift'] = float(np.sum(diagonal, dtype=np.float64)) - 1.0
+            results['density_matrix'] = rho
+            probabilities = sampling.marginalize(diagonal, circuit['measurements'], circuit['qubits'])
+            if self.noise_model.has_readout_error():
+                probabilities = noise.apply_readout_confusion(probabilities, p0_to_1, p1_to_0)
+            if shots == 0:
+                results['measurement_probabilities'] = sampling.probabilities_to_dict(
+                    probabilities, num_measured, top_k
+                )
+                samples = np.empty(0, dtype=np.int64)
+            else:
+                samples = sampling.sample_outcomes(probabilities, shots, self.rng)
+        else:
+            if shots == 0:
+                raise ValueError("O modo exato com ruído requer noise_method='density_matrix'")
+            samples, results['norm_drift'] = self._sample_trajectories(circuit, params, shots)
+            if self.noise_model.has_readout_error():
+                samples = noise.apply_readout_flips(samples, num_measured, p0_to_1, p1_to_0, self.rng)
+        
+        if shots:
+            outcomes, counts = np.unique(samples, return_counts=True)
+            results['measurement_counts'] = sampling.counts_to_dict(counts, num_measured, outcomes)
+        if return_samples:
+            results['measurement_samples'] = samples
+        
+        return SimulationResult(results)
+    
+    def _sample_trajectories(self, circuit: Dict[str, Any], params: Optional[Dict[str, float]],
+                             num_trajectories: int, batch_size: Optional[int] = None) -> Tuple[np.ndarray, float]:
+        """
+        Simula trajetórias de Monte Carlo em lotes e sorteia um resultado de cada.
+        
+        Args:
+            circuit: Circuito compilado
+            params: Valores dos parâmetros simbólicos do circuito
+            num_trajectories: Número de trajetórias (shots)
+            batch_size: Máximo de trajetórias simuladas simultaneamente (por
+                padrão, limita o lote a cerca de 2**22 amplitudes)
+            
+        Returns:
+            Tupla (resultado de cada trajetória como inteiro, maior desvio da
+            norma entre as trajetórias)
+        """
+        num_qubits = circuit['qubits']
+        if batch_size is None:
+            batch_size = max(1, (1 << 22) >> num_qubits)
+        
+        samples = []
+        norm_drift = 0.0
+        for start in range(0, num_trajectories, batch_size):
+            states = np.zeros((min(batch_size, num_trajectories - start), 2**num_qubits), dtype=self.dtype)
+            states[:, 0] = 1.0
+            
+            for gate in circuit['gates']:
+                states = self._apply_gate(states, gate, num_qubits, params)
+                for channel, probability in self.noise_model.errors_for(gate):
+                    states = noise.apply_trajectory_errors(states, gate, channel, probability, self.rng)
+            
+            probabilities = sampling.marginalize(np.abs(states)**2, circuit['measurements'], num_qubits)
+            drifts = probabilities.sum(axis=1) - 1.0
+            worst = float(drifts[np.argmax(np.abs(drifts))])
+            norm_drift = worst if abs(worst) > abs(norm_drift) else norm_drift
+            samples.append(sampling.sample_rows(probabilities, self.rng))
+        
+        return np.concatenate(samples).astype(np.int64), norm_drift
+    
+    def _density_matrix(self, circuit: Dict[str, Any], params: Optional[Dict[str, float]]) -> np.ndarray:
+        """
+        Evolui a matriz densidade do circuito com os canais do modelo de ruído.
+        
+        ρ é guardada como um vetor de 2n qubits com índice linha·2**n + coluna:
+        uma porta U atua como U nos qubits de linha (q + n) e como conj(U) nos
+        qubits de coluna (q), de modo que os kernels do vetor de estado
+        calculam U ρ U†.
+        
+        Args:
+            circuit: Circuito compilado
+            params: Valores dos parâmetros simbólicos do circuito
+            
+        Returns:
+            Matriz densidade final (2**n × 2**n)
+        """
+        num_qubits = circuit['qubits']
+        if num_qubits > noise.DENSITY_MATRIX_MAX_QUBITS:
+            raise ValueError(
+                f"O método da matriz densidade suporta até {noise.DENSITY_MATRIX_MAX_QUBITS} "
+                f"qubits ({num_qubits} informados); use noise_method='trajectories'"
+            )
+        
+        rho = np.zeros(4**num_qubits, dtype=self.dtype)
+        rho[0] = 1.0
+        for gate in circuit['gates']:
+            if gate['gate'] == 'RZ':
+                matrix = self.compiler._rotation_z_gate(self._gate_angle(gate, params))
+            else:
+                matrix = self.compiler.gate_matrix(gate)
+            
+            qubits = gate_qubits(gate)
+            if len(qubits) == 1:
+                kernels.apply_single_qubit_gate(rho, qubits[0] + num_qubits, matrix)
+                kernels.apply_single_qubit_gate(rho, qubits[0], np.conj(matrix))
+            else:
+                qubit_a, qubit_b = qubits
+                kernels.apply_two_qubit_gate(rho, qubit_a + num_qubits, qubit_b + num_qubits, matrix)
+                kernels.apply_two_qubit_gate(rho, qubit_a, qubit_b, np.conj(matrix))
+            
+            for channel, probability in self.noise_model.errors_for(gate):
+                noise.apply_density_errors(rho, gate, channel, probability, num_qubits)
+        
+        return rho.reshape(2**num_qubits, 2**num_qubits)
+    
+    def expectation(self, circuit: Dict[str, Any],
+                    observable: Union[str, Dict[str, float], Observable, List[Any]],
+                    params: Optional[Dict[str, float]] = None) -> Union[float, np.ndarray]:
+        """
+        Calcula valores esperados exatos no estado final do circuito.
+        
+        Args:
+            circuit: Circuito compilado (sem medições no meio do circuito)
+            observable: Observável (texto, dicionário ou ``Observable``) ou
+                lista de observáveis
+            params: Valores dos parâmetros simbólicos do circuito
+            
+        Returns:
+            ⟨ψ|O|ψ⟩ para um observável, ou vetor com um valor por observável
+        """
+        self._check_differentiable(circuit)
+        state = self._simulate(circuit, params)
+        if isinstance(state, SparseState):
+            state = state.to_dense()
+        
+        if isinstance(observable, list):
+            return np.array([Observable(item).expectation(state) for item in observable])
+        return Observable(observable).expectation(state)
+    
+    def gradient(self, circuit: Dict[str, Any],
+                 observable: Union[str, Dict[str, float], Observable],
+                 params: Optional[Dict[str, float]] = None) -> Tuple[float, np.ndarray]:
+        """
+        Calcula o valor esperado e o seu gradiente pelo método adjunto.
+        
+        Com |ψ_j⟩ o estado após a porta j e |λ_j⟩ = U_{j+1}†···U_N† O|ψ⟩, a
+        derivada em relação ao ângulo de uma porta RZ(θ) = exp(-iθZ/2) é
+        Im⟨λ_j|Z|ψ_j⟩. Os dois vetores são desfeitos porta a porta, de modo
+        que o custo é de uma simulação direta, uma reversa (em dois vetores)
+        e um produto interno por rotação.
+        
+        Args:
+            circuit: Circuito compilado (sem medições no meio do circuito);
+                as rotações fundidas em portas 'U' pelo otimizador (nível 2 ou
+                mais) não entram no gradiente, exceto as simbólicas, que o
+                otimizador preserva
+            observable: Observável (texto, dicionário ou ``Observable``)
+            params: Valores dos parâmetros simbólicos do circuito
+            
+        Returns:
+            Tupla (valor esperado, gradiente). Se o circuito tem parâmetros
+            simbólicos, o gradiente segue a ordem de ``circuit['parameters']``
+            (somando as portas que compartilham um parâmetro); caso contrário,
+            tem uma entrada por porta ``rotate`` (RZ), na ordem do circuito
+        """
+        self._check_differentiable(circuit)
+        observable = Observable(observable)
+        num_qubits = circuit['qubits']
+        symbolic = {name: index for index, name in enumerate(circuit.get('parameters', []))}
+        
+        state = np.zeros(2**num_qubits, dtype=self.dtype)
+        state[0] = 1.0
         for gate in circuit['gates']:
-            state_vector = self._apply_gate(state_vector, gate, num_qubits)
+            state = self._apply_gate(state, gate, num_qubits, params)
+        
+        adjoint = observable.apply(state)
+        value = observables.inner_product(state, adjoint).real
+        
+        rotation = sum(1 for gate in circuit['gates'] if gate['gate'] == 'RZ')
+        gradient = np.zeros(len(symbolic) if symbolic else rotation)
+        for gate in reversed(circuit['gates']):
+            if gate['gate'] == 'RZ':
+                rotation -= 1
+                if symbolic and 'param' in gate:
+                    slot = symbolic[gate['param']]
+                else:
+                    slot = None if symbolic else rotation
+                if slot is not None:
+                    gradient[slot] += observables.z_inner_product(adjoint, state, gate['target']).imag
+            
+            state = self._apply_inverse_gate(state, gate, num_qubits, params)
+            adjoint = self._apply_inverse_gate(adjoint, gate, num_qubits, params)
+        
+        return value, gradient
+    
+    def _check_sampling(self, shots: Optional[int], top_k: Optional[int] = None) -> None:
+        """Rejeita números de shots negativos e ``top_k`` menor que 1."""
+        if shots is not None and shots < 0:
+            raise ValueError(f"Número de shots inválido: {shots} (use 0 para o modo exato ou um valor positivo)")
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"top_k inválido: {top_k} (use 1 ou mais)")
+    
+    def _check_differentiable(self, circuit: Dict[str, Any]) -> None:
+        """Rejeita circuitos e configurações sem vetor de estado final único."""
+        if circuit.get('classical_bits'):
+            raise ValueError("Valores esperados não suportam medições no meio do circuito")
+        if self.noise_model is not None:
+            raise ValueError("Valores esperados não suportam modelos de ruído")
+        if self.backend == 'stabilizer':
+            raise ValueError("Valores esperados requerem o vetor de estado (backend 'stabilizer')")
+    
+    def _apply_inverse_gate(self, state: np.ndarray, gate: Dict[str, Any], num_qubits: int,
+                            params: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """
+        Aplica a inversa (adjunta) de uma porta ao estado.
+        
+        Args:
+            state: Vetor de estado atual
+            gate: Informações da porta a ser desfeita
+            num_qubits: Número total de qubits
+            params: Valores dos parâmetros simbólicos do circuito
+            
+        Returns:
+            Vetor de estado após aplicar U† (atualizado no próprio lugar)
+        """
+        gate_type = gate['gate']
+        if gate_type == 'RZ':
+            matrix = self.compiler._rotation_z_gate(-self._gate_angle(gate, params))
+            return kernels.apply_diagonal_gate(state, gate['target'], matrix[0, 0], matrix[1, 1])
+        if gate_type == 'U':
+            return kernels.apply_single_qubit_gate(state, gate['target'], gate['matrix'].conj().T)
+        if gate_type == 'U2':
+            qubit_a, qubit_b = gate['qubits']
+            return kernels.apply_two_qubit_gate(state, qubit_a, qubit_b, gate['matrix'].conj().T)
+        
+        # H, X, Y, Z e CNOT são as próprias inversas
+        return self._apply_gate(state, gate, num_qubits, params)
+    
+    def run_batch(self, circuits: Union[List[Dict[str, Any]], Dict[str, Any]],
+                  parameters: Optional[np.ndarray] = None,
+                  batch_size: Optional[int] = None,
+                  return_samples: bool = False) -> List[SimulationResult]:
+        """
+        Executa vários circuitos em lote, com um vetor de estado por item.
+        
+        Pode ser chamado de duas formas:
+        
+        - ``run_batch([circuito1, circuito2, ...])``: circuitos com a mesma
+          estrutura (qubits, portas e medições, ignorando ângulos e matrizes)
+          são simulados juntos em uma única passada vetorizada;
+        - ``run_batch(modelo, parametros)``: ``parametros`` é uma matriz
+          (lote × P). Se o modelo tem parâmetros simbólicos, as colunas
+          correspondem, em ordem, a ``modelo['parameters']``; caso contrário,
+          substituem os ângulos das P portas ``rotate`` do modelo.
+        
+        Args:
+            circuits: Lista de circuitos compilados ou um circuito modelo
+            parameters: Matriz de ângulos para o circuito modelo
+            batch_size: Máximo de itens simulados simultaneamente (por padrão,
+                limita o lote a cerca de 2**22 amplitudes)
+            return_samples: Se True, inclui o resultado de cada shot
+            
+        Returns:
+            Lista de resultados no mesmo formato de ``run``, na ordem de entrada.
+            Na forma com modelo, ``circuit_info`` é o próprio modelo e os ângulos
+            do item ficam em ``parameters``.
+        """
+        templates = [circuits] if parameters is not None else circuits
+        if any(circuit.get('classical_bits') for circuit in templates):
+            raise ValueError("run_batch não suporta medições no meio do circuito; use run")
+        if self.noise_model is not None:
+            raise ValueError("run_batch não suporta modelos de ruído; use run")
+        
+        if parameters is not None:
+            return self._run_template_batch(circuits, parameters, batch_size, return_samples)
+        
+        results = [None] * len(circuits)
+        groups = {}
+        for index, circuit in enumerate(circuits):
+            groups.setdefault(self._structure_key(circuit), []).append(index)
+        
+        for indices in groups.values():
+            members = [circuits[i] for i in indices]
+            template = members[0]
+            overrides = {}
+            for position, gate in enumerate(template['gates']):
+                key = 'angle' if gate['gate'] == 'RZ' else 'matrix' if 'matrix' in gate else None
+                if key is None or len(members) == 1:
+                    continue
+                values = [member['gates'][position][key] for member in members]
+                if any(np.any(value != values[0]) for value in values[1:]):
+                    overrides[position] = np.array(values)
+            
+            for start, states in self._simulate_batch(template, overrides, len(members), batch_size):
+                for offset, state in enumerate(states):
+                    index = indices[start + offset]
+                    results[index] = self._build_results(state, circuits[index], return_samples)
+        
+        return results
+    
+    def _run_template_batch(self, template: Dict[str, Any], parameters: np.ndarray,
+                            batch_size: Optional[int], return_samples: bool) -> List[SimulationResult]:
+        """Executa um circuito modelo para cada linha da matriz de parâmetros."""
+        parameters = np.atleast_2d(np.asarray(parameters, dtype=float))
+        names = template.get('parameters', [])
         
-        # Realiza as medições
-        measurement_results = self._measure(
-            state_vector, 
-            circuit['measurements'], 
-            num_qubits
+        if names:
+            if parameters.shape[1] != len(names):
+                raise ValueError(
+                    f"A matriz de parâmetros tem {parameters.shape[1]} colunas, "
+                    f"mas o circuito tem {len(names)} parâmetros"
+                )
+            overrides = {
+                position: parameters[:, names.index(gate['param'])]
+                for position, gate in enumerate(template['gates']) if 'param' in gate
+            }
+        else:
+            positions = [i for i, gate in enumerate(template['gates']) if gate['gate'] == 'RZ']
+            if parameters.shape[1] != len(positions):
+                raise ValueError(
+                    f"A matriz de parâmetros tem {parameters.shape[1]} colunas, "
+                    f"mas o circuito tem {len(positions)} portas rotate"
+                )
+            overrides = {position: parameters[:, j] for j, position in enumerate(positions)}
+        results = []
+        for start, states in self._simulate_batch(template, overrides, len(parameters), batch_size):
+            for offset, state in enumerate(states):
+                item_results = self._build_results(state, template, return_samples)
+                item_results['parameters'] = parameters[start + offset]
+                results.append(item_results)
+        
+        return results
+    
+    def _structure_key(self, circuit: Dict[str, Any]) -> tuple:
+        """Chave que identifica circuitos com a mesma estrutura."""
+        gates = tuple(
+            (gate['gate'], gate['target'], gate.get('control'), tuple(gate.get('qubits', ())))
+            for gate in circuit['gates']
         )
+        return (circuit['qubits'], tuple(circuit['measurements']), gates)
+    
+    def _simulate_batch(self, template: Dict[str, Any], overrides: Dict[int, np.ndarray],
+                        num_items: int, batch_size: Optional[int]):
+        """
+        Simula um lote de circuitos com a estrutura do modelo.
+        
+        Args:
+            template: Circuito que define a estrutura
+            overrides: Valores por item (ângulos ou matrizes) de cada posição
+                de porta que varia dentro do lote
+            num_items: Número de itens do lote
+            batch_size: Máximo de itens simulados simultaneamente
+            
+        Yields:
+            Tuplas (índice do primeiro item, matriz de estados lote × 2**n)
+        """
+        num_qubits = template['qubits']
+        if batch_size is None:
+            batch_size = max(1, (1 << 22) >> num_qubits)
+        
+        for start in range(0, num_items, batch_size):
+            stop = min(start + batch_size, num_items)
+            states = np.zeros((stop - start, 2**num_qubits), dtype=self.dtype)
+            states[:, 0] = 1.0
+            
+            for position, gate in enumerate(template['gates']):
+                if position in overrides:
+                    states = self._apply_batched_gate(states, gate, overrides[position][start:stop])
+                else:
+                    states = self._apply_gate(states, gate, num_qubits)
+            
+            yield start, states
+    
+    def _apply_batched_gate(self, states: np.ndarray, gate: Dict[str, Any], values: np.ndarray) -> np.ndarray:
+        """
+        Aplica uma porta cujo ângulo ou matriz varia entre os itens do lote.
+        
+        Args:
+            states: Matriz de estados (lote × 2**n)
+            gate: Porta do circuito modelo
+            values: Ângulos (lote,) ou matrizes (lote, d, d) de cada item
+            
+        Returns:
+            Matriz de estados atualizada no próprio lugar
+        """
+        if gate['gate'] == 'RZ':
+            half_angles = values.reshape(-1, 1, 1) / 2
+            return kernels.apply_diagonal_gate(
+                states, gate['target'], np.exp(-1j * half_angles), np.exp(1j * half_angles)
+            )
+        if gate['gate'] == 'U2':
+            qubit_a, qubit_b = gate['qubits']
+            return kernels.apply_two_qubit_gate(states, qubit_a, qubit_b, values)
+        return kernels.apply_single_qubit_gate(states, gate['target'], values)
+    
+    def _build_results(self, state_vector: np.ndarray, circuit: Dict[str, Any],
+                       return_samples: bool, shots: Optional[int] = None,
+                       top_k: Optional[int] = None) -> SimulationResult:
+        """
+        Realiza as medições e monta o dicionário de resultados.
         
-        return {
-            'final_state': state_vector,
+        Args:
+            state_vector: Vetor de estado final
+            circuit: Circuito executado
+            return_samples: Se True, inclui o resultado de cada shot
+            shots: Número de shots (padrão: ``self.shots``); 0 calcula as
+                probabilidades exatas em ``measurement_probabilities``
+            top_k: No modo exato, mantém apenas os k resultados mais prováveis
+            
+        Returns:
+            Resultados da simulação incluindo contagens de medição e
+            ``norm_drift`` (quadrado da norma do estado final menos 1, antes
+            de uma eventual renormalização)
+        """
+        norm_drift = self._check_norm(state_vector)
+        
+        shots = self.shots if shots is None else shots
+        if shots == 0:
+            measurement_results = {}
+            measurement_samples = np.empty(0, dtype=np.int64)
+            probabilities = self._exact_probabilities(
+                state_vector, circuit['measurements'], circuit['qubits'], top_k
+            )
+        else:
+            # Realiza as medições
+            measurement_results = self._measure(
+                state_vector, 
+                circuit['measurements'], 
+                circuit['qubits'],
+                return_samples,
+                shots
+            )
+            if return_samples:
+                measurement_results, measurement_samples = measurement_results
+        
+        results = {
             'measurement_counts': measurement_results,
-            'shots': self.shots,
-            'circuit_info': circuit
+            'shots': shots,
+            'circuit_info': circuit,
+            'norm_drift': norm_drift,
+            'backend': self._state_backend(state_vector)
         }
+        if shots == 0:
+            results['measurement_probabilities'] = probabilities
+        if return_samples:
+            results['measurement_samples'] = measurement_samples
+        
+        return SimulationResult(results, state_vector)
     
-    def run_gurudev_code(self, gurudev_code: str) -> Dict[str, Any]:
+    def _check_norm(self, state_vector: Union[np.ndarray, SparseState]) -> float:
         """
-        Compila e executa código Gurudev-QC diretamente.
+        Calcula o desvio da norma e renormaliza o estado se ``renormalize``.
         
         Args:
-            gurudev_code: Código fonte em Gurudev-QC
+            state_vector: Vetor de estado ou estado esparso
             
         Returns:
-            Resultados da simulação
+            Quadrado da norma menos 1, antes da renormalização
         """
-        circuit = self.compiler.compile(gurudev_code)
-        return self.run(circuit)
+        norm = self._squared_norm(state_vector)
+        if self.renormalize and norm > 0:
+            if isinstance(state_vector, SparseState):
+                state_vector.amplitudes /= float(np.sqrt(norm))
+            else:
+                state_vector /= float(np.sqrt(norm))
+        return norm - 1.0
+    
+    def _squared_norm(self, state_vector: np.ndarray) -> float:
+        """
+        Calcula o quadrado da norma do estado, acumulando em precisão dupla.
+        
+        Args:
+            state_vector: Vetor de estado
+            
+        Returns:
+            Soma das probabilidades de todas as amplitudes
+        """
+        if isinstance(state_vector, SparseState):
+            return float(np.sum(state_vector.probabilities(), dtype=np.float64))
+        
+        total = 0.0
+        for start in range(0, state_vector.size, kernels.BLOCK_SIZE):
+            block = state_vector[start:start + kernels.BLOCK_SIZE].astype(np.complex128, copy=False)
+            total += float(np.vdot(block, block).real)
+        return total
+    
+    def _simulate(self, circuit: Dict[str, Any], params: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """
+        Aplica as portas do circuito ao estado inicial |00...0⟩.
+        
+        Args:
+            circuit: Circuito quântico compilado
+            params: Valores dos parâmetros simbólicos do circuito
+            
+        Returns:
+            Vetor de estado final
+        """
+        if self.backend == 'sparse':
+            return self._simulate_sparse(circuit['gates'], circuit['qubits'], params)
+        if isinstance(circuit, CompactCircuit):
+            return self._simulate_compact(circuit, params)
+        
+        num_qubits = circuit['qubits']
+        
+        gates = self._merge_diagonal_runs(circuit['gates'], params)
+        
+        # Inicializa o estado quântico |00...0⟩
+        state_vector = self._initial_state(num_qubits)
+        
+        apply_gate = lambda state, gate: self._apply_gate(state, gate, num_qubits, params)
+        
+        # Circuitos maiores que um ladrilho: portas agrupadas por localidade
+        if self.tile_qubits is not None and num_qubits > self.tile_qubits:
+            schedule = scheduling.schedule_gates(gates, num_qubits, self.tile_qubits)
+            return scheduling.run_schedule(state_vector, schedule, apply_gate, self.profiler)
+        
+        if self.profiler is not None:
+            apply_gate = self._profiled(apply_gate)
+        
+        # Aplica as portas quânticas
+        for gate in gates:
+            state_vector = apply_gate(state_vector, gate)
+        
+        return state_vector
+    
+    def _diagonal_factor(self, gate: Dict[str, Any],
+                         params: Optional[Dict[str, float]] = None) -> Optional[Tuple[Tuple[int, ...], np.ndarray]]:
+        """
+        Retorna os qubits e as fases de uma porta diagonal.
+        
+        Args:
+            gate: Porta do circuito
+            params: Valores dos parâmetros simbólicos do circuito
+            
+        Returns:
+            Par (qubits, fases) no formato de ``kernels.apply_diagonal_run``,
+            ou None se a porta não for diagonal
+        """
+        gate_type = gate['gate']
+        if gate_type == 'Z':
+            return (gate['target'],), np.array([1, -1])
+        if gate_type == 'RZ':
+            return (gate['target'],), np.diagonal(self.compiler._rotation_z_gate(self._gate_angle(gate, params)))
+        if gate_type in ('U', 'U2'):
+            matrix = gate['matrix']
+            phases = np.diagonal(matrix)
+            if np.count_nonzero(matrix) == np.count_nonzero(phases):
+                return gate_qubits(gate), phases
+        return None
+    
+    def _merge_diagonal_runs(self, gates: Iterable[Dict[str, Any]],
+                             params: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+        """
+        Substitui cada sequência de portas diagonais consecutivas por uma
+        porta 'DIAG' com os fatores de todas elas.
+        
+        Portas diagonais comutam entre si, e a sequência, em quaisquer
+        qubits, é aplicada com uma única passada pelo estado. Um bloco
+        CNOT·D·CNOT (com a mesma CNOT e D diagonal, como os termos ZZ do
+        QAOA) também é diagonal, pois a CNOT é uma permutação: os fatores de
+        D são permutados por ``_conjugate_by_cnot`` e entram na sequência.
+        Sequências com menos de ``_DIAGONAL_RUN_MIN`` portas são mantidas.
+        
+        Args:
+            gates: Portas do circuito
+            params: Valores dos parâmetros simbólicos do circuito
+            
+        Returns:
+            Lista de portas com as sequências diagonais reunidas
+        """
+        gates = list(gates)
+        merged = []
+        run: List[Tuple[List[Dict[str, Any]], Tuple[Tuple[int, ...], np.ndarray]]] = []
+        
+        def flush() -> None:
+            if sum(len(originals) for originals, _ in run) >= _DIAGONAL_RUN_MIN:
+                factors = [factor for _, factor in run]
+                merged.append({
+                    'gate': 'DIAG',
+                    'qubits': sorted({q for qubits, _ in factors for q in qubits}),
+                    'factors': factors,
+                })
+            else:
+                merged.extend(gate for originals, _ in run for gate in originals)
+            run.clear()
+        
+        index = 0
+        while index < len(gates):
+            gate = gates[index]
+            factor = self._diagonal_factor(gate, params)
+            if factor is not None:
+                run.append(([gate], factor))
+                index += 1
+                continue
+            
+            if gate['gate'] == 'CNOT':
+                inner = []
+                end = index + 1
+                while end < len(gates):
+                    factor = self._diagonal_factor(gates[end], params)
+                    if factor is None:
+                        break
+                    inner.append(factor)
+                    end += 1
+                closing = gates[end] if end < len(gates) else None
+                if (inner and closing is not None and closing['gate'] == 'CNOT'
+                        and closing['control'] == gate['control'] and closing['target'] == gate['target']):
+                    originals = gates[index:end + 1]
+                    for position, factor in enumerate(inner):
+                        run.append((originals if position == 0 else [],
+                                    _conjugate_by_cnot(factor, gate['control'], gate['target'])))
+                    index = end + 1
+                    continue
+            
+            flush()
+            merged.append(gate)
+            index += 1
+        flush()
+        return merged
+    
+    def _profiled(self, apply: Callable, name: Optional[str] = None,
+                  counter: Optional[Iterator[int]] = None) -> Callable:
+        """
+        Envolve uma função de aplicação de portas para registrar cada chamada
+        no profiler ativo.
+        
+        Args:
+            apply: Função (estado, porta, ...) que aplica uma porta
+            name: Nome dos eventos (padrão: o tipo da porta, ``gate['gate']``)
+            counter: Contador compartilhado das posições das portas
+            
+        Returns:
+            Função com a mesma assinatura de ``apply``
+        """
+        profiler = self.profiler
+        counter = itertools.count() if counter is None else counter
+        
+        def timed(state, *args):
+            with profiler.step(name or args[0]['gate'], next(counter)):
+                return apply(state, *args)
+        return timed
+    
+    def _simulate_sparse(self, gates: Iterable[Dict[str, Any]], num_qubits: int,
+                         params: Optional[Dict[str, float]] = None) -> Union[SparseState, np.ndarray]:
+        """
+        Aplica as portas sobre um estado esparso, passando para o vetor denso
+        quando o suporte ultrapassa ``sparse_max_fraction`` das amplitudes.
+        
+        Args:
+            gates: Portas do circuito
+            num_qubits: Número de qubits
+            params: Valores dos parâmetros simbólicos do circuito
+            
+        Returns:
+            Estado esparso final ou, após a conversão, o vetor de estado denso
+        """
+        state = SparseState(num_qubits, self.dtype)
+        limit = self.sparse_max_fraction * 2**num_qubits
+        gates = iter(gates)
+        
+        apply_sparse = self._apply_sparse_gate
+        apply_dense = lambda state, gate, params: self._apply_gate(state, gate, num_qubits, params)
+        if self.profiler is not None:
+            counter = itertools.count()
+            apply_sparse = self._profiled(apply_sparse, counter=counter)
+            apply_dense = self._profiled(apply_dense, counter=counter)
+        
+        for gate in gates:
+            apply_sparse(state, gate, params)
+            if state.size > limit:
+                state_vector = state.to_dense()
+                for gate in gates:
+                    state_vector = apply_dense(state_vector, gate, params)
+                return state_vector
+        
+        return state
+    
+    def _apply_sparse_gate(self, state: SparseState, gate: Dict[str, Any],
+                           params: Optional[Dict[str, float]] = None) -> None:
+        """
+        Aplica uma porta a um estado esparso.
+        
+        Args:
+            state: Estado esparso (modificado no próprio lugar)
+            gate: Informações da porta a ser aplicada
+            params: Valores dos parâmetros simbólicos do circuito
+        """
+        gate_type = gate['gate']
+        target = gate['target']
+        
+        if gate_type == 'X':
+            state.apply_pauli_x(target)
+        elif gate_type == 'Y':
+            state.apply_pauli_y(target)
+        elif gate_type == 'Z':
+            state.apply_pauli_z(target)
+        elif gate_type == 'CNOT':
+            state.apply_cnot(gate['control'], target)
+        elif gate_type == 'RZ':
+            matrix = self.compiler._rotation_z_gate(self._gate_angle(gate, params))
+            state.apply_diagonal_gate(target, matrix[0, 0], matrix[1, 1])
+        elif gate_type == 'U2':
+            state.apply_matrix(gate['qubits'], gate['matrix'])
+        else:
+            state.apply_matrix([target], self.compiler.gate_matrix(gate))
+    
+    def _initial_state(self, num_qubits: int) -> np.ndarray:
+        """
+        Cria o estado |00...0⟩ no armazenamento do backend.
+        
+        Args:
+            num_qubits: Número de qubits
+            
+        Returns:
+            Vetor de estado em memória ou ``numpy.memmap``
+        """
+        if self.backend == 'memmap':
+            # O arquivo temporário é removido do diretório ao ser fechado; o
+            # mapeamento mantém os dados até o vetor ser liberado
+            with tempfile.TemporaryFile(dir=self.memmap_dir, prefix='gurudev-state-') as file:
+                state_vector = np.memmap(file, dtype=self.dtype, mode='w+', shape=(2**num_qubits,))
+        else:
+            state_vector = np.zeros(2**num_qubits, dtype=self.dtype)
+        
+        state_vector[0] = 1.0
+        return state_vector
+    
+    def _simulate_compact(self, circuit: CompactCircuit, params: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """
+        Simula um circuito compacto despachando as portas pelo código de operação.
+        
+        Args:
+            circuit: Circuito compacto
+            params: Valores dos parâmetros simbólicos do circuito
+            
+        Returns:
+            Vetor de estado final
+        """
+        state_vector = self._initial_state(circuit.qubits)
+        
+        handlers = self._compact_handlers(circuit, params)
+        if self.profiler is not None:
+            counter = itertools.count()
+            handlers = [self._profiled(handler, GATE_NAMES[op], counter) for op, handler in enumerate(handlers)]
+        records = circuit.records
+        for start in range(0, len(records), _DISPATCH_CHUNK):
+            chunk = records[start:start + _DISPATCH_CHUNK]
+            columns = [chunk[field].tolist() for field in ('op', 'target', 'control', 'angle', 'slot')]
+            for op, target, control, angle, slot in zip(*columns):
+                state_vector = handlers[op](state_vector, target, control, angle, slot)
+        
+        return state_vector
+    
+    def _compact_handlers(self, circuit: CompactCircuit, params: Optional[Dict[str, float]]) -> list:
+        """
+        Monta a tabela de funções de aplicação indexada pelo código de operação.
+        
+        Cada função recebe (estado, alvo, controle, ângulo, slot) e retorna o
+        estado atualizado.
+        """
+        missing = [name for name in circuit.parameters if params is None or name not in params]
+        if missing:
+            raise ValueError(f"Parâmetro '{missing[0]}' sem valor; informe params ou use bind")
+        bound = [params[name] for name in circuit.parameters]
+        hadamard = self.compiler._hadamard_gate()
+        rotation_z = self.compiler._rotation_z_gate
+        matrices = circuit.matrices
+        gate_kernels = self._gate_kernels(circuit.qubits)
+        
+        def apply_rz(state, target, control, angle, slot):
+            matrix = rotation_z(bound[slot] if slot >= 0 else angle)
+            return gate_kernels.apply_diagonal_gate(state, target, matrix[0, 0], matrix[1, 1])
+        
+        # Mesma ordem dos códigos em gurudev_qc.ir.GATE_NAMES
+        return [
+            lambda state, target, control, angle, slot: gate_kernels.apply_single_qubit_gate(state, target, hadamard),
+            lambda state, target, control, angle, slot: gate_kernels.apply_pauli_x(state, target),
+            lambda state, target, control, angle, slot: gate_kernels.apply_pauli_y(state, target),
+            lambda state, target, control, angle, slot: gate_kernels.apply_pauli_z(state, target),
+            apply_rz,
+            lambda state, target, control, angle, slot: gate_kernels.apply_cnot(state, control, target),
+            lambda state, target, control, angle, slot: gate_kernels.apply_single_qubit_gate(state, target, matrices[slot]),
+            lambda state, target, control, angle, slot: gate_kernels.apply_two_qubit_gate(state, control, target, matrices[slot]),
+        ]
+    
+    def _gate_kernels(self, num_qubits: int):
+        """
+        Retorna os kernels das portas de um circuito.
+        
+        Os kernels compilados arredondam alguns produtos complexos de forma
+        diferente dos kernels NumPy; a escolha é feita pelo número de qubits
+        do circuito, e não pelo tamanho de cada vetor ou bloco, para que o
+        resultado não dependa do escalonamento.
+        
+        Args:
+            num_qubits: Número total de qubits do circuito
+            
+        Returns:
+            O módulo ``kernels`` ou a instância de ``NumbaKernels``
+        """
+        if (1 << num_qubits) < numba_kernels.MIN_NATIVE_SIZE:
+            return kernels
+        return self._kernels
     
-    def _apply_gate(self, state: np.ndarray, gate: Dict[str, Any], num_qubits: int) -> np.ndarray:
+    def _apply_gate(self, state: np.ndarray, gate: Dict[str, Any], num_qubits: int,
+                    params: Optional[Dict[str, float]] = None) -> np.ndarray:
         """
         Aplica uma porta quântica ao estado.
         
@@ -84,135 +1479,216 @@ class GurudevQCSimulator:
             state: Vetor de estado atual
             gate: Informações da porta a ser aplicada
             num_qubits: Número total de qubits
+            params: Valores dos parâmetros simbólicos do circuito
             
         Returns:
-            Novo vetor de estado após aplicar a porta
+            Vetor de estado após aplicar a porta (atualizado no próprio lugar)
         """
         gate_type = gate['gate']
+        gate_kernels = self._gate_kernels(num_qubits)
+        if gate_type == 'DIAG':
+            return gate_kernels.apply_diagonal_run(state, gate['factors'])
         target = gate['target']
         
         if gate_type == 'H':
             return self._apply_single_qubit_gate(state, target, self.compiler._hadamard_gate(), num_qubits)
         elif gate_type == 'X':
-            return self._apply_single_qubit_gate(state, target, self.compiler._pauli_x_gate(), num_qubits)
+            return gate_kernels.apply_pauli_x(state, target)
         elif gate_type == 'Y':
-            return self._apply_single_qubit_gate(state, target, self.compiler._pauli_y_gate(), num_qubits)
+            return gate_kernels.apply_pauli_y(state, target)
         elif gate_type == 'Z':
-            return self._apply_single_qubit_gate(state, target, self.compiler._pauli_z_gate(), num_qubits)
+            return gate_kernels.apply_pauli_z(state, target)
         elif gate_type == 'CNOT':
             control = gate['control']
             return self._apply_cnot_gate(state, control, target, num_qubits)
         elif gate_type == 'RZ':
-            angle = gate['angle']
-            return self._apply_single_qubit_gate(
-                state, target, self.compiler._rotation_z_gate(angle), num_qubits
-            )
+            matrix = self.compiler._rotation_z_gate(self._gate_angle(gate, params))
+            return gate_kernels.apply_diagonal_gate(state, target, matrix[0, 0], matrix[1, 1])
+        elif gate_type == 'U':
+            return self._apply_single_qubit_gate(state, target, gate['matrix'], num_qubits)
+        elif gate_type == 'U2':
+            qubit_a, qubit_b = gate['qubits']
+            return gate_kernels.apply_two_qubit_gate(state, qubit_a, qubit_b, gate['matrix'])
         
         return state
     
+    def _gate_angle(self, gate: Dict[str, Any], params: Optional[Dict[str, float]]) -> float:
+        """
+        Retorna o ângulo de uma rotação, resolvendo parâmetros simbólicos.
+        
+        Args:
+            gate: Porta de rotação
+            params: Valores dos parâmetros simbólicos do circuito
+            
+        Returns:
+            Ângulo da rotação
+        """
+        if 'param' not in gate:
+            return gate['angle']
+        if params is None or gate['param'] not in params:
+            raise ValueError(f"Parâmetro '{gate['param']}' sem valor; informe params ou use bind")
+        return params[gate['param']]
+    
     def _apply_single_qubit_gate(self, state: np.ndarray, target: int, gate_matrix: np.ndarray, num_qubits: int) -> np.ndarray:
         """
         Aplica uma porta de um qubit ao estado.
         
         Args:
-            state: Vetor de estado atual
+            state: Vetor de estado atual (modificado no próprio lugar)
             target: Qubit alvo
             gate_matrix: Matriz da porta quântica
             num_qubits: Número total de qubits
             
         Returns:
-            Novo vetor de estado
+            Vetor de estado atualizado
         """
-        new_state = np.zeros_like(state)
-        
-        for i in range(2**num_qubits):
-            # Extrai o bit do qubit alvo
-            target_bit = (i >> target) & 1
-            
-            # Calcula o índice com o bit do qubit alvo invertido
-            flipped_i = i ^ (1 << target)
-            
-            # Aplica a matriz da porta
-            new_state[i] += gate_matrix[target_bit, 0] * state[i]
-            new_state[i] += gate_matrix[target_bit, 1] * state[flipped_i]
-        
-        return new_state
+        return self._gate_kernels(num_qubits).apply_single_qubit_gate(state, target, gate_matrix)
     
     def _apply_cnot_gate(self, state: np.ndarray, control: int, target: int, num_qubits: int) -> np.ndarray:
         """
         Aplica uma porta CNOT ao estado.
         
         Args:
-            state: Vetor de estado atual
+            state: Vetor de estado atual (modificado no próprio lugar)
             control: Qubit de controle
             target: Qubit alvo
             num_qubits: Número total de qubits
             
         Returns:
-            Novo vetor de estado
+            Vetor de estado atualizado
         """
-        new_state = state.copy()
-        
-        for i in range(2**num_qubits):
-            control_bit = (i >> control) & 1
-            
-            if control_bit == 1:
-                # Se o qubit de controle é 1, inverte o qubit alvo
-                flipped_i = i ^ (1 << target)
-                new_state[i] = state[flipped_i]
-        
-        return new_state
+        return self._gate_kernels(num_qubits).apply_cnot(state, control, target)
     
-    def _measure(self, state: np.ndarray, measurement_qubits: List[int], num_qubits: int) -> Dict[str, int]:
+    def _measure(self, state: np.ndarray, measurement_qubits: List[int], num_qubits: int,
+                 return_samples: bool = False,
+                 shots: Optional[int] = None) -> Union[Dict[str, int], Tuple[Dict[str, int], np.ndarray]]:
         """
         Realiza medições nos qubits especificados.
         
+        A distribuição é marginalizada uma única vez sobre os qubits medidos e
+        todos os shots são sorteados em uma só chamada; apenas os resultados
+        observados são convertidos em strings de bits.
+        
         Args:
             state: Vetor de estado final
             measurement_qubits: Lista de qubits a serem medidos
             num_qubits: Número total de qubits
+            return_samples: Se True, retorna também o resultado de cada shot
+            shots: Número de shots (padrão: ``self.shots``)
             
         Returns:
-            Dicionário com contagens dos resultados de medição
+            Dicionário com contagens dos resultados de medição e, se
+            ``return_samples`` for True, o vetor de resultados inteiros cuja
+            representação binária é a string de bits medida
         """
-        probabilities = np.abs(state)**2
-        counts = {}
+        shots = self.shots if shots is None else shots
+        if isinstance(state, SparseState):
+            return self._measure_sparse(state, measurement_qubits, return_samples, shots)
         
-        for _ in range(self.shots):
-            # Escolhe um estado baseado nas probabilidades
-            measured_state = np.random.choice(len(state), p=probabilities)
+        block_size = kernels.BLOCK_SIZE if isinstance(state, np.memmap) else None
+        probabilities = sampling.marginal_probabilities(state, measurement_qubits, num_qubits, block_size)
+        num_measured = len(measurement_qubits)
+        
+        if not return_samples:
+            counts = sampling.sample_counts(probabilities, shots, self.rng)
+            return sampling.counts_to_dict(counts, num_measured)
+        
+        samples = sampling.sample_outcomes(probabilities, shots, self.rng)
+        outcomes, counts = np.unique(samples, return_counts=True)
+        return sampling.counts_to_dict(counts, num_measured, outcomes), samples
+    
+    def _measure_sparse(self, state: SparseState, measurement_qubits: List[int],
+                        return_samples: bool = False,
+                        shots: Optional[int] = None) -> Union[Dict[str, int], Tuple[Dict[str, int], np.ndarray]]:
+        """
+        Realiza medições sobre o suporte de um estado esparso.
+        
+        Os shots são sorteados entre os índices do suporte e agregados pelo
+        resultado de medição de cada índice, sem criar a distribuição marginal
+        de 2**m resultados.
+        
+        Args:
+            state: Estado esparso final
+            measurement_qubits: Lista de qubits a serem medidos
+            return_samples: Se True, retorna também o resultado de cada shot
+            shots: Número de shots (padrão: ``self.shots``)
             
-            # Extrai os bits dos qubits medidos
-            result_bits = []
-            for qubit in measurement_qubits:
-                bit = (measured_state >> qubit) & 1
-                result_bits.append(str(bit))
+        Returns:
+            Mesmo formato de ``_measure``
+        """
+        shots = self.shots if shots is None else shots
+        codes = state.outcome_codes(measurement_qubits)
+        probabilities = state.probabilities()
+        num_measured = len(measurement_qubits)
+        
+        if not return_samples:
+            counts = sampling.sample_counts(probabilities, shots, self.rng)
+            outcomes, group = np.unique(codes, return_inverse=True)
+            totals = np.bincount(group, weights=counts, minlength=outcomes.size).astype(np.int64)
+            observed = totals > 0
+            return sampling.counts_to_dict(totals[observed], num_measured, outcomes[observed])
+        
+        samples = codes[sampling.sample_outcomes(probabilities, shots, self.rng)]
+        outcomes, counts = np.unique(samples, return_counts=True)
+        return sampling.counts_to_dict(counts, num_measured, outcomes), samples
+    
+    def _exact_probabilities(self, state: Union[np.ndarray, SparseState], measurement_qubits: List[int],
+                             num_qubits: int, top_k: Optional[int] = None) -> Dict[str, float]:
+        """
+        Calcula a distribuição exata dos resultados de medição, sem amostragem.
+        
+        Args:
+            state: Vetor de estado final ou estado esparso
+            measurement_qubits: Lista de qubits medidos
+            num_qubits: Número total de qubits
+            top_k: Se informado, mantém apenas os k resultados mais prováveis
             
-            result_string = ''.join(result_bits)
-            counts[result_string] = counts.get(result_string, 0) + 1
+        Returns:
+            Dicionário {string de bits: probabilidade}
+        """
+        num_measured = len(measurement_qubits)
+        if isinstance(state, SparseState):
+            outcomes, group = np.unique(state.outcome_codes(measurement_qubits), return_inverse=True)
+            totals = np.bincount(group, weights=state.probabilities(), minlength=outcomes.size)
+            return sampling.probabilities_to_dict(totals, num_measured, top_k, outcomes)
         
-        return counts
+        block_size = kernels.BLOCK_SIZE if isinstance(state, np.memmap) else None
+        probabilities = sampling.marginal_probabilities(state, measurement_qubits, num_qubits, block_size)
+        return sampling.probabilities_to_dict(probabilities, num_measured, top_k)
     
-    def get_state_probabilities(self, state: np.ndarray) -> Dict[str, float]:
+    def get_state_probabilities(self, state: Union[np.ndarray, SparseState],
+                                top_k: Optional[int] = None) -> Dict[str, float]:
         """
         Calcula as probabilidades de cada estado computacional.
         
+        O estado é percorrido em blocos de ``kernels.BLOCK_SIZE`` amplitudes e
+        apenas os estados com probabilidade significativa são convertidos em
+        strings de bits.
+        
         Args:
-            state: Vetor de estado
+            state: Vetor de estado ou estado esparso
+            top_k: Se informado, mantém apenas os k estados mais prováveis
             
         Returns:
             Dicionário com probabilidades de cada estado
         """
-        probabilities = {}
-        num_qubits = int(np.log2(len(state)))
+        if isinstance(state, SparseState):
+            return sampling.probabilities_to_dict(state.probabilities(), state.num_qubits,
+                                                  top_k, state.indices)
         
-        for i, amplitude in enumerate(state):
-            prob = abs(amplitude)**2
-            if prob > 1e-10:  # Apenas estados com probabilidade significativa
-                binary_state = format(i, f'0{num_qubits}b')
-                probabilities[binary_state] = prob
+        num_qubits = len(state).bit_length() - 1
+        indices, probabilities = [], []
+        for start in range(0, len(state), kernels.BLOCK_SIZE):
+            block = state[start:start + kernels.BLOCK_SIZE]
+            block_probabilities = block.real.astype(np.float64)**2 + block.imag.astype(np.float64)**2
+            significant = np.flatnonzero(block_probabilities > sampling.PROBABILITY_TOLERANCE)
+            if top_k is not None and top_k < significant.size:
+                significant = significant[np.argpartition(block_probabilities[significant], -top_k)[-top_k:]]
+            indices.append(significant + start)
+            probabilities.append(block_probabilities[significant])
         
-        return probabilities
+        return sampling.probabilities_to_dict(np.concatenate(probabilities), num_qubits,
+                                              top_k, np.concatenate(indices))
     
     def visualize_results(self, results: Dict[str, Any]) -> str:
         """
@@ -229,19 +1705,46 @@ class GurudevQCSimulator:
         # Informações do circuito
         circuit = results['circuit_info']
         output += f"Qubits: {circuit['qubits']}\n"
-        output += f"Portas aplicadas: {len(circuit['gates'])}\n"
+        gate_count = circuit['gate_count'] if 'gate_count' in circuit else len(circuit['gates'])
+        output += f"Portas aplicadas: {gate_count}\n"
         output += f"Shots: {results['shots']}\n\n"
         
+        # Probabilidades exatas (execuções com shots=0)
+        if 'measurement_probabilities' in results:
+            output += "Probabilidades Exatas de Medição:\n"
+            for state, prob in results['measurement_probabilities'].items():
+                output += f"  |{state}⟩: {prob * 100:.1f}%\n"
+        
         # Contagens de medição
-        output += "Contagens de Medição:\n"
-        counts = results['measurement_counts']
-        total_shots = sum(counts.values())
+        if results['shots']:
+            output += "Contagens de Medição:\n"
+            counts = results['measurement_counts']
+            total_shots = sum(counts.values())
+            
+            for state, count in sorted(counts.items()):
+                percentage = (count / total_shots) * 100
+                output += f"  |{state}⟩: {count} ({percentage:.1f}%)\n"
         
-        for state, count in sorted(counts.items()):
-            percentage = (count / total_shots) * 100
-            output += f"  |{state}⟩: {count} ({percentage:.1f}%)\n"
+        # Bits clássicos das medições no meio do circuito
+        classical = results.get('classical_counts', results.get('classical_probabilities'))
+        if classical:
+            output += f"\nBits Clássicos ({', '.join(circuit['classical_bits'])}):\n"
+            for state, value in classical.items():
+                output += f"  {state}: {value:g}\n"
         
         # Probabilidades do estado final
+        if results['final_state'] is None:
+            if results.get('branches', 1) > 1:
+                output += f"\nEstado final não disponível ({results['branches']} ramos de medição)\n"
+            else:
+                backends = {
+                    'stabilizer': 'backend de estabilizadores',
+                    'trajectories': 'trajetórias com ruído',
+                    'density_matrix': 'matriz densidade',
+                }
+                output += f"\nEstado final não disponível ({backends[results['backend']]})\n"
+            return output
+        
         output += "\nProbabilidades do Estado Final:\n"
         probs = self.get_state_probabilities(results['final_state'])
         
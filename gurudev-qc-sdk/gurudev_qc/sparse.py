@@ -0,0 +1,169 @@
+"""
+Estado Esparso Gurudev-QC
+
+Este módulo contém o ``SparseState``, que guarda apenas as amplitudes não
+nulas de um estado de n qubits em dois arrays alinhados: índices da base
+computacional e amplitudes. X, Y, Z, CNOT e rotações RZ são permutações de
+índices e atualizações de fase sobre o suporte; portas que criam
+superposição (H e as portas fundidas U/U2) agrupam os índices que diferem
+apenas nos qubits da porta e atuam somente sobre esses grupos.
+
+Os índices são inteiros de 64 bits, o que limita o estado a 62 qubits.
+"""
+
+import numpy as np
+from typing import List
+
+
+# Amplitudes com módulo abaixo deste valor são removidas do suporte
+ZERO_TOLERANCE = 1e-12
+
+# Maior número de qubits representável com índices int64
+MAX_QUBITS = 62
+
+
+class SparseState:
+    """
+    Vetor de estado que armazena apenas as amplitudes não nulas.
+    """
+
+    def __init__(self, num_qubits: int, dtype: type = np.complex128):
+        """
+        Inicializa o estado |00...0⟩.
+
+        Args:
+            num_qubits: Número de qubits
+            dtype: dtype das amplitudes
+        """
+        if num_qubits > MAX_QUBITS:
+            raise ValueError(f"O estado esparso suporta no máximo {MAX_QUBITS} qubits")
+
+        self.num_qubits = num_qubits
+        self.indices = np.zeros(1, dtype=np.int64)
+        self.amplitudes = np.ones(1, dtype=dtype)
+
+    @property
+    def size(self) -> int:
+        """Número de amplitudes armazenadas (tamanho do suporte)."""
+        return self.indices.size
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.amplitudes.dtype
+
+    def _bits(self, qubit: int) -> np.ndarray:
+        """Bit do qubit em cada índice do suporte."""
+        return (self.indices >> qubit) & 1
+
+    def apply_pauli_x(self, target: int) -> None:
+        """Aplica a porta Pauli-X como permutação de índices."""
+        self.indices ^= 1 << target
+
+    def apply_pauli_y(self, target: int) -> None:
+        """Aplica a porta Pauli-Y (permutação com fases ±i)."""
+        self.amplitudes *= np.where(self._bits(target), -1j, 1j).astype(self.dtype)
+        self.indices ^= 1 << target
+
+    def apply_pauli_z(self, target: int) -> None:
+        """Aplica a porta Pauli-Z invertendo o sinal das amplitudes com o alvo em |1⟩."""
+        self.amplitudes[self._bits(target) == 1] *= -1
+
+    def apply_diagonal_gate(self, target: int, phase0: complex, phase1: complex) -> None:
+        """Aplica a porta diagonal diag(phase0, phase1)."""
+        phases = np.array([phase0, phase1], dtype=self.dtype)
+        self.amplitudes *= phases[self._bits(target)]
+
+    def apply_cnot(self, control: int, target: int) -> None:
+        """Aplica a porta CNOT como permutação de índices."""
+        self.indices ^= self._bits(control) << target
+
+    def apply_matrix(self, qubits: List[int], gate_matrix: np.ndarray) -> None:
+        """
+        Aplica uma porta genérica de um ou dois qubits sobre o suporte.
+
+        Os índices que diferem apenas nos qubits da porta formam um grupo; a
+        matriz é aplicada a cada grupo e as amplitudes nulas resultantes são
+        descartadas.
+
+        Args:
+            qubits: Qubits da porta; em portas de dois qubits, o índice local segue a
+                convenção ``2 * bit(qubits[0]) + bit(qubits[1])``
+            gate_matrix: Matriz 2x2 ou 4x4 da porta
+        """
+        width = len(qubits)
+        mask = 0
+        for qubit in qubits:
+            mask |= 1 << qubit
+
+        local = np.zeros(self.size, dtype=np.int64)
+        for qubit in qubits:
+            local = (local << 1) | self._bits(qubit)
+
+        bases, group = np.unique(self.indices & ~mask, return_inverse=True)
+        table = np.zeros((bases.size, 1 << width), dtype=self.dtype)
+        table[group, local] = self.amplitudes
+        table = table @ np.asarray(gate_matrix, dtype=self.dtype).T
+
+        offsets = np.zeros(1 << width, dtype=np.int64)
+        for position, qubit in enumerate(qubits):
+            offsets |= ((np.arange(1 << width) >> (width - 1 - position)) & 1) << qubit
+
+        indices = (bases[:, None] | offsets[None, :]).reshape(-1)
+        amplitudes = table.reshape(-1)
+        keep = np.abs(amplitudes) > ZERO_TOLERANCE
+        self.indices = indices[keep]
+        self.amplitudes = amplitudes[keep]
+
+    def project(self, target: int, outcome: int, scale: float = 1.0) -> None:
+        """
+        Projeta o qubit alvo em um resultado de medição.
+
+        Args:
+            target: Qubit medido
+            outcome: Resultado da medição (0 ou 1)
+            scale: Fator aplicado às amplitudes mantidas
+        """
+        keep = self._bits(target) == outcome
+        self.indices = self.indices[keep]
+        self.amplitudes = self.amplitudes[keep] * np.asarray(scale, dtype=self.amplitudes.real.dtype)
+
+    def copy(self) -> 'SparseState':
+        """Retorna uma cópia independente do estado."""
+        state = SparseState(self.num_qubits, self.dtype)
+        state.indices = self.indices.copy()
+        state.amplitudes = self.amplitudes.copy()
+        return state
+
+    def probabilities(self) -> np.ndarray:
+        """Probabilidade de cada índice do suporte."""
+        return self.amplitudes.real**2 + self.amplitudes.imag**2
+
+    def outcome_codes(self, measurement_qubits: List[int]) -> np.ndarray:
+        """
+        Resultado de medição codificado como inteiro para cada índice do suporte.
+
+        Args:
+            measurement_qubits: Qubits medidos (na ordem das medições)
+
+        Returns:
+            Vetor de resultados (primeira medição no bit mais significativo)
+        """
+        num_measured = len(measurement_qubits)
+        codes = np.zeros(self.size, dtype=np.int64)
+        for position, qubit in enumerate(measurement_qubits):
+            codes |= self._bits(qubit) << (num_measured - 1 - position)
+        return codes
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Converte para um vetor de estado denso.
+
+        Returns:
+            Vetor de 2**n amplitudes
+        """
+        state_vector = np.zeros(2**self.num_qubits, dtype=self.dtype)
+        state_vector[self.indices] = self.amplitudes
+        return state_vector
+
+    def __repr__(self) -> str:
+        return f"SparseState(qubits={self.num_qubits}, support={self.size})"
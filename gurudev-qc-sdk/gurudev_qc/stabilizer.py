@@ -0,0 +1,338 @@
+"""
+Simulador de Estabilizadores Gurudev-QC
+
+Este módulo contém um backend de tableau (Aaronson-Gottesman / CHP) para
+circuitos de Clifford: H, X, Y, Z, CNOT e rotações RZ por múltiplos de π/2
+(potências da porta S, a menos de uma fase global). O estado de n qubits é
+representado pelos seus n geradores estabilizadores, com memória O(n²) e
+custo O(n) por porta, em vez de um vetor de 2**n amplitudes.
+
+A medição na base computacional de um estado estabilizador é uniforme sobre
+um subespaço afim de GF(2)^n. O subespaço é obtido por eliminação gaussiana
+dos geradores (com a multiplicação de linhas vetorizada) e todos os shots são
+sorteados de uma vez como combinações aleatórias da sua base.
+"""
+
+import math
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple, Union
+from .ir import CompactCircuit, OP_H, OP_X, OP_Y, OP_Z, OP_RZ, OP_CNOT
+
+
+# Portas de Clifford sem parâmetros
+CLIFFORD_GATES = {'H', 'X', 'Y', 'Z', 'CNOT'}
+
+
+def quarter_turns(angle: float) -> Optional[int]:
+    """
+    Converte o ângulo de uma rotação RZ em potências da porta S.
+
+    Args:
+        angle: Ângulo da rotação
+
+    Returns:
+        k em {0, 1, 2, 3} tal que RZ(angle) = S**k a menos de fase global, ou
+        None se o ângulo não é múltiplo de π/2
+    """
+    turns = round(angle / (math.pi / 2))
+    if not math.isclose(angle, turns * math.pi / 2, abs_tol=1e-9):
+        return None
+    return turns % 4
+
+
+def is_clifford(circuit: Union[Dict[str, Any], CompactCircuit],
+                params: Optional[Dict[str, float]] = None) -> bool:
+    """
+    Verifica se um circuito pode ser simulado pelo tableau de estabilizadores.
+
+    Args:
+        circuit: Circuito compilado
+        params: Valores dos parâmetros simbólicos do circuito
+
+    Returns:
+        True se todas as portas são de Clifford
+    """
+    if isinstance(circuit, CompactCircuit):
+        records = circuit.records
+        ops = records['op']
+        if not np.isin(ops, (OP_H, OP_X, OP_Y, OP_Z, OP_RZ, OP_CNOT)).all():
+            return False
+        rotations = records[ops == OP_RZ]
+        angles = rotations['angle'].copy()
+        symbolic = rotations['slot'] >= 0
+        if symbolic.any():
+            if params is None or any(name not in params for name in circuit.parameters):
+                return False
+            bound = np.array([params[name] for name in circuit.parameters], dtype=float)
+            angles[symbolic] = bound[rotations['slot'][symbolic]]
+        turns = np.round(angles / (np.pi / 2))
+        return bool(np.allclose(angles, turns * np.pi / 2, rtol=0, atol=1e-9))
+
+    for gate in circuit['gates']:
+        if gate['gate'] in CLIFFORD_GATES:
+            continue
+        if gate['gate'] != 'RZ':
+            return False
+        if 'param' in gate:
+            if params is None or gate['param'] not in params:
+                return False
+            angle = params[gate['param']]
+        else:
+            angle = gate['angle']
+        if quarter_turns(angle) is None:
+            return False
+    return True
+
+
+def _gf2_eliminate(matrix: np.ndarray, rhs: Optional[np.ndarray] = None) -> List[int]:
+    """
+    Reduz uma matriz sobre GF(2) à forma escalonada reduzida, no próprio lugar.
+
+    Args:
+        matrix: Matriz de bits (uint8), modificada no próprio lugar
+        rhs: Lado direito opcional, transformado junto com as linhas
+
+    Returns:
+        Colunas pivô; as primeiras ``len(pivôs)`` linhas formam uma base do
+        espaço gerado pelas linhas
+    """
+    pivots = []
+    for column in range(matrix.shape[1]):
+        rank = len(pivots)
+        if rank == matrix.shape[0]:
+            break
+        candidates = np.flatnonzero(matrix[rank:, column])
+        if candidates.size == 0:
+            continue
+
+        pivot = rank + candidates[0]
+        if pivot != rank:
+            matrix[[rank, pivot]] = matrix[[pivot, rank]]
+            if rhs is not None:
+                rhs[[rank, pivot]] = rhs[[pivot, rank]]
+
+        rows = np.flatnonzero(matrix[:, column])
+        rows = rows[rows != rank]
+        matrix[rows] ^= matrix[rank]
+        if rhs is not None:
+            rhs[rows] ^= rhs[rank]
+        pivots.append(column)
+
+    return pivots
+
+
+class StabilizerTableau:
+    """
+    Tableau de estabilizadores de um estado de n qubits.
+
+    ``x[q, g]`` e ``z[q, g]`` são as componentes X e Z do gerador ``g`` no
+    qubit ``q`` (armazenadas por qubit, para que cada porta atualize linhas
+    contíguas) e ``r[g]`` é o bit de sinal do gerador.
+    """
+
+    def __init__(self, num_qubits: int):
+        """
+        Inicializa o tableau no estado |00...0⟩ (geradores Z_0, ..., Z_{n-1}).
+
+        Args:
+            num_qubits: Número de qubits
+        """
+        self.num_qubits = num_qubits
+        self.x = np.zeros((num_qubits, num_qubits), dtype=np.uint8)
+        self.z = np.eye(num_qubits, dtype=np.uint8)
+        self.r = np.zeros(num_qubits, dtype=np.uint8)
+
+    def apply_gate(self, gate: Dict[str, Any], params: Optional[Dict[str, float]] = None) -> None:
+        """
+        Aplica uma porta de Clifford compilada.
+
+        Args:
+            gate: Informações da porta
+            params: Valores dos parâmetros simbólicos do circuito
+        """
+        gate_type = gate['gate']
+        target = gate['target']
+
+        if gate_type == 'H':
+            self.hadamard(target)
+        elif gate_type == 'X':
+            self.pauli_x(target)
+        elif gate_type == 'Y':
+            self.pauli_y(target)
+        elif gate_type == 'Z':
+            self.pauli_z(target)
+        elif gate_type == 'CNOT':
+            self.cnot(gate['control'], target)
+        elif gate_type == 'RZ':
+            if 'param' in gate:
+                if params is None or gate['param'] not in params:
+                    raise ValueError(f"Parâmetro '{gate['param']}' sem valor; informe params ou use bind")
+                angle = params[gate['param']]
+            else:
+                angle = gate['angle']
+            turns = quarter_turns(angle)
+            if turns is None:
+                raise ValueError(f"Rotação RZ({angle}) não é de Clifford")
+            for _ in range(turns):
+                self.phase(target)
+        else:
+            raise ValueError(f"Porta '{gate_type}' não é suportada pelo backend de estabilizadores")
+
+    def hadamard(self, qubit: int) -> None:
+        """Aplica a porta Hadamard."""
+        self.r ^= self.x[qubit] & self.z[qubit]
+        self.x[qubit], self.z[qubit] = self.z[qubit].copy(), self.x[qubit].copy()
+
+    def phase(self, qubit: int) -> None:
+        """Aplica a porta S = diag(1, i)."""
+        self.r ^= self.x[qubit] & self.z[qubit]
+        self.z[qubit] ^= self.x[qubit]
+
+    def pauli_x(self, qubit: int) -> None:
+        """Aplica a porta Pauli-X."""
+        self.r ^= self.z[qubit]
+
+    def pauli_y(self, qubit: int) -> None:
+        """Aplica a porta Pauli-Y."""
+        self.r ^= self.x[qubit] ^ self.z[qubit]
+
+    def pauli_z(self, qubit: int) -> None:
+        """Aplica a porta Pauli-Z."""
+        self.r ^= self.x[qubit]
+
+    def cnot(self, control: int, target: int) -> None:
+        """Aplica a porta CNOT."""
+        self.r ^= self.x[control] & self.z[target] & (self.x[target] ^ self.z[control] ^ 1)
+        self.x[target] ^= self.x[control]
+        self.z[control] ^= self.z[target]
+
+    def support(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula o subespaço afim dos resultados de medição na base computacional.
+
+        Os geradores são escalonados pelas componentes X: os k primeiros
+        passam a ter componentes X independentes, que geram a parte linear do
+        subespaço, e os demais só têm componentes Z, cujas restrições
+        ``z · v = r`` fixam um ponto do subespaço.
+
+        Returns:
+            Tupla (ponto do subespaço (n,), base da parte linear (k, n))
+        """
+        x = self.x.T.copy()
+        z = self.z.T.copy()
+        r = self.r.copy()
+
+        rank = 0
+        for column in range(self.num_qubits):
+            if rank == self.num_qubits:
+                break
+            candidates = np.flatnonzero(x[rank:, column])
+            if candidates.size == 0:
+                continue
+
+            pivot = rank + candidates[0]
+            if pivot != rank:
+                for array in (x, z, r):
+                    array[[rank, pivot]] = array[[pivot, rank]]
+
+            rows = np.flatnonzero(x[:, column])
+            rows = rows[rows != rank]
+            if rows.size:
+                self._rowsum(x, z, r, rows, rank)
+            rank += 1
+
+        constraints = z[rank:].copy()
+        signs = r[rank:].copy()
+        pivots = _gf2_eliminate(constraints, signs)
+        offset = np.zeros(self.num_qubits, dtype=np.uint8)
+        offset[pivots] = signs[:len(pivots)]
+
+        return offset, x[:rank]
+
+    @staticmethod
+    def _rowsum(x: np.ndarray, z: np.ndarray, r: np.ndarray, rows: np.ndarray, pivot: int) -> None:
+        """
+        Multiplica o gerador ``pivot`` em cada um dos geradores ``rows``.
+
+        O sinal do produto segue a função g de Aaronson-Gottesman, calculada
+        de uma vez para todas as linhas e apenas nas colunas em que o pivô
+        não é a identidade.
+        """
+        columns = np.flatnonzero(x[pivot] | z[pivot])
+        x1 = x[pivot, columns].astype(np.int8)
+        z1 = z[pivot, columns].astype(np.int8)
+        block = np.ix_(rows, columns)
+        x2 = x[block].astype(np.int8)
+        z2 = z[block].astype(np.int8)
+
+        g = (x1 * z1 * (z2 - x2)
+             + x1 * (1 - z1) * z2 * (2 * x2 - 1)
+             + (1 - x1) * z1 * x2 * (1 - 2 * z2))
+        phase = (2 * r[rows].astype(np.int64) + 2 * int(r[pivot]) + g.sum(axis=1)) % 4
+        r[rows] = phase >> 1
+
+        x[block] = x2.astype(np.uint8) ^ x[pivot, columns]
+        z[block] = z2.astype(np.uint8) ^ z[pivot, columns]
+
+    def _projected_support(self, qubits: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Ponto e base (linhas independentes) do subespaço restrito aos qubits."""
+        offset, basis = self.support()
+        projected = basis[:, qubits].copy()
+        rank = len(_gf2_eliminate(projected))
+        return offset[qubits], projected[:rank]
+
+    def distribution(self, qubits: List[int], max_outcomes: Optional[int] = None) -> Tuple[np.ndarray, float]:
+        """
+        Enumera os resultados possíveis da medição dos qubits informados.
+
+        Todos os resultados do subespaço afim têm a mesma probabilidade.
+
+        Args:
+            qubits: Qubits medidos (na ordem das medições)
+            max_outcomes: Número máximo de resultados enumerados
+
+        Returns:
+            Tupla (matriz de bits, uma linha por resultado; probabilidade de
+            cada resultado)
+        """
+        offset, projected = self._projected_support(qubits)
+        rank = len(projected)
+        if max_outcomes is None and rank > 24:
+            raise ValueError(
+                f"A distribuição tem 2**{rank} resultados equiprováveis; use top_k para limitar"
+            )
+
+        count = 1 << rank if max_outcomes is None else min(1 << rank, max_outcomes)
+        coefficients = np.zeros((count, rank), dtype=np.uint8)
+        enumerated = min(rank, 62)
+        coefficients[:, :enumerated] = (np.arange(count)[:, None] >> np.arange(enumerated)) & 1
+
+        bits = np.broadcast_to(offset, (count, len(qubits))).copy()
+        if rank:
+            combined = coefficients.astype(np.float32) @ projected.astype(np.float32)
+            bits ^= (combined.astype(np.int64) & 1).astype(np.uint8)
+        return bits, 2.0 ** -rank
+
+    def sample(self, qubits: List[int], shots: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Sorteia resultados de medição dos qubits informados.
+
+        Args:
+            qubits: Qubits medidos (na ordem das medições)
+            shots: Número de shots
+            rng: Gerador de números aleatórios
+
+        Returns:
+            Matriz de bits (shots × medições), uma linha por shot
+        """
+        offset, projected = self._projected_support(qubits)
+        rank = len(projected)
+
+        bits = np.broadcast_to(offset, (shots, len(qubits))).copy()
+        if rank:
+            # Combinações aleatórias da base; os valores das somas cabem
+            # exatamente em float32 e o produto usa BLAS
+            coefficients = rng.integers(0, 2, size=(shots, rank), dtype=np.uint8)
+            combined = coefficients.astype(np.float32) @ projected.astype(np.float32)
+            bits ^= (combined.astype(np.int64) & 1).astype(np.uint8)
+        return bits
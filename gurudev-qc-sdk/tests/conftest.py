@@ -0,0 +1,12 @@
+"""
+Configuração dos testes do Gurudev-QC SDK
+
+Uso:
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+# Adiciona o diretório pai ao path para importar o módulo gurudev_qc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,22 @@
+"""
+Testes dos circuitos da biblioteca de algoritmos
+"""
+
+import pytest
+
+from gurudev_qc import GurudevQCSimulator
+from gurudev_qc.algorithms import GurudevQCAlgorithms
+
+
+def test_teleportation_keeps_alice_outcomes():
+    """As contagens incluem as medições de Alice e o qubit de Bob."""
+    simulator = GurudevQCSimulator()
+    circuit = simulator.compiler.compile(GurudevQCAlgorithms().quantum_teleportation())
+    results = simulator.run(circuit, exact=True)
+
+    assert circuit['measurements'] == [0, 1, 2]
+    assert circuit['classical_bits'] == ['m0', 'm1']
+    # O estado |+⟩ teletransportado dá 0 ou 1 com a mesma probabilidade para Bob
+    assert len(results['measurement_probabilities']) == 8
+    assert all(p == pytest.approx(0.125) for p in results['measurement_probabilities'].values())
+    assert all(p == pytest.approx(0.25) for p in results['classical_probabilities'].values())
@@ -0,0 +1,47 @@
+"""
+Testes do cache de circuitos compilados
+"""
+
+import pickle
+from collections import OrderedDict
+
+import pytest
+
+from gurudev_qc import GurudevQCCompiler
+from gurudev_qc.cache import CircuitCache
+
+
+BELL = "qubits: 2\nharmony 0\nentangle 0 1\nmeasure: 0\nmeasure: 1"
+
+
+def test_disk_tier_warms_a_new_cache(tmp_path):
+    """Um cache novo no mesmo diretório encontra o circuito no disco."""
+    expected = GurudevQCCompiler(cache=CircuitCache(persist_dir=str(tmp_path))).compile(BELL)
+    cache = CircuitCache(persist_dir=str(tmp_path))
+    assert GurudevQCCompiler(cache=cache).compile(BELL) == expected
+    assert cache.stats()['disk_hits'] == 1
+    assert len(cache) == 1
+
+
+# Entrada gravada com uma classe que não existe mais (AttributeError) ou de um
+# módulo removido (ModuleNotFoundError) na leitura
+_STALE = pickle.dumps(OrderedDict(), protocol=2)
+
+
+@pytest.mark.parametrize('content', [
+    b'',
+    b'not a pickle',
+    pickle.dumps({'qubits': 2})[:-1],
+    _STALE.replace(b'OrderedDict', b'OrderedDicz'),
+    _STALE.replace(b'collections', b'collectionz'),
+], ids=['vazio', 'invalido', 'truncado', 'classe_removida', 'modulo_removido'])
+def test_unreadable_disk_entries_are_misses(tmp_path, content):
+    """Entradas corrompidas ou obsoletas em disco são recompiladas."""
+    compiler = GurudevQCCompiler(cache=CircuitCache(persist_dir=str(tmp_path)))
+    key = CircuitCache.make_key(BELL, optimize=0, compact=False)
+    (tmp_path / f"{key}.pkl").write_bytes(content)
+
+    cache = CircuitCache(persist_dir=str(tmp_path))
+    assert cache.get(key) is None
+    assert cache.stats()['misses'] == 1
+    assert compiler.compile(BELL)['qubits'] == 2
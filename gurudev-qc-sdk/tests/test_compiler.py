@@ -0,0 +1,56 @@
+"""
+Testes de validação do compilador Gurudev-QC
+"""
+
+import pytest
+
+from gurudev_qc import GurudevQCCompiler, GurudevQCSimulator, GurudevQCSyntaxError
+
+
+@pytest.mark.parametrize('code, lineno', [
+    ("qubits: 2\nharmony 5\nmeasure: 0", 2),
+    ("qubits: 2\nharmony 0\nmeasure: 3", 3),
+    ("harmony 0\nentangle 0 4\nqubits: 3", 2),
+    ("qubits: 2\nharmony -1", 2),
+])
+def test_out_of_range_qubits_are_syntax_errors(code, lineno):
+    """Qubits fora do intervalo declarado apontam a linha que os usa."""
+    with pytest.raises(GurudevQCSyntaxError, match=f"linha {lineno}: qubit"):
+        GurudevQCCompiler().compile(code)
+
+
+def test_qubits_may_be_declared_after_gates():
+    """O número de qubits pode ser declarado depois das portas."""
+    circuit = GurudevQCCompiler().compile("harmony 1\nqubits: 2\nmeasure: 1")
+    assert circuit['qubits'] == 2
+
+
+@pytest.mark.parametrize('code', [
+    "qubits: 2\nentangle 0 0\nmeasure: 0",
+    "qubits: 2\nharmony 0\nmeasure 0 -> m\nif m entangle 1 1\nmeasure: 1",
+])
+def test_entangle_requires_distinct_qubits(code):
+    """Uma CNOT com controle igual ao alvo é um erro de sintaxe com a linha."""
+    with pytest.raises(GurudevQCSyntaxError, match="devem ser qubits diferentes"):
+        GurudevQCCompiler().compile(code)
+
+
+def test_stream_checks_like_compile():
+    """O compilador por streaming aplica as mesmas verificações."""
+    with pytest.raises(GurudevQCSyntaxError, match="linha 2"):
+        GurudevQCSimulator().run_stream("qubits: 2\nentangle 1 1\nmeasure: 0".splitlines())
+
+
+def test_export_qasm_matches_write_qasm(tmp_path):
+    """export_qasm retorna o mesmo texto que write_qasm grava."""
+    compiler = GurudevQCCompiler()
+    code = "qubits: 3\n" + "\n".join(f"harmony {q % 3}\nrotate {q % 3} 0.{q}\nentangle {q % 3} {(q + 1) % 3}"
+                                     for q in range(1, 400)) + "\nmeasure: 0\nmeasure: 2"
+    circuit = compiler.compile(code)
+    path = tmp_path / 'circuito.qasm'
+    compiler.write_qasm(circuit, path)
+
+    text = compiler.export_qasm(circuit)
+    assert text == path.read_text()
+    assert text.startswith('OPENQASM 2.0;')
+    assert compiler.import_qasm(text)['gates'] == circuit['gates']
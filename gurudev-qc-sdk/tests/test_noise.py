@@ -0,0 +1,37 @@
+"""
+Testes dos modelos de ruído
+"""
+
+import numpy as np
+import pytest
+
+from gurudev_qc import GurudevQCSimulator, NoiseModel, SimulationResult
+
+
+BELL = "qubits: 2\nharmony 0\nentangle 0 1\nmeasure: 0\nmeasure: 1"
+
+
+def test_density_matrix_survives_save_load(tmp_path):
+    """A matriz densidade final é gravada e recarregada."""
+    model = NoiseModel().add_depolarizing('harmony', 0.05)
+    simulator = GurudevQCSimulator(seed=3, noise_model=model, noise_method='density_matrix')
+    results = simulator.run_gurudev_code(BELL)
+    path = tmp_path / 'densidade.npz'
+    results.save(path)
+    loaded = SimulationResult.load(path)
+
+    assert np.array_equal(loaded['density_matrix'], results['density_matrix'])
+    assert loaded['backend'] == 'density_matrix'
+
+
+def test_fused_gates_without_errors_are_rejected():
+    """Portas U/U2 da otimização não recebem silenciosamente os erros originais."""
+    code = "qubits: 2\nharmony 0\nrotate 0 0.3\nharmony 0\nentangle 0 1\nmeasure: 0\nmeasure: 1"
+    simulator = GurudevQCSimulator(noise_model=NoiseModel().add_depolarizing('harmony', 0.05))
+    with pytest.raises(ValueError, match="portas fundidas"):
+        simulator.run(simulator.compiler.compile(code, optimize=2))
+
+    fused = NoiseModel().add_depolarizing('U', 0.05).add_depolarizing('U2', 0.05)
+    simulator = GurudevQCSimulator(seed=1, noise_model=fused)
+    results = simulator.run(simulator.compiler.compile(code, optimize=3))
+    assert sum(results['measurement_counts'].values()) == simulator.shots
@@ -0,0 +1,59 @@
+"""
+Testes dos kernels compilados com Numba
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from gurudev_qc import GurudevQCSimulator, kernels
+from gurudev_qc import numba_kernels
+from gurudev_qc.numba_kernels import NUMBA_AVAILABLE, NumbaKernels
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_does_not_load_numba():
+    """Importar o pacote não importa o Numba."""
+    output = subprocess.run(
+        [sys.executable, '-c', "import sys, gurudev_qc; print('numba' in sys.modules)"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    assert output.stdout.strip() == 'False'
+
+
+def test_numpy_kernels_are_the_default():
+    """O simulador usa os kernels NumPy a menos que outro kernel seja pedido."""
+    assert GurudevQCSimulator()._kernels is kernels
+
+
+def apply_gates(module, state, unitary):
+    """Aplica uma sequência fixa de portas com os kernels de ``module``."""
+    module.apply_single_qubit_gate(state, 3, np.array([[1, 1], [1, -1]]) / np.sqrt(2))
+    module.apply_cnot(state, 0, 7)
+    module.apply_two_qubit_gate(state, 2, 5, unitary)
+    module.apply_diagonal_gate(state, 1, 1.0, 1j)
+    module.apply_pauli_y(state, 6)
+    return state
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="Numba não instalado")
+def test_numba_kernels_match_numpy():
+    """Os kernels compilados dão o mesmo resultado que os NumPy."""
+    rng = np.random.default_rng(0)
+    state = rng.normal(size=1 << 8) + 1j * rng.normal(size=1 << 8)
+    unitary = np.linalg.qr(rng.normal(size=(4, 4)) + 1j * rng.normal(size=(4, 4)))[0]
+    expected = apply_gates(kernels, state.copy(), unitary)
+    actual = apply_gates(NumbaKernels(min_size=1), state.copy(), unitary)
+    assert np.allclose(actual, expected)
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="Numba não instalado")
+def test_each_instance_has_its_own_lock():
+    """Simuladores diferentes não serializam as portas uns dos outros."""
+    first, second = NumbaKernels(), NumbaKernels()
+    assert first._lock is not second._lock
+    assert first._lock is not numba_kernels._SHARED_LOCK
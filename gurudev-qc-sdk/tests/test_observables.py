@@ -0,0 +1,45 @@
+"""
+Testes do parser e dos valores esperados de Observable
+"""
+
+import numpy as np
+import pytest
+
+from gurudev_qc.observables import Observable
+
+
+def zero_state(num_qubits):
+    """Retorna o vetor de estado |0...0⟩."""
+    state = np.zeros(1 << num_qubits, dtype=complex)
+    state[0] = 1.0
+    return state
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("Z0 Z1 + 0.5*X2 - Y0", [(1.0, ((0, 'Z'), (1, 'Z'))), (0.5, ((2, 'X'),)), (-1.0, ((0, 'Y'),))]),
+    ("- Z0", [(-1.0, ((0, 'Z'),))]),
+    ("-Z0", [(-1.0, ((0, 'Z'),))]),
+    ("+Z0", [(1.0, ((0, 'Z'),))]),
+    ("- 2*Z0 - Z1", [(-2.0, ((0, 'Z'),)), (-1.0, ((1, 'Z'),))]),
+    ("Z0 + 0.2", [(1.0, ((0, 'Z'),)), (0.2, ())]),
+    ("-0.5 + Z1", [(-0.5, ()), (1.0, ((1, 'Z'),))]),
+    ("0.3*I", [(0.3, ())]),
+])
+def test_parse_terms(text, expected):
+    """Sinais, coeficientes e termos constantes são lidos como escritos."""
+    assert Observable(text).terms == expected
+
+
+@pytest.mark.parametrize('text', ["", "   ", "-", "Z0 +", "Z0 + X", "Z0 Z0", "a*Z0"])
+def test_parse_rejects_invalid_text(text):
+    """Textos vazios ou malformados levantam ValueError."""
+    with pytest.raises(ValueError):
+        Observable(text)
+
+
+def test_expectation_with_signs_and_constants():
+    """O sinal inicial não introduz um termo de identidade extra."""
+    state = zero_state(2)
+    assert Observable("- Z0").expectation(state) == pytest.approx(-1.0)
+    assert Observable("-Z0 + 0.2").expectation(state) == pytest.approx(-0.8)
+    assert Observable("Z0 Z1 - 0.5").expectation(state) == pytest.approx(0.5)
@@ -0,0 +1,40 @@
+"""
+Testes do executor paralelo
+"""
+
+import os
+
+import pytest
+
+from gurudev_qc import GurudevQCCompiler
+from gurudev_qc.parallel import ParallelSimulator
+
+
+BELL = "qubits: 2\nharmony 0\nentangle 0 1\nmeasure: 0\nmeasure: 1"
+
+
+def shared_blocks():
+    """Blocos de memória compartilhada existentes (Linux)."""
+    return set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+
+
+def test_run_many_releases_shared_states_after_a_failure():
+    """Uma falha não deixa blocos compartilhados dos demais circuitos."""
+    good = GurudevQCCompiler().compile(BELL)
+    bad = dict(good, gates=[{'gate': 'H', 'target': 40}])
+    before = shared_blocks()
+    with ParallelSimulator(workers=2, shared_state_bytes=1) as parallel:
+        with pytest.raises(ValueError):
+            parallel.run_many([good, bad, good, good])
+        results = parallel.run_many([good, good])
+    assert shared_blocks() - before == set()
+    assert [sum(item['measurement_counts'].values()) for item in results] == [1024, 1024]
+
+
+def test_run_reports_norm_drift_and_backend():
+    """run retorna os mesmos campos de GurudevQCSimulator.run."""
+    with ParallelSimulator(workers=1, seed=3) as parallel:
+        results = parallel.run(GurudevQCCompiler().compile(BELL), shots=500)
+    assert set(results['measurement_counts']) <= {'00', '11'}
+    assert results['backend'] == 'memory'
+    assert abs(results['norm_drift']) < 1e-12
@@ -0,0 +1,42 @@
+"""
+Testes da instrumentação do simulador
+"""
+
+import numpy as np
+
+from gurudev_qc import GurudevQCSimulator
+
+
+CODE = "\n".join(
+    ["qubits: 6"] + [f"harmony {q}" for q in range(6)]
+    + ["rotate 0 0.3", "phase 1", "rotate 2 0.5", "entangle 0 5", "harmony 5", "measure: 0"]
+)
+
+
+def profiled_state(simulator):
+    """Simula CODE com um profiler ativo e retorna (estado, nomes dos eventos de porta)."""
+    circuit = simulator.compiler.compile(CODE)
+    with simulator.profile() as profiler:
+        state = simulator._simulate(circuit)
+    return state, [gate['gate'] for gate in profiler.report()['gates']]
+
+
+def test_profile_records_merged_diagonal_runs():
+    """As portas diagonais consecutivas aparecem como a porta 'DIAG' executada."""
+    simulator = GurudevQCSimulator(stabilizer_min_qubits=None)
+    expected = [gate['gate'] for gate in simulator._merge_diagonal_runs(simulator.compiler.compile(CODE)['gates'])]
+    state, names = profiled_state(simulator)
+
+    assert names == expected
+    assert 'DIAG' in names
+    assert np.allclose(state, simulator._simulate(simulator.compiler.compile(CODE)))
+
+
+def test_profile_records_schedule_steps():
+    """Com ladrilhos, cada passo do escalonamento é um evento."""
+    simulator = GurudevQCSimulator(stabilizer_min_qubits=None, tile_qubits=3)
+    state, names = profiled_state(simulator)
+
+    assert 'TILE' in names
+    assert np.allclose(state, GurudevQCSimulator(stabilizer_min_qubits=None)._simulate(
+        simulator.compiler.compile(CODE)))
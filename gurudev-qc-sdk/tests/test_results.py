@@ -0,0 +1,46 @@
+"""
+Testes de gravação e leitura de SimulationResult
+"""
+
+from gurudev_qc import GurudevQCSimulator, SimulationResult
+from gurudev_qc.algorithms import GurudevQCAlgorithms
+
+
+def test_save_load_keeps_classical_results(tmp_path):
+    """Bits clássicos, contagens clássicas e ramos sobrevivem a save/load."""
+    simulator = GurudevQCSimulator(seed=7)
+    results = simulator.run_gurudev_code(GurudevQCAlgorithms().quantum_teleportation())
+    path = tmp_path / 'teleporte.npz'
+    results.save(path)
+    loaded = SimulationResult.load(path)
+
+    assert loaded['circuit_info']['classical_bits'] == ['m0', 'm1']
+    assert loaded['classical_counts'] == results['classical_counts']
+    assert loaded['branches'] == results['branches']
+    assert loaded['measurement_counts'] == results['measurement_counts']
+    assert 'Bits Clássicos (m0, m1)' in simulator.visualize_results(loaded)
+
+
+def test_save_load_keeps_exact_classical_probabilities(tmp_path):
+    """O modo exato preserva as probabilidades dos bits clássicos."""
+    simulator = GurudevQCSimulator()
+    circuit = simulator.compiler.compile(GurudevQCAlgorithms().quantum_teleportation())
+    results = simulator.run(circuit, exact=True)
+    path = tmp_path / 'teleporte_exato.npz'
+    results.save(path)
+    loaded = SimulationResult.load(path)
+
+    assert loaded['classical_probabilities'] == results['classical_probabilities']
+    assert loaded['measurement_probabilities'] == results['measurement_probabilities']
+
+
+def test_save_load_without_classical_bits(tmp_path):
+    """Circuitos sem medições no meio gravam uma lista vazia de bits."""
+    code = "qubits: 2\nharmony 0\nentangle 0 1\nmeasure: 0\nmeasure: 1"
+    results = GurudevQCSimulator(seed=1).run_gurudev_code(code)
+    path = tmp_path / 'bell.npz'
+    results.save(path)
+    loaded = SimulationResult.load(path)
+
+    assert loaded['circuit_info']['classical_bits'] == []
+    assert loaded['measurement_counts'] == results['measurement_counts']
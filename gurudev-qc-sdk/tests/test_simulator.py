@@ -0,0 +1,37 @@
+"""
+Testes de validação dos argumentos de execução do simulador
+"""
+
+import pytest
+
+from gurudev_qc import GurudevQCSimulator
+
+
+BELL = "qubits: 2\nharmony 0\nentangle 0 1\nmeasure: 0\nmeasure: 1"
+
+
+@pytest.mark.parametrize('top_k', [0, -1])
+def test_run_rejects_top_k_below_one(top_k):
+    """top_k menor que 1 levanta ValueError antes da simulação."""
+    simulator = GurudevQCSimulator()
+    with pytest.raises(ValueError, match="top_k inválido"):
+        simulator.run(simulator.compiler.compile(BELL), exact=True, top_k=top_k)
+    with pytest.raises(ValueError, match="top_k inválido"):
+        simulator.run_stream(BELL.splitlines(), exact=True, top_k=top_k)
+
+
+def test_run_keeps_the_most_likely_outcome():
+    """top_k=1 mantém apenas o resultado mais provável."""
+    simulator = GurudevQCSimulator()
+    code = "qubits: 2\nharmony 0\nrotate 0 0.4\nharmony 0\nmeasure: 0\nmeasure: 1"
+    results = simulator.run(simulator.compiler.compile(code), exact=True, top_k=1)
+    assert list(results['measurement_probabilities']) == ['00']
+
+
+def test_negative_shots_are_rejected():
+    """Números de shots negativos levantam ValueError."""
+    simulator = GurudevQCSimulator()
+    with pytest.raises(ValueError, match="Número de shots inválido"):
+        simulator.run(simulator.compiler.compile(BELL), shots=-5)
+    with pytest.raises(ValueError, match="Número de shots inválido"):
+        GurudevQCSimulator(shots=-1)